@@ -0,0 +1,43 @@
+"""
+Backtest engine benchmark.
+
+Backtests every strategy over a year of synthetic 1m candles and reports
+the time of the indicators, the signals and the bar loop, with a summary
+of each run.
+
+Usage:
+    python -m benchmarks.bench_backtest [candles]
+"""
+import sys
+import time
+from benchmarks.bench_indicators import STRATEGIES, make_candles
+from trading_bot.backtest.engine import BacktestEngine
+from trading_bot.strategies.strategy_library import get_strategy
+
+
+def main(candles: int = 365 * 24 * 60):
+    df = make_candles(candles)
+    print(f"{candles} candles")
+    for name in STRATEGIES:
+        strategy = get_strategy(name)
+        engine = BacktestEngine(strategy)
+
+        started = time.perf_counter()
+        required = list(dict.fromkeys(strategy.get_required_indicators() + ['ATR']))
+        indicators = engine.technical_analysis.calculate_all_indicators(df, required=required)
+        indicator_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = engine.run(df, indicators)
+        run_time = time.perf_counter() - started
+
+        summary = result.summary()
+        print(
+            f"{name:24s} indicators {indicator_time:5.2f} s  run {run_time:5.2f} s  "
+            f"trades {summary['trades']:6d}  return {summary['total_return']:+8.2%}  "
+            f"max drawdown {summary['max_drawdown']:6.2%}  fees {summary['fees']:9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
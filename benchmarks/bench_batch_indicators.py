@@ -0,0 +1,42 @@
+"""
+Universe-wide indicator benchmark.
+
+Compares computing the core indicators (SMA/EMA, RSI, MACD, Bollinger
+Bands, ATR, ADX/DI, OBV) one symbol at a time through
+calculate_all_indicators with computing them for every symbol at once
+through calculate_batch_indicators.
+
+Usage:
+    python -m benchmarks.bench_batch_indicators [symbols] [candles]
+"""
+import sys
+import time
+from benchmarks.bench_indicators import make_candles
+from trading_bot.core.batch_indicators import compute_batch_indicators, stack_frames
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+
+
+def main(symbols: int = 200, candles: int = 500):
+    frames = {f"SYM{i}USDT": make_candles(candles, seed=i) for i in range(symbols)}
+    analysis = TechnicalAnalysis()
+    batch = analysis.calculate_batch_indicators(frames)
+    required = batch.names()
+
+    started = time.perf_counter()
+    for df in frames.values():
+        analysis.calculate_all_indicators(df, required=required)
+    per_symbol = time.perf_counter() - started
+
+    started = time.perf_counter()
+    names, arrays = stack_frames(frames)
+    stacked = time.perf_counter() - started
+    compute_batch_indicators(names, arrays['high'], arrays['low'], arrays['close'], arrays['volume'])
+    batched = time.perf_counter() - started
+
+    print(f"{symbols} symbols x {candles} candles, {len(required)} indicators")
+    print(f"per symbol: {per_symbol * 1000:10.1f} ms")
+    print(f"batched:    {batched * 1000:10.1f} ms  ({per_symbol / batched:.1f}x, of which {stacked * 1000:.1f} ms stacking frames)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,49 @@
+"""
+Indicator storage benchmark.
+
+Keeps the full indicator set of a grid of symbol x timeframe windows
+resident, once as the default per-indicator float64 Series and once in
+compact storage (one float32/int8 array per category), and reports the
+memory allocated per window and the time to build it.
+
+Usage:
+    python -m benchmarks.bench_compact_indicators [windows] [candles]
+"""
+import sys
+import time
+import tracemalloc
+from benchmarks.bench_indicators import make_candles
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+
+
+def resident(frames, compact: bool):
+    """Build and keep every window's indicators; get (bytes per window, seconds)."""
+    analysis = TechnicalAnalysis()
+    tracemalloc.start()
+    started = time.perf_counter()
+    kept = []
+    for df in frames:
+        indicators = analysis.calculate_all_indicators(df, compact=compact)
+        # Materialise every series, as a consumer reading all of them would
+        for values in indicators.values():
+            for key in values:
+                values[key]
+        kept.append(indicators)
+    elapsed = time.perf_counter() - started
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / len(frames), elapsed
+
+
+def main(windows: int = 100, candles: int = 1000):
+    frames = [make_candles(candles, seed=i) for i in range(windows)]
+    default_bytes, default_time = resident(frames, compact=False)
+    compact_bytes, compact_time = resident(frames, compact=True)
+
+    print(f"{windows} windows x {candles} candles")
+    print(f"series:  {default_bytes / 1024:8.1f} KiB per window  {default_time * 1000:8.1f} ms")
+    print(f"compact: {compact_bytes / 1024:8.1f} KiB per window  {compact_time * 1000:8.1f} ms  ({default_bytes / compact_bytes:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,56 @@
+"""
+Indicator pipeline benchmark.
+
+Reports the time of TechnicalAnalysis.calculate_indicators and
+calculate_all_indicators on a synthetic candle window, both for the full
+indicator set and for the indicators each strategy requires, and of a
+repeated request served from the indicator cache.
+
+Usage:
+    python -m benchmarks.bench_indicators [candles]
+"""
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+from trading_bot.strategies.strategy_library import get_strategy
+
+STRATEGIES = ["Dynamic Trend Rider", "Volatility Breakout Pro", "Mean Reversion AI", "Scalper's Edge AI"]
+
+
+def make_candles(candles: int, seed: int = 0) -> pd.DataFrame:
+    """Build a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 10, candles))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=candles, freq='min'),
+        'open': close + rng.normal(0, 2, candles),
+        'high': close + 5 + rng.random(candles) * 5,
+        'low': close - 5 - rng.random(candles) * 5,
+        'close': close,
+        'volume': rng.random(candles) * 100
+    })
+
+
+def main(candles: int = 500):
+    df = make_candles(candles)
+    analysis = TechnicalAnalysis()
+    paths = {
+        'calculate_indicators': lambda: analysis.calculate_indicators(df),
+        'calculate_all_indicators': lambda: analysis.calculate_all_indicators(df)
+    }
+    for name in STRATEGIES:
+        strategy = get_strategy(name)
+        paths[f'  required by {name}'] = lambda strategy=strategy: analysis.calculate_all_indicators(df, required=strategy)
+    paths['calculate_all_indicators (cache hit)'] = lambda: analysis.calculate_all_indicators(
+        df, symbol='BTCUSDT', interval='1h'
+    )
+    print(f"{'path':<42}{'ms / call':>12}  ({candles} candles)")
+    for name, run in paths.items():
+        seconds = min(timeit.repeat(run, number=20, repeat=5)) / 20
+        print(f"{name:<42}{seconds * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,65 @@
+"""
+Kline decoding benchmark.
+
+Compares the original DataFrame + astype decoding path with the typed
+column decoder, reporting decode time and DataFrame memory per 1,000 candles.
+
+Usage:
+    python -m benchmarks.bench_kline_decode [candles]
+"""
+import sys
+import timeit
+import pandas as pd
+from trading_bot.core.kline_decoder import klines_to_dataframe
+
+
+def make_payload(candles: int) -> list:
+    """Build a synthetic futures kline payload in the exchange's wire format."""
+    start = 1_700_000_000_000
+    return [
+        [
+            start + i * 60_000,
+            f"{30000 + i * 0.1:.2f}", f"{30005 + i * 0.1:.2f}", f"{29995 + i * 0.1:.2f}", f"{30001 + i * 0.1:.2f}",
+            f"{123.456 + i:.3f}",
+            start + i * 60_000 + 59_999,
+            f"{3703680.5 + i:.5f}",
+            1234 + i,
+            f"{60.123 + i:.3f}",
+            f"{1803680.25 + i:.5f}",
+            "0"
+        ]
+        for i in range(candles)
+    ]
+
+
+def legacy_decode(klines: list) -> pd.DataFrame:
+    """Decoding path used by BinanceConnector.get_klines before the typed decoder."""
+    df = pd.DataFrame(klines, columns=[
+        'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+        'taker_buy_quote', 'ignore'
+    ])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        df[col] = df[col].astype(float)
+    return df
+
+
+def main(candles: int = 1000):
+    payload = make_payload(candles)
+    paths = {
+        'legacy (DataFrame + astype)': lambda: legacy_decode(payload),
+        'typed decoder (float64)': lambda: klines_to_dataframe(payload),
+        'typed decoder (float32)': lambda: klines_to_dataframe(payload, compact=True)
+    }
+
+    scale = 1000 / candles
+    print(f"{'path':<30}{'ms / 1k candles':>18}{'KiB / 1k candles':>20}")
+    for name, decode in paths.items():
+        seconds = min(timeit.repeat(decode, number=20, repeat=5)) / 20
+        memory = decode().memory_usage(deep=True).sum()
+        print(f"{name:<30}{seconds * 1000 * scale:>18.3f}{memory / 1024 * scale:>20.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,46 @@
+"""
+Parameter optimizer benchmark.
+
+Grid-searches Scalper's Edge AI parameters (EMA lengths, RSI bands and
+volume threshold) over synthetic 1m candles across a process pool, then
+repeats the search against the saved results to show the resumed run
+skipping every finished combination.
+
+Usage:
+    python -m benchmarks.bench_optimizer [candles] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from benchmarks.bench_indicators import make_candles
+from trading_bot.backtest.optimizer import StrategyOptimizer, grid_space
+from trading_bot.strategies.strategy_library import ScalpersEdgeAI
+
+
+def main(candles: int = 100000, workers: int = 0):
+    df = make_candles(candles)
+    combinations = grid_space({
+        'ema_fast': [5, 8, 13],
+        'ema_slow': [21, 34, 55],
+        'rsi_oversold': [25, 30, 35, 40],
+        'rsi_overbought': [60, 65, 70, 75],
+        'volume_threshold': [1.0, 1.2, 1.5]
+    })
+    with tempfile.TemporaryDirectory() as directory:
+        optimizer = StrategyOptimizer(
+            ScalpersEdgeAI, results_path=os.path.join(directory, 'results.jsonl'), max_workers=workers or None
+        )
+        for run in ('fresh', 'resumed'):
+            started = time.perf_counter()
+            results = optimizer.optimize(df, combinations)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{run:8s} {len(combinations)} combinations x {candles} candles on {optimizer.max_workers} workers: "
+                f"{elapsed:6.2f} s ({len(combinations) / elapsed:,.1f} per second)"
+            )
+    print(results.head(5).to_string())
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,59 @@
+"""
+Parallel indicator benchmark over a symbol x timeframe grid.
+
+Computes every indicator of calculate_all_indicators for a synthetic grid
+of series, first one series at a time in this process, then with
+calculate_indicators_parallel for increasing numbers of worker processes,
+and reports throughput and speedup. Scaling is bounded by the number of
+CPUs of the machine.
+
+Usage:
+    python -m benchmarks.bench_parallel_ta [symbols] [candles] [--workers 1 2 4 ...]
+"""
+import argparse
+import os
+import time
+from benchmarks.bench_indicators import make_candles
+from trading_bot.config.settings import settings
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+
+TIMEFRAMES = ["1m", "5m", "15m", "1h", "4h", "1d"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('symbols', nargs='?', type=int, default=50)
+    parser.add_argument('candles', nargs='?', type=int, default=500)
+    parser.add_argument('--workers', type=int, nargs='+')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1)))
+    frames = {
+        (f"SYM{i}USDT", interval): make_candles(args.candles, seed=i * len(TIMEFRAMES) + j)
+        for i in range(args.symbols)
+        for j, interval in enumerate(TIMEFRAMES)
+    }
+    print(f"{len(frames)} series ({args.symbols} symbols x {len(TIMEFRAMES)} timeframes) x {args.candles} candles, {cpus} CPUs")
+
+    analysis = TechnicalAnalysis()
+    started = time.perf_counter()
+    for df in frames.values():
+        analysis.calculate_all_indicators(df)
+    serial = time.perf_counter() - started
+    print(f"{'serial':<12}{serial * 1000:10.1f} ms  {len(frames) / serial:8.0f} series/s")
+
+    for count in workers:
+        settings.TA_MAX_WORKERS = count
+        analysis = TechnicalAnalysis()
+        # The first call starts the pool; time a warm one
+        analysis.calculate_indicators_parallel(frames)
+        started = time.perf_counter()
+        analysis.calculate_indicators_parallel(frames)
+        elapsed = time.perf_counter() - started
+        analysis.shutdown()
+        print(f"{f'{count} workers':<12}{elapsed * 1000:10.1f} ms  {len(frames) / elapsed:8.0f} series/s  {serial / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
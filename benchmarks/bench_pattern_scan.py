@@ -0,0 +1,66 @@
+"""
+Candlestick pattern benchmark.
+
+Compares the eight TA-Lib CDL functions with the vectorized pattern
+engine on one candle window, and scanning a symbol universe for the
+patterns printed on the last closed candle one symbol at a time with
+TA-Lib against TechnicalAnalysis.scan_patterns.
+
+Usage:
+    python -m benchmarks.bench_pattern_scan [symbols] [candles]
+"""
+import sys
+import time
+import timeit
+import talib
+from benchmarks.bench_indicators import make_candles
+from trading_bot.core.candlestick_patterns import detect_patterns
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+
+TALIB_PATTERNS = {
+    'DOJI': talib.CDLDOJI,
+    'HAMMER': talib.CDLHAMMER,
+    'HANGING_MAN': talib.CDLHANGINGMAN,
+    'ENGULFING': talib.CDLENGULFING,
+    'MORNING_STAR': talib.CDLMORNINGSTAR,
+    'EVENING_STAR': talib.CDLEVENINGSTAR,
+    'THREE_WHITE_SOLDIERS': talib.CDL3WHITESOLDIERS,
+    'THREE_BLACK_CROWS': talib.CDL3BLACKCROWS
+}
+
+
+def talib_patterns(df):
+    prices = [df[column].to_numpy() for column in ('open', 'high', 'low', 'close')]
+    return {name: kernel(*prices) for name, kernel in TALIB_PATTERNS.items()}
+
+
+def main(symbols: int = 500, candles: int = 500):
+    df = make_candles(candles)
+    prices = [df[column].to_numpy() for column in ('open', 'high', 'low', 'close')]
+    number = 50
+    talib_time = timeit.timeit(lambda: talib_patterns(df), number=number) / number
+    engine_time = timeit.timeit(lambda: detect_patterns(*prices), number=number) / number
+    print(f"one window of {candles} candles, {len(TALIB_PATTERNS)} patterns")
+    print(f"talib:  {talib_time * 1000:8.3f} ms")
+    print(f"engine: {engine_time * 1000:8.3f} ms")
+
+    frames = {f"SYM{i}USDT": make_candles(candles, seed=i) for i in range(symbols)}
+    analysis = TechnicalAnalysis()
+    started = time.perf_counter()
+    expected = {
+        symbol: [name for name, signal in talib_patterns(frame).items() if signal[-1]]
+        for symbol, frame in frames.items()
+    }
+    per_symbol = time.perf_counter() - started
+    started = time.perf_counter()
+    scan = analysis.scan_patterns(frames)
+    scanned = time.perf_counter() - started
+    assert all(scan.names(row=row) == expected[symbol] for row, symbol in enumerate(scan.symbols))
+
+    print(f"last-candle scan of {symbols} symbols")
+    print(f"talib per symbol: {per_symbol * 1000:8.2f} ms")
+    print(f"scan_patterns:    {scanned * 1000:8.2f} ms  ({per_symbol / scanned:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,53 @@
+"""
+Strategy ensemble benchmark.
+
+On a series of candle windows, times calculating indicators and
+analyzing the latest candle for one strategy, for each of the four
+strategies separately, and for all four through a StrategyEnsemble
+sharing one indicator snapshot.
+
+Usage:
+    python -m benchmarks.bench_strategy_ensemble [windows] [candles]
+"""
+import sys
+import time
+from benchmarks.bench_indicators import STRATEGIES, make_candles
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+from trading_bot.strategies.ensemble import StrategyEnsemble
+from trading_bot.strategies.strategy_library import get_strategy
+
+
+def timed(frames, evaluate) -> float:
+    """Seconds per window of evaluate(df)."""
+    started = time.perf_counter()
+    for df in frames:
+        evaluate(df)
+    return (time.perf_counter() - started) / len(frames)
+
+
+def main(windows: int = 200, candles: int = 500):
+    frames = [make_candles(candles, seed=i) for i in range(windows)]
+    analysis = TechnicalAnalysis()
+    strategies = [get_strategy(name) for name in STRATEGIES]
+    ensemble = StrategyEnsemble(STRATEGIES, technical_analysis=analysis)
+
+    def one(df):
+        strategy = strategies[0]
+        strategy.analyze(df, analysis.calculate_all_indicators(df, required=strategy))
+
+    def separately(df):
+        for strategy in strategies:
+            strategy.analyze(df, analysis.calculate_all_indicators(df, required=strategy))
+
+    def together(df):
+        ensemble.consensus(ensemble.evaluate(df))
+
+    timed(frames[:5], together)
+    print(f"{windows} windows x {candles} candles, per window:")
+    print(f"one strategy ({STRATEGIES[0]}):   {timed(frames, one) * 1000:6.2f} ms")
+    print(f"four strategies, separately:          {timed(frames, separately) * 1000:6.2f} ms")
+    print(f"four strategies, shared snapshot:     {timed(frames, together) * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
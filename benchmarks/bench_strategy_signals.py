@@ -0,0 +1,62 @@
+"""
+Strategy signal history benchmark.
+
+Evaluates each strategy over every bar of a candle history, once by
+calling analyze() on the history up to each bar (the indicators are
+computed once and sliced, so this understates the per-bar cost) and once
+with analyze_vectorized(). Reports both times and the number of bars
+where the two disagree on any field.
+
+Usage:
+    python -m benchmarks.bench_strategy_signals [candles]
+"""
+import sys
+import time
+from benchmarks.bench_indicators import STRATEGIES, make_candles
+from trading_bot.core.technical_analysis import TechnicalAnalysis
+from trading_bot.strategies.base_strategy import _same_value
+from trading_bot.strategies.strategy_library import get_strategy
+
+
+def per_bar(strategy, df, indicators):
+    """analyze() with bar i as the latest one, for every bar."""
+    results = []
+    for i in range(1, len(df) + 1):
+        window = {
+            category: {key: values[key].iloc[:i] for key in values}
+            for category, values in indicators.items()
+        }
+        results.append(strategy.analyze(df.iloc[:i], window))
+    return results
+
+
+def main(candles: int = 2000):
+    df = make_candles(candles)
+    analysis = TechnicalAnalysis()
+    print(f"{candles} candles")
+    for name in STRATEGIES:
+        strategy = get_strategy(name)
+        indicators = analysis.calculate_all_indicators(df, required=strategy)
+        indicators = {category: {key: values[key] for key in values} for category, values in indicators.items()}
+
+        started = time.perf_counter()
+        looped = per_bar(strategy, df, indicators)
+        loop_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        history = strategy.analyze_vectorized(df, indicators)
+        vector_time = time.perf_counter() - started
+
+        mismatches = sum(
+            any(key in history and not _same_value(value, history[key][i]) for key, value in result.items())
+            for i, result in enumerate(looped)
+        )
+        print(
+            f"{name:24s} per bar {loop_time * 1000:8.1f} ms  vectorized {vector_time * 1000:6.2f} ms  "
+            f"({loop_time / vector_time:,.0f}x)  mismatched bars {mismatches}  "
+            f"consistent {strategy.check_vectorized(df, indicators)}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
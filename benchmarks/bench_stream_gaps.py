@@ -0,0 +1,164 @@
+"""
+Kline stream gap-filling check.
+
+Replays a synthetic 1m kline feed through the stream replay stand-in, once
+complete and once with frames dropped at random, and checks that the
+candle windows (1m in window mode; 5m and 1h resampled) end up equal to
+the exchange's candles and that every hourly close is still reported.
+
+Usage:
+    python -m benchmarks.bench_stream_gaps [minutes] [drop_rate]
+"""
+import logging
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Optional
+import numpy as np
+from trading_bot.core.kline_decoder import columns_to_dataframe
+from trading_bot.core.kline_store import INTERVAL_MS, STORED_DTYPES
+from trading_bot.core.kline_stream import KlineStreamManager
+from trading_bot.core.stream_replay import StreamReplayServer
+
+SYMBOL = "BTCUSDT"
+HISTORY = 1500
+START = 1_700_002_800_000  # on an hour boundary
+
+
+def make_candles(minutes: int, seed: int = 7) -> Dict[str, np.ndarray]:
+    """Build HISTORY minutes of history plus `minutes` streamed ones, with exactly summable values."""
+    rng = np.random.default_rng(seed)
+    rows = HISTORY + minutes
+    timestamp = START - HISTORY * 60_000 + np.arange(rows, dtype=np.int64) * 60_000
+    close = np.round(30000 + np.cumsum(rng.normal(0, 5, rows)), 2)
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    volume = rng.integers(1, 100, rows).astype(np.float64)
+    return {
+        'timestamp': timestamp,
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.integers(0, 5, rows),
+        'low': np.minimum(open_, close) - rng.integers(0, 5, rows),
+        'close': close,
+        'volume': volume,
+        'close_time': timestamp + 59_999,
+        'quote_volume': volume * 30000,
+        'trades': rng.integers(1, 50, rows),
+        'taker_buy_base': np.floor(volume / 2),
+        'taker_buy_quote': np.floor(volume / 2) * 30000
+    }
+
+
+def resample(candles: Dict[str, np.ndarray], interval: str) -> Dict[str, np.ndarray]:
+    """Aggregate 1m candles into complete buckets of `interval`, as the exchange reports them."""
+    ms = INTERVAL_MS[interval]
+    buckets = candles['timestamp'] - candles['timestamp'] % ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)]
+    out = {col: [] for col in STORED_DTYPES}
+    for start, end in zip(starts, ends):
+        out['timestamp'].append(buckets[start])
+        out['open'].append(candles['open'][start])
+        out['high'].append(candles['high'][start:end].max())
+        out['low'].append(candles['low'][start:end].min())
+        out['close'].append(candles['close'][end - 1])
+        out['close_time'].append(buckets[start] + ms - 1)
+        for col in ('volume', 'quote_volume', 'trades', 'taker_buy_base', 'taker_buy_quote'):
+            out[col].append(candles[col][start:end].sum())
+    return {col: np.array(values, dtype=STORED_DTYPES[col]) for col, values in out.items()}
+
+
+def make_frames(candles: Dict[str, np.ndarray]) -> list:
+    """Send every streamed candle as two partial updates and a final one."""
+    frames = []
+    for i in range(HISTORY, len(candles['timestamp'])):
+        final = {col: candles[col][i] for col in STORED_DTYPES}
+        partial = dict(final, high=max(final['open'], final['close']), low=min(final['open'], final['close']),
+                       volume=0.0, quote_volume=0.0, trades=0, taker_buy_base=0.0, taker_buy_quote=0.0)
+        for values, closed in ((partial, False), (dict(partial, close=final['open']), False), (final, True)):
+            frames.append({'stream': f"{SYMBOL.lower()}@kline_1m", 'data': {'e': 'kline', 's': SYMBOL, 'k': {
+                's': SYMBOL, 'i': '1m', 't': int(values['timestamp']), 'T': int(values['close_time']),
+                'o': str(values['open']), 'h': str(values['high']), 'l': str(values['low']),
+                'c': str(values['close']), 'v': str(values['volume']), 'q': str(values['quote_volume']),
+                'n': int(values['trades']), 'V': str(values['taker_buy_base']),
+                'Q': str(values['taker_buy_quote']), 'x': closed
+            }}})
+    return frames
+
+
+class FeedConnector:
+    """REST stand-in serving the candles before the feed, or any range by start time."""
+
+    def __init__(self, candles: Dict[str, np.ndarray]):
+        self.candles = candles
+        self.fills = 0
+
+    def get_klines(self, symbol: str, interval: str, limit: int = 500,
+                   start_time: Optional[datetime] = None, end_time: Optional[datetime] = None):
+        series = self.candles if interval == '1m' else resample(self.candles, interval)
+        if start_time is None:
+            keep = np.flatnonzero(series['timestamp'] < START)[-limit:]
+        else:
+            self.fills += 1
+            keep = np.flatnonzero(series['timestamp'] >= int(start_time.timestamp() * 1000))[:limit]
+        return columns_to_dataframe({col: values[keep] for col, values in series.items()})
+
+
+def replay(candles, frames, resample_mode: bool, drop_rate: float):
+    """Replay the feed and return the manager, connector and reported closes once it goes quiet."""
+    connector = FeedConnector(candles)
+    closes = []
+    server = StreamReplayServer(frames, drop_rate=drop_rate, seed=1)
+    url = server.start()
+    intervals = ['5m', '1h'] if resample_mode else ['1m']
+    manager = KlineStreamManager(
+        connector, lambda s, i, df: closes.append((i, int(df['timestamp'].iloc[-1].value // 1_000_000))),
+        url=url, resample=resample_mode
+    )
+    manager.start([SYMBOL], intervals)
+    last, quiet = None, 0
+    while quiet < 5:
+        time.sleep(0.1)
+        window = manager.get_window(SYMBOL, '1m')
+        state = (len(closes), None if window is None else float(window['close'].iloc[-1]))
+        quiet = quiet + 1 if state == last else 0
+        last = state
+    manager.stop()
+    server.stop()
+    return manager, connector, closes
+
+
+def window_matches(manager, candles, interval: str) -> bool:
+    """Check every candle of a window but the last, possibly still open, one against the exchange's."""
+    window = manager.get_window(SYMBOL, interval)
+    expected = candles if interval == '1m' else resample(candles, interval)
+    index = {t: i for i, t in enumerate(expected['timestamp'])}
+    times = window['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)[:-1]
+    rows = [index[t] for t in times]
+    return all(
+        np.array_equal(window[col].to_numpy()[:-1].astype(STORED_DTYPES[col]), expected[col][rows])
+        for col in STORED_DTYPES if col != 'timestamp'
+    )
+
+
+def main(minutes: int = 300, drop_rate: float = 0.3):
+    # Every fill logs a warning
+    logging.getLogger('trading_bot.core.kline_stream').setLevel(logging.ERROR)
+    candles = make_candles(minutes)
+    frames = make_frames(candles)
+    print(f"{minutes} streamed minutes, {len(frames)} frames, drop rate {drop_rate:.0%}")
+
+    for resample_mode, intervals in ((False, ['1m']), (True, ['5m', '1h'])):
+        mode = "resample" if resample_mode else "window"
+        _, _, complete = replay(candles, frames, resample_mode, 0.0)
+        manager, connector, closes = replay(candles, frames, resample_mode, drop_rate)
+        hourly = lambda reported: sorted(t for i, t in reported if i == '1h')
+        print(
+            f"{mode:8s} REST fills {connector.fills:4d}  closes {len(closes):4d} of {len(complete):4d}  "
+            + "  ".join(f"{interval} window {'ok' if window_matches(manager, candles, interval) else 'MISMATCH'}"
+                        for interval in intervals)
+            + (f"  hourly closes {'ok' if hourly(closes) == hourly(complete) else 'MISSING'}" if resample_mode else "")
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) if i == 0 else float(arg) for i, arg in enumerate(sys.argv[1:3])))
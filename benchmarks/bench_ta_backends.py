@@ -0,0 +1,79 @@
+"""
+Indicator backend benchmark.
+
+Checks every indicator function of the compiled kernel backend against
+TA-Lib on a synthetic candle window and compares their speed, then times
+calculate_all_indicators's graph on each backend.
+
+Usage:
+    python -m benchmarks.bench_ta_backends [candles]
+"""
+import sys
+import timeit
+import numpy as np
+import talib
+from benchmarks.bench_indicators import make_candles
+from trading_bot.config.settings import settings
+from trading_bot.core import numba_kernels
+from trading_bot.core.indicator_graph import build_indicator_graph, layout_outputs
+from trading_bot.core.technical_analysis import all_indicators_layout
+
+CALLS = {
+    'SMA': lambda ta, p: ta.SMA(p['close'], timeperiod=20),
+    'EMA': lambda ta, p: ta.EMA(p['close'], timeperiod=26),
+    'SUM': lambda ta, p: ta.SUM(p['volume'], timeperiod=14),
+    'MAX': lambda ta, p: ta.MAX(p['high'], timeperiod=52),
+    'MIN': lambda ta, p: ta.MIN(p['low'], timeperiod=52),
+    'STDDEV': lambda ta, p: ta.STDDEV(p['close'], timeperiod=20, nbdev=2),
+    'RSI': lambda ta, p: ta.RSI(p['close'], timeperiod=14),
+    'MACD': lambda ta, p: ta.MACD(p['close'], fastperiod=12, slowperiod=26, signalperiod=9),
+    'ATR': lambda ta, p: ta.ATR(p['high'], p['low'], p['close'], timeperiod=14),
+    'ADX': lambda ta, p: ta.ADX(p['high'], p['low'], p['close'], timeperiod=14),
+    'PLUS_DI': lambda ta, p: ta.PLUS_DI(p['high'], p['low'], p['close'], timeperiod=14),
+    'MINUS_DI': lambda ta, p: ta.MINUS_DI(p['high'], p['low'], p['close'], timeperiod=14),
+    'STOCH': lambda ta, p: ta.STOCH(p['high'], p['low'], p['close'], fastk_period=14, slowk_period=3, slowk_matype=0, slowd_period=3, slowd_matype=0),
+    'STOCHF': lambda ta, p: ta.STOCHF(p['high'], p['low'], p['close'], fastk_period=14, fastd_period=3, fastd_matype=0),
+    'CCI': lambda ta, p: ta.CCI(p['high'], p['low'], p['close'], timeperiod=14),
+    'WILLR': lambda ta, p: ta.WILLR(p['high'], p['low'], p['close'], timeperiod=14),
+    'OBV': lambda ta, p: ta.OBV(p['close'], p['volume']),
+    'CDLDOJI': lambda ta, p: ta.CDLDOJI(p['open'], p['high'], p['low'], p['close']),
+    'CDLENGULFING': lambda ta, p: ta.CDLENGULFING(p['open'], p['high'], p['low'], p['close']),
+    'CDLMORNINGSTAR': lambda ta, p: ta.CDLMORNINGSTAR(p['open'], p['high'], p['low'], p['close'])
+}
+
+
+def relative_error(expected, actual) -> float:
+    """Largest difference relative to the magnitude of the expected series; NaN positions must match."""
+    worst = 0.0
+    for a, b in zip(*(x if isinstance(x, tuple) else (x,) for x in (expected, actual))):
+        if not np.array_equal(np.isnan(a), np.isnan(b)):
+            return float('inf')
+        scale = max(np.nanmax(np.abs(a)), 1.0) if np.isfinite(a).any() else 1.0
+        worst = max(worst, float(np.nanmax(np.abs(a - b))) / scale if np.isfinite(a).any() else 0.0)
+    return worst
+
+
+def main(candles: int = 500):
+    df = make_candles(candles)
+    prices = {column: df[column].to_numpy() for column in ('open', 'high', 'low', 'close', 'volume')}
+    number = 200
+
+    print(f"{'function':<16}{'talib us':>10}{'numba us':>10}{'rel. error':>12}  ({candles} candles)")
+    for name, call in CALLS.items():
+        call(numba_kernels, prices)  # compile
+        error = relative_error(call(talib, prices), call(numba_kernels, prices))
+        talib_time = min(timeit.repeat(lambda: call(talib, prices), number=number, repeat=3)) / number
+        numba_time = min(timeit.repeat(lambda: call(numba_kernels, prices), number=number, repeat=3)) / number
+        print(f"{name:<16}{talib_time * 1e6:10.1f}{numba_time * 1e6:10.1f}{error:12.1e}")
+
+    layout = all_indicators_layout(settings.TA_INDICATORS)
+    outputs = layout_outputs(layout)
+    for backend in (talib, numba_kernels):
+        graph = build_indicator_graph(settings.TA_INDICATORS, extra_periods=[12, 20, 26, 50, 200], backend=backend)
+        graph.evaluate(df, outputs)
+        elapsed = min(timeit.repeat(lambda: graph.evaluate(df, outputs), number=50, repeat=5)) / 50
+        print(f"all indicators on {backend.__name__}: {elapsed * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -11,8 +11,8 @@ python -m pip install --upgrade pip
 REM Install requirements
 pip install -r requirements.txt
 
-REM Install TA-Lib (if not already installed)
-pip install --use-pep517 TA-Lib
+REM Install TA-Lib (optional: without it the bot uses its compiled indicator kernels)
+pip install --use-pep517 TA-Lib || echo TA-Lib not installed, using the compiled indicator kernels
 
 REM Install PyInstaller if not already installed
 pip install pyinstaller
@@ -55,6 +55,8 @@ class GeminiInterface:
                     'patterns': {k: int(v.iloc[-1]) if not pd.isna(v.iloc[-1]) else 0 for k, v in indicators['patterns'].items()}
                 }
             }
+            if indicators.get('order_book'):
+                market_context['order_book'] = indicators['order_book']
             
             return json.dumps(market_context, indent=2)
             
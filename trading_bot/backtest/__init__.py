@@ -0,0 +1 @@
+"""Backtesting package for the trading bot.""" 
\ No newline at end of file
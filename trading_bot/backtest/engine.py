@@ -0,0 +1,382 @@
+import copy
+import logging
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+from ..core.technical_analysis import TechnicalAnalysis
+from ..strategies.base_strategy import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+# Which exit a bar reaching both the stop loss and the take profit fills first
+INTRABAR_ORDERS = ('stop_first', 'target_first', 'ohlc')
+
+TRADE_COLUMNS = [
+    'entry_time', 'exit_time', 'side', 'quantity', 'entry_price', 'exit_price',
+    'stop_loss', 'take_profit', 'fees', 'funding', 'pnl', 'exit_reason'
+]
+
+
+class BacktestData:
+    """
+    Candle history prepared for backtesting.
+
+    Keeps the price columns as Python lists, which the bar loop reads much
+    faster than arrays. Build one to run many backtests (strategies or
+    parameter sets) over the same candles without preparing them each time.
+
+    Args:
+        df: DataFrame with OHLCV data, bar times in a 'timestamp' column or the index
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.times = pd.Index(df['timestamp']) if 'timestamp' in df.columns else df.index
+        self.opens, self.highs, self.lows, self.closes = (
+            df[col].to_numpy(dtype=np.float64).tolist() for col in ('open', 'high', 'low', 'close')
+        )
+        self._funding_bars: Dict[int, List[bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    def window(self, start: int, end: int) -> 'BacktestData':
+        """Get bars [start, end) as BacktestData, reusing the prepared columns."""
+        window = copy.copy(self)
+        window.df = self.df.iloc[start:end]
+        window.times = self.times[start:end]
+        window.opens, window.highs, window.lows, window.closes = (
+            values[start:end] for values in (self.opens, self.highs, self.lows, self.closes)
+        )
+        window._funding_bars = {hours: bars[start:end] for hours, bars in self._funding_bars.items()}
+        return window
+
+    def funding_bars(self, interval_hours: int) -> List[bool]:
+        """Flag the bars whose open is the first at or after a funding time (none without datetimes)."""
+        bars = self._funding_bars.get(interval_hours)
+        if bars is None:
+            funding = np.zeros(len(self), dtype=bool)
+            if isinstance(self.times, pd.DatetimeIndex):
+                periods = self.times.as_unit('ns').asi8 // (interval_hours * 3600 * 10**9)
+                funding[1:] = periods[1:] > periods[:-1]
+            bars = self._funding_bars[interval_hours] = funding.tolist()
+        return bars
+
+
+class IndicatorWindow(Mapping):
+    """
+    Read-only view of an indicator category restricted to bars [start, end).
+
+    Indicators only depend on earlier bars, so those computed once over a
+    whole history can be sliced for any window of it instead of being
+    recomputed (which would also add a warm-up gap at the window start).
+    """
+
+    def __init__(self, category: Mapping, start: int, end: int):
+        self._category = category
+        self._start = start
+        self._end = end
+
+    def __getitem__(self, key: str) -> pd.Series:
+        return self._category[key].iloc[self._start:self._end]
+
+    def __contains__(self, key) -> bool:
+        return key in self._category
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._category)
+
+    def __len__(self) -> int:
+        return len(self._category)
+
+
+def window_indicators(indicators: Dict[str, Mapping], start: int, end: int) -> Dict[str, IndicatorWindow]:
+    """
+    Restrict indicators calculated over a whole history to bars [start, end).
+
+    Args:
+        indicators: Indicator categories of the whole history
+        start: First bar of the window
+        end: Bar after the last one of the window
+
+    Returns:
+        Dictionary mapping categories to IndicatorWindow
+    """
+    return {category: IndicatorWindow(values, start, end) for category, values in indicators.items()}
+
+
+class BacktestResult:
+    """
+    Equity curve and trade log of a backtest.
+
+    Args:
+        equity: Account equity at every bar close, open positions marked to market
+        trades: One row per closed trade (TRADE_COLUMNS), pnl net of fees and funding
+        initial_capital: Equity at the start
+    """
+
+    def __init__(self, equity: pd.Series, trades: pd.DataFrame, initial_capital: float):
+        self.equity = equity
+        self.trades = trades
+        self.initial_capital = initial_capital
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarise the backtest.
+
+        Returns:
+            Dictionary containing final equity, total return, maximum drawdown,
+            trade count, win rate, profit factor and total fees and funding
+        """
+        equity = self.equity.to_numpy()
+        final_equity = float(equity[-1]) if len(equity) else self.initial_capital
+        peaks = np.maximum.accumulate(equity) if len(equity) else equity
+        pnl = self.trades['pnl']
+        gains = float(pnl[pnl > 0].sum())
+        losses = float(-pnl[pnl < 0].sum())
+        if losses > 0:
+            profit_factor = gains / losses
+        else:
+            profit_factor = float('inf') if gains > 0 else 0.0
+
+        return {
+            'final_equity': final_equity,
+            'total_return': final_equity / self.initial_capital - 1,
+            'max_drawdown': float(np.max(1 - equity / peaks)) if len(equity) else 0.0,
+            'trades': len(self.trades),
+            'win_rate': float((pnl > 0).mean()) if len(pnl) else 0.0,
+            'profit_factor': profit_factor,
+            'fees': float(self.trades['fees'].sum()),
+            'funding': float(self.trades['funding'].sum())
+        }
+
+
+class BacktestEngine:
+    """
+    Bar-by-bar backtester of a BaseStrategy over OHLCV history.
+
+    The signal of a bar is acted on at the next bar's open, so no decision
+    uses a price it could not have known. Positions are sized to lose
+    `risk_per_trade` of equity at the stop loss, capped at `leverage` times
+    equity, and leave at the stop loss or take profit from the strategy's
+    calculate_risk_parameters, or at the open after an opposite signal.
+
+    Market orders (entries, signal exits, stop losses) pay the taker fee and
+    slippage, take profits rest as limit orders and pay the maker fee. Open
+    positions pay funding whenever a funding time passes. A level the open
+    gapped through fills at the open; when a bar reaches both levels,
+    `intrabar_order` picks the one filled: 'stop_first', 'target_first', or
+    'ohlc' for the path open, nearer extreme, farther extreme.
+
+    Signals come from the strategy's analyze_vectorized(), and the bar loop
+    keeps its state in floats over plain arrays and skips straight to the
+    next signal while flat, so a year of 1m candles takes seconds.
+
+    Args:
+        strategy: Strategy to test
+        initial_capital: Equity at the start
+        risk_per_trade: Fraction of equity lost when a stop loss is hit
+        leverage: Cap on position notional relative to equity
+        taker_fee: Fee of market orders, as a fraction of notional
+        maker_fee: Fee of take profit orders, as a fraction of notional
+        slippage: Adverse price move of market orders, as a fraction of price
+        funding_rate: Funding per interval as a fraction of notional, paid by
+            longs when positive and by shorts when negative
+        funding_interval_hours: Hours between funding times, counted from midnight UTC
+        intrabar_order: One of INTRABAR_ORDERS
+        technical_analysis: Indicator calculator (a new TechnicalAnalysis if None)
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        initial_capital: float = settings.BACKTEST_INITIAL_CAPITAL,
+        risk_per_trade: float = settings.BACKTEST_RISK_PER_TRADE,
+        leverage: float = settings.BACKTEST_LEVERAGE,
+        taker_fee: float = settings.BACKTEST_TAKER_FEE,
+        maker_fee: float = settings.BACKTEST_MAKER_FEE,
+        slippage: float = settings.BACKTEST_SLIPPAGE,
+        funding_rate: float = settings.BACKTEST_FUNDING_RATE,
+        funding_interval_hours: int = settings.BACKTEST_FUNDING_INTERVAL_HOURS,
+        intrabar_order: str = settings.BACKTEST_INTRABAR_ORDER,
+        technical_analysis: Optional[TechnicalAnalysis] = None
+    ):
+        if intrabar_order not in INTRABAR_ORDERS:
+            raise ValueError(f"Unknown intrabar order '{intrabar_order}', expected one of {list(INTRABAR_ORDERS)}")
+        self.strategy = strategy
+        self.initial_capital = initial_capital
+        self.risk_per_trade = risk_per_trade
+        self.leverage = leverage
+        self.taker_fee = taker_fee
+        self.maker_fee = maker_fee
+        self.slippage = slippage
+        self.funding_rate = funding_rate
+        self.funding_interval_hours = funding_interval_hours
+        self.intrabar_order = intrabar_order
+        self.technical_analysis = technical_analysis or TechnicalAnalysis()
+
+    def run(self, df: Union[pd.DataFrame, BacktestData], indicators: Optional[Dict] = None) -> BacktestResult:
+        """
+        Backtest the strategy over a candle history.
+
+        Args:
+            df: DataFrame with OHLCV data, bar times in a 'timestamp' column or
+                the index, or BacktestData prepared from one
+            indicators: Indicators of the same bars, including ATR (calculated if None)
+
+        Returns:
+            BacktestResult with the equity curve and trade log
+        """
+        try:
+            data = df if isinstance(df, BacktestData) else BacktestData(df)
+            if indicators is None:
+                required = list(dict.fromkeys(self.strategy.get_required_indicators() + ['ATR']))
+                indicators = self.technical_analysis.calculate_all_indicators(data.df, required=required)
+
+            signals = self._signal_directions(data.df, indicators)
+            atr = np.asarray(indicators['volatility']['ATR'], dtype=np.float64)
+            equity, trades = self._simulate(data, signals, atr)
+
+            return BacktestResult(
+                pd.Series(equity, index=data.times, name='equity'),
+                pd.DataFrame(trades, columns=TRADE_COLUMNS),
+                self.initial_capital
+            )
+
+        except Exception as e:
+            logger.error(f"Error backtesting {self.strategy.name}: {str(e)}")
+            raise
+
+    def _signal_directions(self, df: pd.DataFrame, indicators: Dict) -> np.ndarray:
+        """Get the strategy's signal of every bar as 1 (BUY), -1 (SELL) or 0."""
+        if self.strategy.supports_vectorized:
+            signal = self.strategy.analyze_vectorized(df, indicators)['signal']
+        else:
+            logger.warning(f"{self.strategy.name} has no vectorized mode, calling analyze() for every bar")
+            signal = [
+                self.strategy.analyze(
+                    df.iloc[:end],
+                    {category: {key: values[key].iloc[:end] for key in values} for category, values in indicators.items()}
+                )['signal']
+                for end in range(1, len(df) + 1)
+            ]
+        signal = np.asarray(signal)
+        return np.where(signal == 'BUY', 1, np.where(signal == 'SELL', -1, 0)).astype(np.int8)
+
+    def _exit(
+        self,
+        direction: int,
+        open_: float,
+        high: float,
+        low: float,
+        stop_loss: float,
+        take_profit: float
+    ) -> Optional[Tuple[float, float, str]]:
+        """Get the (price, fee rate, reason) of an exit within the bar, if any."""
+        if direction > 0:
+            stop_hit, target_hit = low <= stop_loss, high >= take_profit
+            stop_gap, target_gap = open_ <= stop_loss, open_ >= take_profit
+        else:
+            stop_hit, target_hit = high >= stop_loss, low <= take_profit
+            stop_gap, target_gap = open_ >= stop_loss, open_ <= take_profit
+        if not (stop_hit or target_hit):
+            return None
+
+        if stop_gap or target_gap:
+            stop_first = stop_gap
+        elif stop_hit and target_hit:
+            if self.intrabar_order == 'ohlc':
+                # The extreme nearer the open is reached first
+                low_first = open_ - low < high - open_
+                stop_first = low_first == (direction > 0)
+            else:
+                stop_first = self.intrabar_order == 'stop_first'
+        else:
+            stop_first = stop_hit
+
+        if stop_first:
+            price = open_ if stop_gap else stop_loss
+            return price * (1 - direction * self.slippage), self.taker_fee, 'stop_loss'
+        return (open_ if target_gap else take_profit), self.maker_fee, 'take_profit'
+
+    def _simulate(self, data: BacktestData, signals: np.ndarray, atr: np.ndarray) -> Tuple[np.ndarray, List[list]]:
+        """Replay the bars; get the equity at every close and the trade log rows."""
+        times, opens, highs, lows, closes = data.times, data.opens, data.highs, data.lows, data.closes
+        funding_bars = data.funding_bars(self.funding_interval_hours)
+        signal_bars = np.flatnonzero(signals).tolist()
+        signals = signals.tolist()
+        bars = len(closes)
+        equity = np.empty(bars)
+        trades = []
+
+        cash = self.initial_capital
+        direction = 0
+        quantity = entry_price = stop_loss = take_profit = fees = funding = 0.0
+        entry_bar = 0
+
+        def close(bar: int, price: float, fee_rate: float, reason: str):
+            nonlocal cash, direction
+            exit_fee = quantity * price * fee_rate
+            gross = direction * quantity * (price - entry_price)
+            cash += gross - exit_fee
+            trades.append([
+                times[entry_bar], times[bar], 'BUY' if direction > 0 else 'SELL', quantity, entry_price,
+                price, stop_loss, take_profit, fees + exit_fee, funding, gross - fees - exit_fee - funding, reason
+            ])
+            direction = 0
+
+        i = 0
+        while i < bars:
+            if not direction:
+                # Without a position nothing happens before the bar after the next signal
+                k = bisect_left(signal_bars, i - 1)
+                next_bar = signal_bars[k] + 1 if k < len(signal_bars) else bars
+                if next_bar > i:
+                    equity[i:next_bar] = cash
+                    i = next_bar
+                    continue
+
+            open_ = opens[i]
+            signal = signals[i - 1] if i else 0
+
+            if direction:
+                if funding_bars[i] and self.funding_rate:
+                    payment = direction * quantity * open_ * self.funding_rate
+                    cash -= payment
+                    funding += payment
+                if signal == -direction:
+                    close(i, open_ * (1 - direction * self.slippage), self.taker_fee, 'signal')
+
+            if not direction and signal and atr[i - 1] > 0 and cash > 0:
+                direction = signal
+                entry_price = open_ * (1 + direction * self.slippage)
+                levels = self.strategy.calculate_risk_parameters(
+                    entry_price, float(atr[i - 1]), side='BUY' if direction > 0 else 'SELL'
+                )
+                stop_loss, take_profit = levels['stop_loss'], levels['take_profit']
+                quantity = min(
+                    cash * self.risk_per_trade / abs(entry_price - stop_loss),
+                    cash * self.leverage / entry_price
+                )
+                fees = quantity * entry_price * self.taker_fee
+                cash -= fees
+                funding = 0.0
+                entry_bar = i
+
+            if direction:
+                exit = self._exit(direction, open_, highs[i], lows[i], stop_loss, take_profit)
+                if exit is not None:
+                    close(i, *exit)
+
+            equity[i] = cash + direction * quantity * (closes[i] - entry_price) if direction else cash
+            i += 1
+
+        # Positions still open at the end leave at the last close
+        if direction:
+            close(bars - 1, closes[-1] * (1 - direction * self.slippage), self.taker_fee, 'end')
+            equity[-1] = cash
+
+        return equity, trades
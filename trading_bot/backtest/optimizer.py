@@ -0,0 +1,364 @@
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+from ..core.indicator_graph import SOURCES
+from ..core.parallel_ta import SharedOHLCV, attach_block
+from ..core.technical_analysis import TechnicalAnalysis
+from ..strategies.base_strategy import BaseStrategy
+from .engine import BacktestData, BacktestEngine, BacktestResult, window_indicators
+
+logger = logging.getLogger(__name__)
+
+# State of the current worker process, set up once by _init_worker
+_worker: Optional[Dict[str, Any]] = None
+
+
+def _plain(params: Dict) -> Dict:
+    """Convert NumPy scalars (e.g. from np.arange grids) to Python values."""
+    return {name: value.item() if isinstance(value, np.generic) else value for name, value in params.items()}
+
+
+def _params_key(params: Dict) -> str:
+    return json.dumps(params, sort_keys=True)
+
+
+def _fingerprint(
+    df: pd.DataFrame,
+    strategy_class: Type[BaseStrategy],
+    engine_params: Dict[str, Any],
+    metric: str
+) -> Dict[str, Any]:
+    """Identify what a saved optimisation ran on, so results for other runs are never reused."""
+    times = df['timestamp'] if 'timestamp' in df.columns else df.index.to_series()
+    digest = hashlib.sha256(pd.util.hash_pandas_object(times, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(df[list(SOURCES)], index=False).to_numpy().tobytes())
+    # Round-tripped through JSON so it compares equal to the one read back
+    return json.loads(json.dumps({
+        'strategy': f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+        'bars': len(df),
+        'first_time': str(times.iloc[0]) if len(df) else None,
+        'last_time': str(times.iloc[-1]) if len(df) else None,
+        'data_hash': digest.hexdigest(),
+        'engine_params': engine_params,
+        'metric': metric
+    }, sort_keys=True, default=str))
+
+
+def grid_space(space: Dict[str, Sequence]) -> List[Dict]:
+    """
+    Expand a parameter grid into every combination.
+
+    Args:
+        space: Parameter name -> candidate values
+
+    Returns:
+        List of parameter dictionaries
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_space(space: Dict[str, Any], samples: int, seed: Optional[int] = None) -> List[Dict]:
+    """
+    Draw random parameter combinations.
+
+    Args:
+        space: Parameter name -> list of candidate values, or a (low, high)
+            tuple sampled uniformly (as integers when both bounds are)
+        samples: Number of draws; duplicate combinations are kept once
+        seed: Random seed, so that a resumed search draws the same combinations
+
+    Returns:
+        List of distinct parameter dictionaries
+    """
+    rng = random.Random(seed)
+
+    def draw(values):
+        if isinstance(values, tuple):
+            low, high = values
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(list(values))
+
+    combinations = {}
+    for _ in range(samples):
+        params = _plain({name: draw(values) for name, values in space.items()})
+        combinations.setdefault(_params_key(params), params)
+    return list(combinations.values())
+
+
+def _init_worker(
+    strategy_class: Type[BaseStrategy],
+    block_name: str,
+    rows: int,
+    times: np.ndarray,
+    engine_params: Dict[str, Any]
+):
+    global _worker
+    block = attach_block(block_name)
+    ohlcv = np.ndarray((len(SOURCES), rows), dtype=np.float64, buffer=block.buf)
+    # Columns are views of the shared block, not per-worker copies
+    df = pd.DataFrame({'timestamp': times, **{source: ohlcv[i] for i, source in enumerate(SOURCES)}}, copy=False)
+    technical_analysis = TechnicalAnalysis()
+    _worker = {
+        'block': block,
+        'data': BacktestData(df),
+        'strategy_class': strategy_class,
+        'engine_params': engine_params,
+        'technical_analysis': technical_analysis,
+        # Nothing required up front and never compact, so each indicator
+        # (any EMA length a combination asks for included) is computed
+        # when the first combination reading it runs, and reused by all
+        # later ones
+        'indicators': technical_analysis.calculate_all_indicators(df, required=(), compact=False)
+    }
+
+
+def _backtest(params: Dict, window: Optional[Tuple[int, int]]) -> BacktestResult:
+    strategy = _worker['strategy_class']()
+    strategy.set_parameters(**params)
+    engine = BacktestEngine(strategy, technical_analysis=_worker['technical_analysis'], **_worker['engine_params'])
+    if window is None:
+        return engine.run(_worker['data'], _worker['indicators'])
+    start, end = window
+    return engine.run(_worker['data'].window(start, end), window_indicators(_worker['indicators'], start, end))
+
+
+def evaluate_combinations(
+    combinations: List[Dict],
+    window: Optional[Tuple[int, int]] = None
+) -> List[Tuple[Dict, Dict[str, float]]]:
+    """
+    Backtest parameter combinations in a backtest_pool worker.
+
+    Args:
+        combinations: Parameter dictionaries
+        window: (start, end) bars of the history to test on (all of it if None)
+
+    Returns:
+        List of (parameters, BacktestResult summary) pairs
+    """
+    return [(params, _backtest(params, window).summary()) for params in combinations]
+
+
+def backtest_combination(params: Dict, window: Optional[Tuple[int, int]] = None) -> BacktestResult:
+    """
+    Backtest one parameter combination in a backtest_pool worker, keeping the equity curve and trades.
+
+    Args:
+        params: Parameter dictionary
+        window: (start, end) bars of the history to test on (all of it if None)
+
+    Returns:
+        BacktestResult of the combination
+    """
+    return _backtest(params, window)
+
+
+@contextmanager
+def backtest_pool(
+    df: pd.DataFrame,
+    strategy_class: Type[BaseStrategy],
+    engine_params: Dict[str, Any],
+    max_workers: int
+) -> Iterator[ProcessPoolExecutor]:
+    """
+    Start worker processes backtesting a strategy over one shared candle history.
+
+    The candles are placed in shared memory once; each worker attaches to
+    them and keeps a lazily evaluated indicator set over the whole history,
+    so an indicator is computed once per worker however many combinations
+    and windows read it. Submit evaluate_combinations or
+    backtest_combination to the yielded executor. Tasks not started when
+    the block raises are cancelled.
+
+    Args:
+        df: DataFrame with OHLCV data, bar times in a 'timestamp' column or the index
+        strategy_class: BaseStrategy subclass, created with its default parameters
+        engine_params: BacktestEngine arguments such as fees and slippage
+        max_workers: Number of worker processes
+
+    Yields:
+        Executor of the workers
+    """
+    times = df['timestamp'].to_numpy() if 'timestamp' in df.columns else df.index.to_numpy()
+    with SharedOHLCV({'history': df}) as ohlcv, ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(strategy_class, ohlcv.name, ohlcv.rows, times, engine_params)
+    ) as executor:
+        try:
+            yield executor
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
+def chunk_combinations(
+    strategy_class: Type[BaseStrategy],
+    combinations: List[Dict],
+    chunks: int
+) -> List[List[Dict]]:
+    """
+    Split combinations into about `chunks` work items, those requiring the same indicators together.
+
+    Args:
+        strategy_class: BaseStrategy subclass the combinations configure
+        combinations: Parameter dictionaries
+        chunks: Number of work items to aim for
+
+    Returns:
+        List of combination lists
+    """
+    def required_indicators(params: Dict) -> Tuple[str, ...]:
+        strategy = strategy_class()
+        strategy.set_parameters(**params)
+        return tuple(sorted(strategy.get_required_indicators()))
+
+    combinations = sorted(combinations, key=required_indicators)
+    size = max(-(-len(combinations) // max(chunks, 1)), 1)
+    return [combinations[i:i + size] for i in range(0, len(combinations), size)]
+
+
+class StrategyOptimizer:
+    """
+    Searches strategy parameters by backtesting combinations across a process pool.
+
+    The candle history is placed in shared memory once, and every worker
+    keeps one lazily evaluated indicator set over it, so an indicator such
+    as one EMA length is computed once per worker however many combinations
+    read it. Combinations are sorted by the indicators they require before
+    being split into chunks, so a chunk mostly reuses the same ones.
+
+    With `results_path`, each result is appended to a JSON lines file as
+    soon as it arrives, and combinations already in the file are not run
+    again, so an interrupted search resumes where it stopped. The file
+    starts with a fingerprint of the strategy class, candle history,
+    engine parameters and metric; a file written for another run is
+    refused rather than resumed.
+
+    Args:
+        strategy_class: BaseStrategy subclass to optimise, created with its default parameters
+        metric: BacktestResult.summary() key to maximise
+        results_path: JSON lines file keeping the results (in memory only if None)
+        max_workers: Number of worker processes (OPTIMIZER_MAX_WORKERS, one per CPU if None)
+        chunks_per_worker: Work items per worker, for load balancing
+        **engine_params: BacktestEngine arguments such as fees and slippage
+    """
+
+    def __init__(
+        self,
+        strategy_class: Type[BaseStrategy],
+        metric: str = 'total_return',
+        results_path: Optional[str] = None,
+        max_workers: Optional[int] = settings.OPTIMIZER_MAX_WORKERS,
+        chunks_per_worker: int = 4,
+        **engine_params
+    ):
+        self.strategy_class = strategy_class
+        self.metric = metric
+        self.results_path = results_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.engine_params = engine_params
+
+    def optimize(self, df: pd.DataFrame, combinations: Sequence[Dict]) -> pd.DataFrame:
+        """
+        Backtest every parameter combination over a candle history.
+
+        Args:
+            df: DataFrame with OHLCV data, bar times in a 'timestamp' column or the index
+            combinations: Parameter dictionaries, e.g. from grid_space or random_space
+
+        Returns:
+            DataFrame with one row per combination (its parameters and summary), best `metric` first
+        """
+        try:
+            combinations = list({_params_key(params): params for params in map(_plain, combinations)}.values())
+            fingerprint = _fingerprint(df, self.strategy_class, self.engine_params, self.metric)
+            results = self._load_results(fingerprint)
+            pending = [params for params in combinations if _params_key(params) not in results]
+            if len(pending) < len(combinations):
+                logger.info(f"Resuming optimisation, {len(combinations) - len(pending)} of {len(combinations)} combinations already evaluated")
+            if pending:
+                self._run(df, pending, results, fingerprint)
+
+            rows = [{**params, **results[_params_key(params)]} for params in combinations]
+            return pd.DataFrame(rows).sort_values(self.metric, ascending=False, ignore_index=True)
+
+        except Exception as e:
+            logger.error(f"Error optimising {self.strategy_class.__name__}: {str(e)}")
+            raise
+
+    def _load_results(self, fingerprint: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+        """Read the summaries already saved in results_path, by parameter key, checking its fingerprint."""
+        results = {}
+        if not self.results_path or not os.path.exists(self.results_path):
+            return results
+        saved = None
+        with open(self.results_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut short when a previous run was interrupted
+                    logger.warning(f"Skipping unreadable line in {self.results_path}")
+                    continue
+                if 'fingerprint' in record:
+                    saved = record['fingerprint']
+                else:
+                    results[_params_key(record['params'])] = record['summary']
+
+        if (saved is not None or results) and saved != fingerprint:
+            raise ValueError(
+                f"{self.results_path} holds results of another optimisation (strategy, candles, "
+                f"engine parameters or metric differ); use another results_path"
+            )
+        return results
+
+    def _run(
+        self,
+        df: pd.DataFrame,
+        pending: List[Dict],
+        results: Dict[str, Dict[str, float]],
+        fingerprint: Dict[str, Any]
+    ):
+        chunks = chunk_combinations(self.strategy_class, pending, self.max_workers * self.chunks_per_worker)
+
+        out = None
+        if self.results_path:
+            os.makedirs(os.path.dirname(self.results_path) or '.', exist_ok=True)
+            out = open(self.results_path, 'a+', encoding='utf-8')
+            # Start on a new line after a record cut short by an interruption
+            if out.tell():
+                out.seek(out.tell() - 1)
+                if out.read(1) != '\n':
+                    out.write('\n')
+            # A file without results (new, or its header cut short) gets the header
+            if not results:
+                out.write(json.dumps({'fingerprint': fingerprint}) + '\n')
+                out.flush()
+        try:
+            with backtest_pool(df, self.strategy_class, self.engine_params, self.max_workers) as executor:
+                futures = [executor.submit(evaluate_combinations, chunk) for chunk in chunks]
+                for done, future in enumerate(as_completed(futures), 1):
+                    for params, summary in future.result():
+                        results[_params_key(params)] = summary
+                        if out:
+                            out.write(json.dumps({'params': params, 'summary': summary}) + '\n')
+                    if out:
+                        out.flush()
+                    logger.info(f"Evaluated {done}/{len(chunks)} chunks of {self.strategy_class.__name__} parameters")
+        finally:
+            if out:
+                out.close()
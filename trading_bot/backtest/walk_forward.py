@@ -0,0 +1,227 @@
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+import pandas as pd
+from ..config.settings import settings
+from ..strategies.base_strategy import BaseStrategy
+from ..strategies.strategy_library import get_strategy
+from .engine import BacktestResult
+from .optimizer import backtest_combination, backtest_pool, chunk_combinations, evaluate_combinations
+
+logger = logging.getLogger(__name__)
+
+# Trade log columns proportional to the capital a fold starts with
+_CAPITAL_COLUMNS = ['quantity', 'fees', 'funding', 'pnl']
+
+
+def walk_forward_windows(
+    bars: int,
+    folds: int,
+    train_bars: Optional[int] = None,
+    test_bars: Optional[int] = None,
+    anchored: bool = False
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Split a history into walk-forward folds.
+
+    Each fold optimises on `train_bars` bars and tests on the `test_bars`
+    bars right after them. Folds step forward by `test_bars`, so the test
+    windows tile the end of the history without overlapping.
+
+    Args:
+        bars: Length of the history
+        folds: Number of folds
+        train_bars: In-sample bars per fold (three test windows if None)
+        test_bars: Out-of-sample bars per fold (the history split evenly if None)
+        anchored: Start every in-sample window at the first bar instead of rolling it
+
+    Returns:
+        List of (train_start, train_end, test_start, test_end) bar ranges
+    """
+    if test_bars is None:
+        test_bars = bars // (folds + 3) if train_bars is None else (bars - train_bars) // folds
+    if train_bars is None:
+        train_bars = 3 * test_bars
+    first_test = bars - folds * test_bars
+    if folds < 1 or test_bars < 1 or train_bars < 1 or first_test < train_bars:
+        raise ValueError(
+            f"{bars} bars are too few for {folds} folds of {train_bars} in-sample and {test_bars} out-of-sample bars"
+        )
+
+    windows = []
+    for fold in range(folds):
+        test_start = first_test + fold * test_bars
+        train_start = 0 if anchored else test_start - train_bars
+        windows.append((train_start, test_start, test_start, test_start + test_bars))
+    return windows
+
+
+class WalkForwardResult:
+    """
+    Outcome of a walk-forward evaluation.
+
+    Args:
+        folds: One row per fold with its window times, the chosen parameters,
+            their in-sample metric and the out-of-sample summary
+        out_of_sample: The out-of-sample backtests chained into one, each fold
+            starting with the equity the previous one ended with
+    """
+
+    def __init__(self, folds: pd.DataFrame, out_of_sample: BacktestResult):
+        self.folds = folds
+        self.out_of_sample = out_of_sample
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarise the out-of-sample performance.
+
+        Returns:
+            BacktestResult summary of the chained out-of-sample windows, plus
+            the number of folds and the fraction of them that were profitable
+        """
+        summary = self.out_of_sample.summary()
+        summary['folds'] = len(self.folds)
+        summary['profitable_folds'] = float((self.folds['total_return'] > 0).mean()) if len(self.folds) else 0.0
+        return summary
+
+
+class WalkForward:
+    """
+    Walk-forward evaluation of a strategy's parameters.
+
+    Every fold backtests each parameter combination on its in-sample
+    window, then backtests the combination with the best `metric` on the
+    out-of-sample window after it. Chained together, the out-of-sample
+    results show how the strategy would have done had it been re-tuned on
+    that schedule. With a single combination nothing is tuned and only
+    the out-of-sample windows run.
+
+    All folds share one backtest_pool. The candles go into shared memory
+    once, and each worker computes every indicator once over the whole
+    history and slices it for every window. The in-sample runs of all
+    folds are in flight together, and a fold's out-of-sample run starts as
+    soon as its in-sample results are in.
+
+    Args:
+        strategy: Strategy name (as accepted by get_strategy) or BaseStrategy subclass
+        folds: Number of folds
+        train_bars: In-sample bars per fold (see walk_forward_windows)
+        test_bars: Out-of-sample bars per fold (see walk_forward_windows)
+        anchored: Start every in-sample window at the first bar
+        metric: BacktestResult.summary() key to maximise in sample
+        max_workers: Number of worker processes (OPTIMIZER_MAX_WORKERS, one per CPU if None)
+        chunks_per_worker: In-sample work items per worker, for load balancing
+        **engine_params: BacktestEngine arguments such as fees and slippage
+    """
+
+    def __init__(
+        self,
+        strategy: Union[str, Type[BaseStrategy]],
+        folds: int = 10,
+        train_bars: Optional[int] = None,
+        test_bars: Optional[int] = None,
+        anchored: bool = False,
+        metric: str = 'total_return',
+        max_workers: Optional[int] = settings.OPTIMIZER_MAX_WORKERS,
+        chunks_per_worker: int = 4,
+        **engine_params
+    ):
+        self.strategy_class = type(get_strategy(strategy)) if isinstance(strategy, str) else strategy
+        self.folds = folds
+        self.train_bars = train_bars
+        self.test_bars = test_bars
+        self.anchored = anchored
+        self.metric = metric
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.engine_params = engine_params
+
+    def run(self, df: pd.DataFrame, combinations: Sequence[Dict] = ({},)) -> WalkForwardResult:
+        """
+        Walk a strategy forward over a candle history.
+
+        Args:
+            df: DataFrame with OHLCV data, bar times in a 'timestamp' column or the index
+            combinations: Parameter dictionaries to choose from in every fold,
+                e.g. from grid_space (the default parameters if only `{}`)
+
+        Returns:
+            WalkForwardResult with per-fold and chained out-of-sample results
+        """
+        try:
+            windows = walk_forward_windows(len(df), self.folds, self.train_bars, self.test_bars, self.anchored)
+            combinations = [dict(params) for params in combinations]
+            tuned = len(combinations) > 1
+
+            with backtest_pool(df, self.strategy_class, self.engine_params, self.max_workers) as executor:
+                in_sample = []
+                if tuned:
+                    chunks = chunk_combinations(
+                        self.strategy_class, combinations,
+                        max(self.max_workers * self.chunks_per_worker // len(windows), 1)
+                    )
+                    in_sample = [
+                        [executor.submit(evaluate_combinations, chunk, (train_start, train_end)) for chunk in chunks]
+                        for train_start, train_end, _, _ in windows
+                    ]
+
+                chosen, out_of_sample = [], []
+                for fold, (_, _, test_start, test_end) in enumerate(windows):
+                    if tuned:
+                        params, summary = max(
+                            (pair for future in in_sample[fold] for pair in future.result()),
+                            key=lambda pair: pair[1][self.metric]
+                        )
+                        chosen.append((params, summary[self.metric]))
+                        logger.info(f"Walk-forward fold {fold + 1}/{len(windows)} chose {params}")
+                    else:
+                        chosen.append((combinations[0], float('nan')))
+                    out_of_sample.append(executor.submit(backtest_combination, chosen[-1][0], (test_start, test_end)))
+                results = [future.result() for future in out_of_sample]
+
+            return self._combine(df, windows, chosen, results)
+
+        except Exception as e:
+            logger.error(f"Error walking {self.strategy_class.__name__} forward: {str(e)}")
+            raise
+
+    def _combine(
+        self,
+        df: pd.DataFrame,
+        windows: List[Tuple[int, int, int, int]],
+        chosen: List[Tuple[Dict, float]],
+        results: List[BacktestResult]
+    ) -> WalkForwardResult:
+        """Tabulate the folds and chain their out-of-sample results with compounding capital."""
+        times = pd.Index(df['timestamp']) if 'timestamp' in df.columns else df.index
+        initial_capital = results[0].initial_capital
+        capital = initial_capital
+        rows, equities, trades = [], [], []
+
+        for fold, ((train_start, train_end, test_start, test_end), (params, in_sample), result) in enumerate(zip(windows, chosen, results)):
+            rows.append({
+                'fold': fold,
+                'train_start': times[train_start],
+                'train_end': times[train_end - 1],
+                'test_start': times[test_start],
+                'test_end': times[test_end - 1],
+                **params,
+                f'in_sample_{self.metric}': in_sample,
+                **result.summary()
+            })
+
+            # Positions are sized from equity and every fold starts flat, so a
+            # fold run with other starting capital is this one scaled
+            scale = capital / result.initial_capital
+            equities.append(result.equity * scale)
+            fold_trades = result.trades.copy()
+            fold_trades[_CAPITAL_COLUMNS] *= scale
+            fold_trades.insert(0, 'fold', fold)
+            trades.append(fold_trades)
+            if len(result.equity):
+                capital = float(equities[-1].iloc[-1])
+
+        return WalkForwardResult(
+            pd.DataFrame(rows),
+            BacktestResult(pd.concat(equities), pd.concat(trades, ignore_index=True), initial_capital)
+        )
@@ -17,21 +17,74 @@ class Settings(BaseSettings):
     DEFAULT_TRADING_PAIRS: List[str] = [
         "BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"
     ]
+
+    # Market Data Storage
+    KLINE_STORE_ENABLED: bool = True
+    KLINE_STORE_DIR: str = os.path.join("data", "klines")
+    KLINE_COMPACT_DTYPES: bool = False  # float32 prices/volumes in kline DataFrames
+    BACKFILL_MAX_WORKERS: int = 8
+    BINANCE_REQUEST_WEIGHT_LIMIT: int = 2400
+    ASYNC_MAX_CONCURRENT_REQUESTS: int = 10
+
+    # Response cache lifetimes in seconds
+    CACHE_TTLS: Dict[str, float] = {
+        "ticker_price": 2.0,
+        "exchange_info": 3600.0
+    }
+
+    # Market Data Updates ("polling" re-fetches over REST, "stream" uses WebSocket kline streams)
+    MARKET_DATA_MODE: str = "polling"
+    BINANCE_STREAM_URL: str = "wss://fstream.binance.com/stream"
+    STREAM_RECONNECT_DELAY: float = 5.0
+    STREAM_RESAMPLE_FROM_BASE: bool = True  # derive every interval from one 1m stream per pair
+    ORDER_BOOK_ENABLED: bool = False  # maintain local order books from depth diff streams
+    ORDER_BOOK_SNAPSHOT_LIMIT: int = 1000
+    ORDER_BOOK_FEATURE_DEPTH: int = 10
+
+    # REST Client ("live", "record" to capture responses, "replay" to serve them offline)
+    REST_MODE: str = "live"
+    REST_RECORDING_PATH: str = os.path.join("data", "rest", "responses.jsonl")
+    REST_REPLAY_LATENCY: float = 0.0  # seconds added to every replayed call
+    REST_REPLAY_JITTER: float = 0.0  # upper bound of extra random latency in seconds
+    REST_REPLAY_ERROR_RATE: float = 0.0  # probability of an injected HTTP error
+    REST_REPLAY_SEED: Optional[int] = None
     
     # Technical Analysis Parameters
+    TA_BACKEND: str = "auto"  # 'talib', 'numba' (compiled kernels) or 'auto' (TA-Lib if installed)
+    TA_MAX_WORKERS: Optional[int] = None  # processes of calculate_indicators_parallel (one per CPU if None)
+    INDICATOR_CACHE_SIZE: int = 256  # indicator results kept per (symbol, interval, candle window)
+    TA_COMPACT_STORAGE: bool = False  # keep indicator results as float32/int8 arrays per category
     TA_INDICATORS: Dict[str, Dict] = {
         "SMA": {"periods": [20, 50, 200]},
         "EMA": {"periods": [12, 26, 50]},
         "RSI": {"period": 14},
         "MACD": {"fast": 12, "slow": 26, "signal": 9},
         "BB": {"period": 20, "std_dev": 2},
-        "ATR": {"period": 14}
+        "ATR": {"period": 14},
+        "PATTERNS": {"names": [
+            "DOJI", "HAMMER", "HANGING_MAN", "ENGULFING", "MORNING_STAR",
+            "EVENING_STAR", "THREE_WHITE_SOLDIERS", "THREE_BLACK_CROWS"
+        ]}
     }
 
     # Strategy Parameters
     DEFAULT_STRATEGY: str = "Dynamic Trend Rider"
     RISK_REWARD_RATIO: float = 2.0
     MAX_STOP_LOSS_PERCENTAGE: float = 2.0
+    STRATEGY_WEIGHTS: Dict[str, float] = {}  # vote weight by strategy name in ensemble consensus (1 if absent)
+    CONSENSUS_THRESHOLD: float = 0.5  # weighted mean vote (-1 to 1) needed for a BUY or SELL consensus
+
+    # Backtesting (fees, slippage and funding as fractions of notional)
+    BACKTEST_INITIAL_CAPITAL: float = 10000.0
+    BACKTEST_RISK_PER_TRADE: float = 0.01  # fraction of equity lost when a stop loss is hit
+    BACKTEST_LEVERAGE: float = 1.0  # cap on position notional relative to equity
+    BACKTEST_TAKER_FEE: float = 0.0005
+    BACKTEST_MAKER_FEE: float = 0.0002
+    BACKTEST_SLIPPAGE: float = 0.0002  # on market entries, signal exits and stop losses
+    BACKTEST_FUNDING_RATE: float = 0.0001  # per funding interval, paid by longs when positive
+    BACKTEST_FUNDING_INTERVAL_HOURS: int = 8
+    BACKTEST_INTRABAR_ORDER: str = "stop_first"  # 'stop_first', 'target_first' or 'ohlc'
+    OPTIMIZER_MAX_WORKERS: Optional[int] = None  # processes of the parameter optimizer (one per CPU if None)
 
     # AI Model Parameters
     GEMINI_MODEL_NAME: str = "gemini-1.5-flash"
@@ -0,0 +1,284 @@
+import asyncio
+import threading
+import logging
+from datetime import datetime
+from typing import Coroutine, Dict, List, Optional, Tuple
+import pandas as pd
+from binance.exceptions import BinanceAPIException
+from ..config.settings import settings
+from .kline_store import KlineStore, INTERVAL_MS
+from .kline_decoder import decode_klines, columns_to_dataframe, klines_to_dataframe
+from .rate_limiter import RequestWeightGovernor, request_governor
+from .cache import TTLCache
+from .rest_replay import create_async_client
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopThread:
+    """Event loop running on a daemon thread, for driving async code from synchronous callers."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the loop and block until it returns."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self):
+        """Stop the loop and wait for its thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AsyncBinanceConnector:
+    """
+    Asyncio counterpart of BinanceConnector.
+
+    All requests share the pooled HTTP session of a single AsyncClient. Use
+    `await AsyncBinanceConnector.create()` to build a connected instance and
+    `await connector.close()` to release the session.
+    """
+
+    def __init__(
+        self,
+        kline_store: Optional[KlineStore] = None,
+        governor: Optional[RequestWeightGovernor] = None,
+        cache: Optional[TTLCache] = None,
+        client=None
+    ):
+        self.client = client
+        self.governor = governor or request_governor
+        self.cache = cache or TTLCache()
+        self.kline_store = kline_store
+        if self.kline_store is None and settings.KLINE_STORE_ENABLED:
+            self.kline_store = KlineStore(settings.KLINE_STORE_DIR)
+
+    @classmethod
+    async def create(
+        cls,
+        kline_store: Optional[KlineStore] = None,
+        governor: Optional[RequestWeightGovernor] = None,
+        cache: Optional[TTLCache] = None,
+        client=None
+    ) -> 'AsyncBinanceConnector':
+        """Create a connector with an initialized client (or the given AsyncClient stand-in)."""
+        connector = cls(kline_store=kline_store, governor=governor, cache=cache, client=client)
+        if client is None:
+            await connector.initialize_client()
+        return connector
+
+    async def initialize_client(self):
+        """Initialize the async Binance client with API credentials."""
+        try:
+            self.client = await create_async_client()
+            logger.info(f"Successfully connected to Binance API (async, {settings.REST_MODE} mode)")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Binance client: {str(e)}")
+            raise
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self.client is not None:
+            await self.client.close_connection()
+            self.client = None
+
+    async def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch kline/candlestick data for a given symbol and interval.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            limit: Number of klines to fetch
+            start_time: Start time for historical data
+            end_time: End time for historical data
+
+        Returns:
+            DataFrame with OHLCV data
+        """
+        try:
+            if self.kline_store is not None and start_time is None and end_time is None and interval in INTERVAL_MS:
+                return await self._get_stored_klines(symbol, interval, limit)
+
+            klines = await self.governor.call_async(
+                self.client, 'futures_klines',
+                symbol=symbol,
+                interval=interval,
+                limit=limit,
+                startTime=int(start_time.timestamp() * 1000) if start_time else None,
+                endTime=int(end_time.timestamp() * 1000) if end_time else None
+            )
+            return klines_to_dataframe(klines, compact=settings.KLINE_COMPACT_DTYPES)
+
+        except BinanceAPIException as e:
+            logger.error(f"Binance API error while fetching klines: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching klines: {str(e)}")
+            raise
+
+    async def _get_stored_klines(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """Top up the stored series for symbol/interval and return its last `limit` candles."""
+        store = self.kline_store
+        start, page_size = store.top_up_request(symbol, interval, limit)
+        if start is None:
+            store.clear(symbol, interval)
+
+        while True:
+            klines = await self.governor.call_async(
+                self.client, 'futures_klines',
+                symbol=symbol,
+                interval=interval,
+                limit=page_size,
+                startTime=start
+            )
+            store.write(symbol, interval, decode_klines(klines))
+            if start is None or len(klines) < page_size:
+                break
+            start = int(klines[-1][0])
+
+        columns = store.load(symbol, interval, limit=limit)
+        if columns is None:
+            # Nothing stored: the exchange has no candles for this series
+            columns = decode_klines([])
+        return columns_to_dataframe(columns, compact=settings.KLINE_COMPACT_DTYPES)
+
+    async def get_klines_many(
+        self,
+        symbols: List[str],
+        intervals: List[str],
+        limit: int = 500,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[Tuple[str, str], Optional[pd.DataFrame]]:
+        """
+        Fetch klines for every symbol/interval pair concurrently.
+
+        Args:
+            symbols: Trading pair symbols
+            intervals: Kline intervals
+            limit: Number of klines to fetch per pair
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Dictionary mapping (symbol, interval) to OHLCV data, or None where the fetch failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.ASYNC_MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(symbol: str, interval: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                try:
+                    return await self.get_klines(symbol, interval, limit=limit)
+                except Exception:
+                    return None
+
+        keys = [(symbol, interval) for symbol in symbols for interval in intervals]
+        frames = await asyncio.gather(*(fetch(symbol, interval) for symbol, interval in keys))
+        return dict(zip(keys, frames))
+
+    async def get_ticker_price(self, symbol: str) -> float:
+        """Get current price for a symbol."""
+        return (await self.get_ticker_prices([symbol]))[symbol]
+
+    async def get_ticker_prices(self, symbols: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Get current prices for many symbols with one request per refresh window.
+
+        Args:
+            symbols: Trading pair symbols (all symbols if None)
+
+        Returns:
+            Dictionary mapping symbol to price
+        """
+        async def load():
+            tickers = await self.governor.call_async(self.client, 'futures_symbol_ticker')
+            return {ticker['symbol']: float(ticker['price']) for ticker in tickers}
+
+        try:
+            prices = await self.cache.get_or_load_async(('ticker_price',), settings.CACHE_TTLS['ticker_price'], load)
+            if symbols is None:
+                return dict(prices)
+            missing = [symbol for symbol in symbols if symbol not in prices]
+            if missing:
+                raise ValueError(f"Unknown symbols: {', '.join(missing)}")
+            return {symbol: prices[symbol] for symbol in symbols}
+        except Exception as e:
+            logger.error(f"Error fetching ticker prices: {str(e)}")
+            raise
+
+    async def get_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict:
+        """Get an order book depth snapshot (limit defaults to ORDER_BOOK_SNAPSHOT_LIMIT)."""
+        try:
+            return await self.governor.call_async(
+                self.client, 'futures_order_book',
+                symbol=symbol, limit=limit or settings.ORDER_BOOK_SNAPSHOT_LIMIT
+            )
+        except Exception as e:
+            logger.error(f"Error fetching order book: {str(e)}")
+            raise
+
+    async def get_account_balance(self) -> Dict:
+        """Get account balance information."""
+        try:
+            account = await self.governor.call_async(self.client, 'futures_account')
+            return {
+                'total_balance': float(account['totalWalletBalance']),
+                'unrealized_pnl': float(account['totalUnrealizedProfit']),
+                'available_balance': float(account['availableBalance'])
+            }
+        except Exception as e:
+            logger.error(f"Error fetching account balance: {str(e)}")
+            raise
+
+    async def get_position_info(self, symbol: Optional[str] = None) -> List[Dict]:
+        """Get position information for all or specific symbol."""
+        try:
+            if symbol:
+                return await self.governor.call_async(self.client, 'futures_position_information', symbol=symbol)
+            return await self.governor.call_async(self.client, 'futures_position_information')
+        except Exception as e:
+            logger.error(f"Error fetching position information: {str(e)}")
+            raise
+
+    async def get_exchange_info(self) -> Dict:
+        """Get exchange information including trading rules (cached for CACHE_TTLS['exchange_info'] seconds)."""
+        try:
+            return await self.cache.get_or_load_async(
+                ('exchange_info',),
+                settings.CACHE_TTLS['exchange_info'],
+                lambda: self.governor.call_async(self.client, 'futures_exchange_info')
+            )
+        except Exception as e:
+            logger.error(f"Error fetching exchange info: {str(e)}")
+            raise
+
+    async def get_symbol_info(self, symbol: str) -> Dict:
+        """Get the trading rules of one symbol from the cached exchange information."""
+        async def load():
+            return {info['symbol']: info for info in (await self.get_exchange_info())['symbols']}
+
+        symbols = await self.cache.get_or_load_async(
+            ('exchange_info', 'symbols'), settings.CACHE_TTLS['exchange_info'], load
+        )
+        if symbol not in symbols:
+            raise ValueError(f"Symbol '{symbol}' not found in exchange info")
+        return symbols[symbol]
+
+    def invalidate_cache(self, endpoint: Optional[str] = None):
+        """
+        Drop cached responses.
+
+        Args:
+            endpoint: 'ticker_price' or 'exchange_info' (everything if None)
+        """
+        self.cache.invalidate(endpoint)
@@ -0,0 +1,435 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+
+# Categories of the indicators computed by compute_batch_indicators
+BATCH_CATEGORIES = {
+    'ADX': 'trend', 'DI_plus': 'trend', 'DI_minus': 'trend',
+    'RSI': 'momentum', 'MACD': 'momentum', 'MACD_signal': 'momentum', 'MACD_hist': 'momentum',
+    'BB_upper': 'volatility', 'BB_middle': 'volatility', 'BB_lower': 'volatility', 'ATR': 'volatility',
+    'OBV': 'volume'
+}
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# TA-Lib's TA_IS_ZERO threshold
+_ZERO = 1e-14
+
+# The kernels take (symbols, bars) arrays whose rows start at their first
+# candle and follow TA-Lib's seeding, so every row matches the single-series
+# functions to within floating-point rounding. Internally they work on
+# time-major (bars, symbols) arrays: recursive indicators loop over bars
+# only, and each step is one contiguous vector operation across all symbols.
+
+
+def _time_major(x: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(x, dtype=np.float64).T)
+
+
+def _rolling_mean(xt: np.ndarray, n: int) -> np.ndarray:
+    """Mean over the trailing `n` bars from cumulative sums."""
+    out = np.full(xt.shape, np.nan)
+    if xt.shape[0] < n:
+        return out
+    # Offsetting series by their first value keeps the cumulative sums small
+    base = xt[0]
+    sums = np.cumsum(xt - base, axis=0)
+    out[n - 1] = sums[n - 1]
+    np.subtract(sums[n:], sums[:-n], out=out[n:])
+    out[n - 1:] /= n
+    out[n - 1:] += base
+    return out
+
+
+def _true_range(ht: np.ndarray, lt: np.ndarray, ct: np.ndarray) -> np.ndarray:
+    """True range from the second bar on (the first bar is NaN)."""
+    tr = np.empty(ht.shape)
+    tr[0] = np.nan
+    prev_close = ct[:-1]
+    np.subtract(ht[1:], lt[1:], out=tr[1:])
+    np.maximum(tr[1:], np.abs(prev_close - ht[1:]), out=tr[1:])
+    np.maximum(tr[1:], np.abs(prev_close - lt[1:]), out=tr[1:])
+    return tr
+
+
+def _seeded_recurrence(values: np.ndarray, periods: Sequence[int], seeds: Sequence[int], step: Callable) -> np.ndarray:
+    """
+    Run a recursive average over stacked series in one loop over bars.
+
+    Args:
+        values: (bars, series, symbols) time-major inputs
+        periods: Period of each series
+        seeds: Bar of each series' first value, the mean of the `period` bars ending there
+        step: step(previous, value, out, period) writing the next value into `out`
+
+    Returns:
+        (bars, series, symbols) array, NaN before each series' seed
+    """
+    out = np.full(values.shape, np.nan)
+    bars = values.shape[0]
+    period = np.asarray(periods, dtype=np.float64)[:, None]
+    seeding: Dict[int, List[int]] = {}
+    for i, seed in enumerate(seeds):
+        if seed < bars:
+            seeding.setdefault(seed, []).append(i)
+    if not seeding:
+        return out
+    first = min(seeding)
+    for t in range(first, bars):
+        if t > first:
+            step(out[t - 1], values[t], out[t], period)
+        for i in seeding.get(t, ()):
+            out[t, i] = values[t - periods[i] + 1:t + 1, i].sum(axis=0) / periods[i]
+    return out
+
+
+def _ema_step(previous: np.ndarray, value: np.ndarray, out: np.ndarray, period: np.ndarray):
+    np.subtract(value, previous, out=out)
+    out *= 2.0 / (period + 1)
+    out += previous
+
+
+def _wilder_step(previous: np.ndarray, value: np.ndarray, out: np.ndarray, period: np.ndarray):
+    np.multiply(previous, period - 1, out=out)
+    out += value
+    out /= period
+
+
+def _ema_stack(xt: np.ndarray, periods: Sequence[int], seeds: Optional[Sequence[int]] = None) -> np.ndarray:
+    """EMAs of several periods of one time-major series, as (bars, periods, symbols)."""
+    seeds = [n - 1 for n in periods] if seeds is None else seeds
+    stacked = np.broadcast_to(xt[:, None, :], (xt.shape[0], len(periods), xt.shape[1]))
+    return _seeded_recurrence(stacked, periods, seeds, _ema_step)
+
+
+def _wilder_stack(values: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """
+    Wilder's running averages of stacked time-major series (bars, series, symbols).
+
+    Each series' first value is at bar `period`, the mean of bars 1..period,
+    and each later value is (previous * (n - 1) + value) / n.
+    """
+    return _seeded_recurrence(values, periods, periods, _wilder_step)
+
+
+def _gains_losses(ct: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    diff = np.zeros(ct.shape)
+    np.subtract(ct[1:], ct[:-1], out=diff[1:])
+    return np.maximum(diff, 0.0), np.maximum(-diff, 0.0)
+
+
+def _rsi(gain: np.ndarray, loss: np.ndarray) -> np.ndarray:
+    total = gain + loss
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(np.abs(total) < _ZERO, 0.0, 100.0 * (gain / total))
+
+
+def _macd(fast_ema: np.ndarray, slow_ema: np.ndarray, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    line = fast_ema - slow_ema
+    signal_line = np.full(line.shape, np.nan)
+    signal_line[slow - 1:] = _ema_stack(line[slow - 1:], [signal])[:, 0]
+    line[np.isnan(signal_line)] = np.nan
+    return line, signal_line, line - signal_line
+
+
+def _bbands(ct: np.ndarray, period: int, nbdev: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    middle = _rolling_mean(ct, period)
+    # The variance is computed on series offset by their first value, like the sums
+    shifted = ct - ct[0]
+    mean = _rolling_mean(shifted, period)
+    variance = _rolling_mean(shifted * shifted, period)
+    variance -= mean * mean
+    with np.errstate(invalid='ignore'):
+        std = np.where(variance < _ZERO, 0.0, np.sqrt(np.maximum(variance, 0.0)))
+    std *= nbdev
+    return middle + std, middle, middle - std
+
+
+def _dmi(ht: np.ndarray, lt: np.ndarray, tr: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    bars, symbols = ht.shape
+    adx = np.full(ht.shape, np.nan)
+    plus_di = np.full(ht.shape, np.nan)
+    minus_di = np.full(ht.shape, np.nan)
+    if bars <= n:
+        return adx, plus_di, minus_di
+
+    # Raw directional movement and true range per bar, stacked to be smoothed together
+    raw = np.zeros((bars, 3, symbols))
+    diff_p = ht[1:] - ht[:-1]
+    diff_m = lt[:-1] - lt[1:]
+    raw[1:, 0] = np.where((diff_p > 0) & (diff_p > diff_m), diff_p, 0.0)
+    raw[1:, 1] = np.where((diff_m > 0) & (diff_p < diff_m), diff_m, 0.0)
+    raw[1:, 2] = tr[1:]
+
+    # Sums over the first n - 1 moves, then Wilder's x - x / n + value
+    smoothed = np.empty((bars, 3, symbols))
+    smoothed[n - 1] = raw[1:n].sum(axis=0)
+    decay = np.empty((3, symbols))
+    for t in range(n, bars):
+        previous, current = smoothed[t - 1], smoothed[t]
+        np.divide(previous, n, out=decay)
+        np.subtract(previous, decay, out=current)
+        current += raw[t]
+    plus_dm, minus_dm, tr = smoothed[n:, 0], smoothed[n:, 1], smoothed[n:, 2]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        has_range = np.abs(tr) >= _ZERO
+        plus_di[n:] = np.where(has_range, 100.0 * (plus_dm / tr), 0.0)
+        minus_di[n:] = np.where(has_range, 100.0 * (minus_dm / tr), 0.0)
+        total = minus_di[n:] + plus_di[n:]
+        has_dx = has_range & (np.abs(total) >= _ZERO)
+        dx = np.where(has_dx, 100.0 * (np.abs(minus_di[n:] - plus_di[n:]) / total), 0.0)
+
+    # DX of bars without directional movement is skipped, as in TA-Lib
+    first = 2 * n - 1
+    if bars > first:
+        adx[first] = dx[:n].sum(axis=0) / n
+        step = np.empty(symbols)
+        for t in range(first + 1, bars):
+            previous, current = adx[t - 1], adx[t]
+            np.multiply(previous, n - 1, out=step)
+            step += dx[t - n]
+            step /= n
+            np.copyto(current, previous)
+            np.copyto(current, step, where=has_dx[t - n])
+    return adx, plus_di, minus_di
+
+
+def _obv(ct: np.ndarray, vt: np.ndarray) -> np.ndarray:
+    signed = vt.copy()
+    signed[1:] *= np.sign(ct[1:] - ct[:-1])
+    return np.cumsum(signed, axis=0)
+
+
+def batch_sma(x: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average of every row."""
+    return _rolling_mean(_time_major(x), period).T
+
+
+def batch_ema(x: np.ndarray, period: int, seed_at: Optional[int] = None) -> np.ndarray:
+    """
+    Exponential moving average of every row, seeded with the SMA of the first window.
+
+    Args:
+        x: (symbols, bars) values
+        period: EMA period
+        seed_at: Bar of the first output (TA-Lib's MACD seeds the fast EMA on
+            the slow EMA's first bar)
+    """
+    seed_at = period - 1 if seed_at is None else seed_at
+    return _ema_stack(_time_major(x), [period], [seed_at])[:, 0].T
+
+
+def batch_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's RSI of every row; the first value is at bar `period`."""
+    averages = _wilder_stack(np.stack(_gains_losses(_time_major(close)), axis=1), [period, period])
+    return _rsi(averages[:, 0], averages[:, 1]).T
+
+
+def batch_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's average true range of every row; the first value is at bar `period`."""
+    tr = _true_range(_time_major(high), _time_major(low), _time_major(close))
+    return _wilder_stack(tr[:, None, :], [period])[:, 0].T
+
+
+def batch_bbands(close: np.ndarray, period: int = 20, nbdev: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands of every row around the SMA, with the population standard deviation.
+
+    Returns:
+        Tuple of (upper, middle, lower) arrays
+    """
+    return tuple(band.T for band in _bbands(_time_major(close), period, nbdev))
+
+
+def batch_macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD of every row; all three outputs start at bar slow + signal - 2.
+
+    Returns:
+        Tuple of (macd, signal, histogram) arrays
+    """
+    if slow < fast:
+        fast, slow = slow, fast
+    emas = _ema_stack(_time_major(close), [fast, slow], [slow - 1, slow - 1])
+    return tuple(output.T for output in _macd(emas[:, 0], emas[:, 1], slow, signal))
+
+
+def batch_dmi(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ADX, +DI and -DI of every row from one shared Wilder smoothing of TR and DM.
+
+    +DI/-DI start at bar `period`, ADX at bar 2 * period - 1.
+
+    Returns:
+        Tuple of (adx, plus_di, minus_di) arrays
+    """
+    ht, lt = _time_major(high), _time_major(low)
+    tr = _true_range(ht, lt, _time_major(close))
+    return tuple(output.T for output in _dmi(ht, lt, tr, period))
+
+
+def batch_obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """On-balance volume of every row, starting from the first bar's volume."""
+    return _obv(_time_major(close), _time_major(volume)).T
+
+
+def _leading_gaps(arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """Count the bars before each row's first complete candle."""
+    valid = np.logical_and.reduce([~np.isnan(a) for a in arrays])
+    return np.where(valid.any(axis=1), valid.argmax(axis=1), valid.shape[1])
+
+
+def _shift_rows(x: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Shift each row left by its offset (right for negative offsets), filling with NaN."""
+    bars = x.shape[1]
+    index = np.arange(bars)[None, :] + offsets[:, None]
+    inside = (index >= 0) & (index < bars)
+    shifted = np.take_along_axis(x, np.clip(index, 0, bars - 1), axis=1)
+    shifted[~inside] = np.nan
+    return shifted
+
+
+class BatchIndicators:
+    """
+    Indicators of a whole symbol universe as (symbols, bars) arrays.
+
+    `result['RSI']` is the 2-D array of one indicator, `result.latest('RSI')`
+    its last bar per symbol, and `result.symbol('BTCUSDT')` a view of one
+    symbol's rows arranged by category like calculate_all_indicators.
+    """
+
+    def __init__(self, symbols: Sequence[str], values: Dict[str, np.ndarray]):
+        self.symbols = list(symbols)
+        self.values = values
+        self._rows = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def names(self) -> List[str]:
+        return list(self.values)
+
+    def latest(self, name: str) -> Dict[str, float]:
+        """Get an indicator's value on the last bar for every symbol."""
+        return dict(zip(self.symbols, self.values[name][:, -1].tolist()))
+
+    def symbol(self, symbol: str) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Get one symbol's indicators by category.
+
+        Returns:
+            Dictionary mapping categories to {name: 1-D view into the batch arrays}
+        """
+        row = self._rows[symbol]
+        indicators: Dict[str, Dict[str, np.ndarray]] = {}
+        for name, values in self.values.items():
+            category = 'trend' if name.startswith(('SMA_', 'EMA_')) else BATCH_CATEGORIES[name]
+            indicators.setdefault(category, {})[name] = values[row]
+        return indicators
+
+
+def compute_batch_indicators(
+    symbols: Sequence[str],
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    config: Optional[Dict[str, Dict]] = None
+) -> BatchIndicators:
+    """
+    Compute the core indicators of many symbols at once.
+
+    Rows are aligned on their last bar; a symbol with a shorter history is
+    padded with NaN at the start, and its indicators warm up from its own
+    first candle.
+
+    Args:
+        symbols: Symbol of each row
+        high, low, close, volume: (symbols, bars) arrays
+        config: Indicator parameters (settings.TA_INDICATORS layout)
+
+    Returns:
+        BatchIndicators with SMA/EMA per configured period, RSI, MACD,
+        Bollinger Bands, ATR, ADX/DI and OBV
+    """
+    config = config or settings.TA_INDICATORS
+    inputs = [np.asarray(a, dtype=np.float64) for a in (high, low, close, volume)]
+    if any(a.ndim != 2 or a.shape != inputs[0].shape for a in inputs) or inputs[0].shape[0] != len(symbols):
+        raise ValueError("OHLCV arrays must all be shaped (symbols, bars)")
+
+    gaps = _leading_gaps(inputs)
+    shifted = bool(gaps.any())
+    if shifted:
+        inputs = [_shift_rows(a, gaps) for a in inputs]
+    ht, lt, ct, vt = (_time_major(a) for a in inputs)
+
+    values: Dict[str, np.ndarray] = {}
+    for period in config['SMA']['periods']:
+        values[f'SMA_{period}'] = _rolling_mean(ct, period)
+
+    # Every EMA, including MACD's two, runs in one loop over bars
+    ema_periods = sorted(set(config['SMA']['periods']) | set(config['EMA']['periods']))
+    fast, slow = sorted((config['MACD']['fast'], config['MACD']['slow']))
+    emas = _ema_stack(ct, ema_periods + [fast, slow], [n - 1 for n in ema_periods] + [slow - 1, slow - 1])
+    for i, period in enumerate(ema_periods):
+        values[f'EMA_{period}'] = emas[:, i]
+    values['MACD'], values['MACD_signal'], values['MACD_hist'] = _macd(
+        emas[:, -2], emas[:, -1], slow, config['MACD']['signal']
+    )
+
+    # So do RSI's average gain and loss and the ATR
+    rsi_period, atr_period = config['RSI']['period'], config['ATR']['period']
+    tr = _true_range(ht, lt, ct)
+    averages = _wilder_stack(np.stack(_gains_losses(ct) + (tr,), axis=1), [rsi_period, rsi_period, atr_period])
+    values['RSI'] = _rsi(averages[:, 0], averages[:, 1])
+    values['ATR'] = averages[:, 2]
+
+    values['ADX'], values['DI_plus'], values['DI_minus'] = _dmi(ht, lt, tr, 14)
+    values['BB_upper'], values['BB_middle'], values['BB_lower'] = _bbands(
+        ct, config['BB']['period'], config['BB']['std_dev']
+    )
+    values['OBV'] = _obv(ct, vt)
+
+    # Back to (symbols, bars): shifted copies, or transposed views
+    if shifted:
+        values = {name: _shift_rows(array.T, -gaps) for name, array in values.items()}
+    else:
+        values = {name: array.T for name, array in values.items()}
+    return BatchIndicators(symbols, values)
+
+
+def stack_frames(
+    frames: Dict[str, pd.DataFrame],
+    bars: Optional[int] = None,
+    columns: Sequence[str] = OHLCV_COLUMNS
+) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """
+    Stack per-symbol kline DataFrames into (symbols, bars) OHLCV arrays.
+
+    Frames are aligned on their last candle, so they should end on the same
+    open time; shorter frames are padded with NaN at the start.
+
+    Args:
+        frames: DataFrames with OHLCV columns by symbol
+        bars: Number of trailing bars to keep (the longest frame if None)
+        columns: Columns to stack
+
+    Returns:
+        Tuple of (symbols, {column: 2-D array})
+    """
+    symbols = [symbol for symbol, df in frames.items() if df is not None]
+    if bars is None:
+        bars = max((len(frames[symbol]) for symbol in symbols), default=0)
+    arrays = {column: np.full((len(symbols), bars), np.nan) for column in columns}
+    for row, symbol in enumerate(symbols):
+        df = frames[symbol]
+        take = min(len(df), bars)
+        if take:
+            for column, array in arrays.items():
+                array[row, bars - take:] = df[column].to_numpy(dtype=np.float64)[-take:]
+    return symbols, arrays
@@ -1,26 +1,52 @@
-from binance.client import Client
 from binance.exceptions import BinanceAPIException
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 from ..config.settings import settings
+from .kline_store import KlineStore, INTERVAL_MS
+from .kline_decoder import decode_klines, columns_to_dataframe, klines_to_dataframe
+from .kline_backfill import KlineBackfill
+from .rate_limiter import RequestWeightGovernor, request_governor
+from .cache import TTLCache
+from .async_binance_connector import AsyncBinanceConnector, AsyncLoopThread
+from .rest_replay import ReplayClient, create_client
 
 logger = logging.getLogger(__name__)
 
 class BinanceConnector:
-    def __init__(self):
-        self.client = None
-        self.initialize_client()
+    def __init__(
+        self,
+        kline_store: Optional[KlineStore] = None,
+        governor: Optional[RequestWeightGovernor] = None,
+        cache: Optional[TTLCache] = None,
+        client=None
+    ):
+        """
+        Args:
+            kline_store: Local kline store (defaults to KLINE_STORE_DIR when enabled)
+            governor: Request-weight governor (defaults to the shared one)
+            cache: Response cache
+            client: python-binance Client or a stand-in such as ReplayClient
+                (defaults to the client selected by REST_MODE)
+        """
+        self.client = client
+        self.governor = governor or request_governor
+        self.cache = cache or TTLCache()
+        self._async_loop = None
+        self._async_connector = None
+        self.kline_store = kline_store
+        if self.kline_store is None and settings.KLINE_STORE_ENABLED:
+            self.kline_store = KlineStore(settings.KLINE_STORE_DIR)
+        if self.client is None:
+            self.initialize_client()
 
     def initialize_client(self):
         """Initialize the Binance client with API credentials."""
         try:
-            self.client = Client(
-                settings.BINANCE_API_KEY,
-                settings.BINANCE_API_SECRET
-            )
-            logger.info("Successfully connected to Binance API")
+            self.client = create_client()
+            logger.info(f"Successfully connected to Binance API ({settings.REST_MODE} mode)")
         except Exception as e:
             logger.error(f"Failed to initialize Binance client: {str(e)}")
             raise
@@ -35,6 +61,9 @@ class BinanceConnector:
     ) -> pd.DataFrame:
         """
         Fetch kline/candlestick data for a given symbol and interval.
+
+        Requests for the most recent candles are served from the local kline
+        store, which is topped up with candles newer than the last stored one.
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
@@ -47,49 +76,192 @@ class BinanceConnector:
             DataFrame with OHLCV data
         """
         try:
-            klines = self.client.futures_klines(
+            if self.kline_store is not None and start_time is None and end_time is None and interval in INTERVAL_MS:
+                return self._get_stored_klines(symbol, interval, limit)
+
+            klines = self.governor.call(
+                self.client, 'futures_klines',
                 symbol=symbol,
                 interval=interval,
                 limit=limit,
                 startTime=int(start_time.timestamp() * 1000) if start_time else None,
                 endTime=int(end_time.timestamp() * 1000) if end_time else None
             )
+
+            # Decode straight into typed columns
+            return klines_to_dataframe(klines, compact=settings.KLINE_COMPACT_DTYPES)
             
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+        except BinanceAPIException as e:
+            logger.error(f"Binance API error while fetching klines: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching klines: {str(e)}")
+            raise
+
+    def _get_stored_klines(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """Top up the stored series for symbol/interval and return its last `limit` candles."""
+        store = self.kline_store
+        start, page_size = store.top_up_request(symbol, interval, limit)
+        if start is None:
+            store.clear(symbol, interval)
+
+        while True:
+            klines = self.governor.call(
+                self.client, 'futures_klines',
+                symbol=symbol,
+                interval=interval,
+                limit=page_size,
+                startTime=start
+            )
+            store.write(symbol, interval, decode_klines(klines))
+            if start is None or len(klines) < page_size:
+                break
+            start = int(klines[-1][0])
+
+        columns = store.load(symbol, interval, limit=limit)
+        if columns is None:
+            # Nothing stored: the exchange has no candles for this series
+            columns = decode_klines([])
+        return columns_to_dataframe(columns, compact=settings.KLINE_COMPACT_DTYPES)
+
+    def get_klines_many(
+        self,
+        symbols: List[str],
+        intervals: List[str],
+        limit: int = 500
+    ) -> Dict[Tuple[str, str], Optional[pd.DataFrame]]:
+        """
+        Fetch klines for every symbol/interval pair concurrently.
+
+        Requests run on a background event loop through the async connector,
+        with at most ASYNC_MAX_CONCURRENT_REQUESTS in flight.
+        
+        Args:
+            symbols: Trading pair symbols
+            intervals: Kline intervals
+            limit: Number of klines to fetch per pair
             
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        Returns:
+            Dictionary mapping (symbol, interval) to OHLCV data, or None where the fetch failed
+        """
+        if self._async_connector is None:
+            self._async_loop = AsyncLoopThread()
+            self._async_connector = self._async_loop.run(AsyncBinanceConnector.create(
+                kline_store=self.kline_store,
+                governor=self.governor,
+                cache=self.cache,
+                client=self.client.to_async() if isinstance(self.client, ReplayClient) else None
+            ))
+        return self._async_loop.run(self._async_connector.get_klines_many(symbols, intervals, limit=limit))
+
+    def get_historical_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        to_store: bool = False
+    ) -> pd.DataFrame:
+        """
+        Fetch every candle in a time range, paginating beyond the per-request limit.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            start_time: Start time for historical data
+            end_time: End time for historical data (defaults to now)
+            to_store: Stream the candles into the kline store instead of memory
             
-            # Convert string values to float
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-                
+        Returns:
+            DataFrame with OHLCV data for the whole range
+        """
+        try:
+            start_ms = int(start_time.timestamp() * 1000)
+            end_ms = int((end_time or datetime.now()).timestamp() * 1000)
+            backfill = KlineBackfill(self.client, governor=self.governor)
+            if not to_store:
+                return backfill.fetch_dataframe(symbol, interval, start_ms, end_ms)
+            if self.kline_store is None:
+                raise ValueError("Kline store is disabled")
+
+            backfill.fetch_to_store(self.kline_store, symbol, interval, start_ms, end_ms)
+            stored = self.kline_store.open_columns(symbol, interval)
+            if stored is None:
+                # No candles in the range, e.g. before the listing date
+                return columns_to_dataframe(decode_klines([]))
+            first = int(np.searchsorted(stored['timestamp'], start_ms - start_ms % INTERVAL_MS[interval]))
+            last = int(np.searchsorted(stored['timestamp'], end_ms, side='right'))
+            df = columns_to_dataframe({col: np.array(values[first:last]) for col, values in stored.items()})
+            del stored
             return df
-            
+
         except BinanceAPIException as e:
-            logger.error(f"Binance API error while fetching klines: {str(e)}")
+            logger.error(f"Binance API error while backfilling klines: {str(e)}")
             raise
         except Exception as e:
-            logger.error(f"Error fetching klines: {str(e)}")
+            logger.error(f"Error backfilling klines: {str(e)}")
             raise
 
     def get_ticker_price(self, symbol: str) -> float:
         """Get current price for a symbol."""
+        return self.get_ticker_prices([symbol])[symbol]
+
+    def get_ticker_prices(self, symbols: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Get current prices for many symbols with one request per refresh window.
+
+        Prices of all symbols are fetched from the all-symbols ticker endpoint
+        and cached for CACHE_TTLS['ticker_price'] seconds.
+        
+        Args:
+            symbols: Trading pair symbols (all symbols if None)
+            
+        Returns:
+            Dictionary mapping symbol to price
+        """
         try:
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            return float(ticker['price'])
+            prices = self.cache.get_or_load(
+                ('ticker_price',),
+                settings.CACHE_TTLS['ticker_price'],
+                lambda: {
+                    ticker['symbol']: float(ticker['price'])
+                    for ticker in self.governor.call(self.client, 'futures_symbol_ticker')
+                }
+            )
+            if symbols is None:
+                return dict(prices)
+            missing = [symbol for symbol in symbols if symbol not in prices]
+            if missing:
+                raise ValueError(f"Unknown symbols: {', '.join(missing)}")
+            return {symbol: prices[symbol] for symbol in symbols}
         except Exception as e:
-            logger.error(f"Error fetching ticker price: {str(e)}")
+            logger.error(f"Error fetching ticker prices: {str(e)}")
+            raise
+
+    def get_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict:
+        """
+        Get an order book depth snapshot.
+        
+        Args:
+            symbol: Trading pair symbol
+            limit: Number of levels per side (defaults to ORDER_BOOK_SNAPSHOT_LIMIT)
+            
+        Returns:
+            Dictionary with lastUpdateId, bids and asks
+        """
+        try:
+            return self.governor.call(
+                self.client, 'futures_order_book',
+                symbol=symbol, limit=limit or settings.ORDER_BOOK_SNAPSHOT_LIMIT
+            )
+        except Exception as e:
+            logger.error(f"Error fetching order book: {str(e)}")
             raise
 
     def get_account_balance(self) -> Dict:
         """Get account balance information."""
         try:
-            account = self.client.futures_account()
+            account = self.governor.call(self.client, 'futures_account')
             return {
                 'total_balance': float(account['totalWalletBalance']),
                 'unrealized_pnl': float(account['totalUnrealizedProfit']),
@@ -102,16 +274,40 @@ class BinanceConnector:
     def get_position_info(self, symbol: Optional[str] = None) -> List[Dict]:
         """Get position information for all or specific symbol."""
         try:
-            positions = self.client.futures_position_information(symbol=symbol) if symbol else self.client.futures_position_information()
+            positions = self.governor.call(self.client, 'futures_position_information', symbol=symbol) if symbol else self.governor.call(self.client, 'futures_position_information')
             return positions
         except Exception as e:
             logger.error(f"Error fetching position information: {str(e)}")
             raise
 
     def get_exchange_info(self) -> Dict:
-        """Get exchange information including trading rules."""
+        """Get exchange information including trading rules (cached for CACHE_TTLS['exchange_info'] seconds)."""
         try:
-            return self.client.futures_exchange_info()
+            return self.cache.get_or_load(
+                ('exchange_info',),
+                settings.CACHE_TTLS['exchange_info'],
+                lambda: self.governor.call(self.client, 'futures_exchange_info')
+            )
         except Exception as e:
             logger.error(f"Error fetching exchange info: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+    def get_symbol_info(self, symbol: str) -> Dict:
+        """Get the trading rules of one symbol from the cached exchange information."""
+        symbols = self.cache.get_or_load(
+            ('exchange_info', 'symbols'),
+            settings.CACHE_TTLS['exchange_info'],
+            lambda: {info['symbol']: info for info in self.get_exchange_info()['symbols']}
+        )
+        if symbol not in symbols:
+            raise ValueError(f"Symbol '{symbol}' not found in exchange info")
+        return symbols[symbol]
+
+    def invalidate_cache(self, endpoint: Optional[str] = None):
+        """
+        Drop cached responses.
+        
+        Args:
+            endpoint: 'ticker_price' or 'exchange_info' (everything if None)
+        """
+        self.cache.invalidate(endpoint) 
\ No newline at end of file
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe cache whose entries expire after a per-entry time to live.
+
+    Keys are tuples whose first element names the endpoint, so all entries of
+    an endpoint can be invalidated at once.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        # In-flight async loads by event loop and key
+        self._loads: Dict[Tuple, asyncio.Task] = {}
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Get a cached value, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return default
+            return entry[1]
+
+    def set(self, key: Tuple, value: Any, ttl: float):
+        """Cache a value for `ttl` seconds."""
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+
+    def get_or_load(self, key: Tuple, ttl: float, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, calling `loader` to refresh it when missing or expired.
+
+        Concurrent callers missing on the same key share a single load.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, missing)
+            if value is missing:
+                value = loader()
+                self.set(key, value, ttl)
+            return value
+
+    async def get_or_load_async(self, key: Tuple, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value, awaiting `loader()` to refresh it when missing or expired.
+
+        Concurrent callers on the same event loop missing on the same key
+        share a single load; a caller being cancelled does not cancel it.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        load_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            load = self._loads.get(load_key)
+            if load is None:
+                load = asyncio.ensure_future(self._load_async(load_key, ttl, loader))
+                self._loads[load_key] = load
+        return await asyncio.shield(load)
+
+    async def _load_async(self, load_key: Tuple, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+            self.set(load_key[1], value, ttl)
+            return value
+        finally:
+            with self._lock:
+                self._loads.pop(load_key, None)
+
+    def invalidate(self, endpoint: Optional[Hashable] = None):
+        """
+        Drop cached entries.
+
+        Args:
+            endpoint: Endpoint name whose entries to drop (all entries if None)
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == endpoint]:
+                    del self._entries[key]
+
+
+class LRUCache:
+    """
+    Thread-safe cache holding at most `max_entries` entries, evicting the least recently used.
+
+    Counts hits and misses, and concurrent callers missing on the same key
+    share a single load.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value and mark it as recently used, or `default` if it is missing."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entries beyond `max_entries`."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, calling `loader` to compute it when missing.
+
+        Concurrent callers missing on the same key share a single load, and
+        count as one miss and as hits for the others.
+        """
+        missing = object()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, missing)
+            if value is not missing:
+                with self._lock:
+                    self.hits += 1
+                return value
+            with self._lock:
+                self.misses += 1
+            try:
+                value = loader()
+                self.set(key, value)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit and miss counts and the number of cached entries."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def clear(self):
+        """Drop all entries (the counters are kept)."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,366 @@
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+# TA-Lib's candle settings: (range, averaging period, factor). The average
+# of a setting at a bar is `factor` times the mean range of the `period`
+# bars before it, or the bar's own range when the period is 0.
+CANDLE_SETTINGS = {
+    'BodyLong': ('real_body', 10, 1.0),
+    'BodyShort': ('real_body', 10, 1.0),
+    'BodyDoji': ('high_low', 10, 0.1),
+    'ShadowLong': ('real_body', 0, 1.0),
+    'ShadowVeryShort': ('high_low', 10, 0.1),
+    'Near': ('high_low', 5, 0.2),
+    'Far': ('high_low', 5, 0.6)
+}
+
+# Default penetration of the morning and evening star into the first real body
+STAR_PENETRATION = 0.3
+
+
+def _lag(x: np.ndarray, periods: int) -> np.ndarray:
+    """Shift along the bar (last) axis, padding with NaN (False for flags)."""
+    if not periods:
+        return x
+    shifted = np.full(x.shape, False if x.dtype == bool else np.nan)
+    shifted[..., periods:] = x[..., :-periods]
+    return shifted
+
+
+def _mean_before(x: np.ndarray, period: int, start: int) -> np.ndarray:
+    """
+    Mean of the `period` bars before each bar from `start` on, NaN where any of them is missing.
+
+    Like TA-Lib, the sum is seeded at `start` and then updated by adding the
+    newest and removing the oldest bar, in the same order, so signals agree
+    with it even on ties between tick-rounded prices.
+    """
+    start = max(start, period)
+    out = np.full(x.shape, np.nan)
+    bars = x.shape[-1]
+    if bars <= start:
+        return out
+    missing = np.isnan(x)
+    incomplete = missing.any()
+    if incomplete:
+        x = np.where(missing, 0.0, x)
+    steps = np.empty(x.shape[:-1] + (bars - start,))
+    steps[..., 0] = np.add.accumulate(x[..., start - period:start], axis=-1)[..., -1]
+    np.subtract(x[..., start:bars - 1], x[..., start - period:bars - 1 - period], out=steps[..., 1:])
+    out[..., start:] = np.add.accumulate(steps, axis=-1) / period
+    if incomplete:
+        gaps = np.zeros(x.shape[:-1] + (bars + 1,), dtype=np.int64)
+        np.cumsum(missing, axis=-1, out=gaps[..., 1:])
+        out[..., start:][gaps[..., start:bars] != gaps[..., start - period:bars - period]] = np.nan
+    return out
+
+
+class Candles:
+    """
+    Body and shadow geometry of a candle series, shared by every pattern.
+
+    Arrays are 1-D (bars) or 2-D (symbols, bars). Shifted arrays are
+    computed once per shift, setting averages once per setting and first bar.
+    """
+
+    def __init__(self, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.open = np.asarray(open_, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.body_top = np.maximum(self.open, self.close)
+        self.body_bottom = np.minimum(self.open, self.close)
+        self.real_body = self.body_top - self.body_bottom
+        self.high_low = self.high - self.low
+        self.upper_shadow = self.high - self.body_top
+        self.lower_shadow = self.body_bottom - self.low
+        self.white = self.close >= self.open
+        self.black = self.close < self.open
+        self._averages: Dict[Tuple[str, int], np.ndarray] = {}
+        self._lagged: Dict[Tuple[str, int, int], np.ndarray] = {}
+        self._shifted: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def prev(self, name: str, periods: int) -> np.ndarray:
+        """Get an attribute (e.g., 'close', 'white') as of `periods` bars ago."""
+        key = (name, periods)
+        shifted = self._shifted.get(key)
+        if shifted is None:
+            shifted = self._shifted[key] = _lag(getattr(self, name), periods)
+        return shifted
+
+    def average(self, setting: str, lag: int = 0, start: int = 0) -> np.ndarray:
+        """
+        Average of a candle setting as of `lag` bars ago.
+
+        Args:
+            setting: Key of CANDLE_SETTINGS
+            lag: Number of bars back the average is taken
+            start: First bar the pattern is evaluated on (its lookback)
+        """
+        key = (setting, lag, start)
+        lagged = self._lagged.get(key)
+        if lagged is None:
+            first = (setting, start - lag)
+            average = self._averages.get(first)
+            if average is None:
+                source, period, factor = CANDLE_SETTINGS[setting]
+                ranges = getattr(self, source)
+                average = factor * (_mean_before(ranges, period, start - lag) if period else ranges)
+                self._averages[first] = average
+            lagged = self._lagged[key] = _lag(average, lag)
+        return lagged
+
+
+def _signal(condition: np.ndarray, value: int) -> np.ndarray:
+    return np.where(condition, value, 0).astype(np.int32)
+
+
+def _doji(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    return _signal(c.real_body <= average('BodyDoji'), 100)
+
+
+def _small_body_long_lower_shadow(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    return (
+        (c.real_body < average('BodyShort'))
+        & (c.lower_shadow > average('ShadowLong'))
+        & (c.upper_shadow < average('ShadowVeryShort'))
+    )
+
+
+def _hammer(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    near_prior_low = c.body_bottom <= c.prev('low', 1) + average('Near', 1)
+    return _signal(_small_body_long_lower_shadow(c, average) & near_prior_low, 100)
+
+
+def _hanging_man(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    near_prior_high = c.body_bottom >= c.prev('high', 1) - average('Near', 1)
+    return _signal(_small_body_long_lower_shadow(c, average) & near_prior_high, -100)
+
+
+def _engulfing(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    prev_open, prev_close = c.prev('open', 1), c.prev('close', 1)
+    prev_white, prev_black = c.prev('white', 1), c.prev('black', 1)
+    bullish = c.white & prev_black & (
+        ((c.close >= prev_open) & (c.open < prev_close)) | ((c.close > prev_open) & (c.open <= prev_close))
+    )
+    bearish = c.black & prev_white & (
+        ((c.open >= prev_close) & (c.close < prev_open)) | ((c.open > prev_close) & (c.close <= prev_open))
+    )
+    # A body sharing an end with the previous one only engulfs it weakly
+    strength = np.where((c.open != prev_close) & (c.close != prev_open), 100, 80)
+    return (np.where(bullish, strength, 0) - np.where(bearish, strength, 0)).astype(np.int32)
+
+
+def _star(c: Candles, average: Callable[..., np.ndarray], bullish: bool, penetration: float) -> np.ndarray:
+    first_body = c.prev('real_body', 2)
+    first_close = c.prev('close', 2)
+    long_first = first_body > average('BodyLong', 2)
+    short_second = c.prev('real_body', 1) <= average('BodyShort', 1)
+    third_longer = c.real_body > average('BodyShort')
+    if bullish:
+        condition = (
+            long_first & c.prev('black', 2) & short_second
+            & (c.prev('body_top', 1) < c.prev('body_bottom', 2))
+            & third_longer & c.white
+            & (c.close > first_close + first_body * penetration)
+        )
+        return _signal(condition, 100)
+    condition = (
+        long_first & c.prev('white', 2) & short_second
+        & (c.prev('body_bottom', 1) > c.prev('body_top', 2))
+        & third_longer & c.black
+        & (c.close < first_close - first_body * penetration)
+    )
+    return _signal(condition, -100)
+
+
+def _morning_star(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    return _star(c, average, True, STAR_PENETRATION)
+
+
+def _evening_star(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    return _star(c, average, False, STAR_PENETRATION)
+
+
+def _three_white_soldiers(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    short_upper = [c.prev('upper_shadow', k) < average('ShadowVeryShort', k) for k in (2, 1, 0)]
+    white = [c.prev('white', k) for k in (2, 1, 0)]
+    open_, close, body = ([c.prev(x, k) for k in (2, 1, 0)] for x in ('open', 'close', 'real_body'))
+    condition = (
+        white[0] & short_upper[0] & white[1] & short_upper[1] & white[2] & short_upper[2]
+        & (close[2] > close[1]) & (close[1] > close[0])
+        & (open_[1] > open_[0]) & (open_[1] <= close[0] + average('Near', 2))
+        & (open_[2] > open_[1]) & (open_[2] <= close[1] + average('Near', 1))
+        & (body[1] > body[0] - average('Far', 2))
+        & (body[2] > body[1] - average('Far', 1))
+        & (body[2] > average('BodyShort'))
+    )
+    return _signal(condition, 100)
+
+
+def _three_black_crows(c: Candles, average: Callable[..., np.ndarray]) -> np.ndarray:
+    short_lower = [c.prev('lower_shadow', k) < average('ShadowVeryShort', k) for k in (2, 1, 0)]
+    black = [c.prev('black', k) for k in (2, 1, 0)]
+    open_, close = ([c.prev(x, k) for k in (2, 1, 0)] for x in ('open', 'close'))
+    condition = (
+        c.prev('white', 3)
+        & black[0] & short_lower[0] & black[1] & short_lower[1] & black[2] & short_lower[2]
+        & (open_[1] < open_[0]) & (open_[1] > close[0])
+        & (open_[2] < open_[1]) & (open_[2] > close[1])
+        & (c.prev('high', 3) > close[0])
+        & (close[0] > close[1]) & (close[1] > close[2])
+    )
+    return _signal(condition, -100)
+
+
+# Pattern kernels and their lookbacks: the number of bars before a bar
+# that its signal depends on. A kernel gets the candles and a function of
+# (setting, lag) giving the setting's average. Signals follow TA-Lib's CDL functions
+# (100 bullish, -100 bearish, 80/-80 for a weak engulfing).
+PATTERNS: Dict[str, Tuple[Callable[..., np.ndarray], int]] = {
+    'DOJI': (_doji, 10),
+    'HAMMER': (_hammer, 11),
+    'HANGING_MAN': (_hanging_man, 11),
+    'ENGULFING': (_engulfing, 2),
+    'MORNING_STAR': (_morning_star, 12),
+    'EVENING_STAR': (_evening_star, 12),
+    'THREE_WHITE_SOLDIERS': (_three_white_soldiers, 12),
+    'THREE_BLACK_CROWS': (_three_black_crows, 13)
+}
+
+
+def pattern_lookback(names: Iterable[str]) -> int:
+    """Get the number of earlier bars the signals of `names` depend on."""
+    return max((PATTERNS[name][1] for name in names), default=0)
+
+
+def pattern_signal(candles: Candles, name: str) -> np.ndarray:
+    """
+    Compute one pattern's TA-Lib style signal.
+
+    Args:
+        candles: Candle geometry
+        name: Pattern name (a key of PATTERNS)
+
+    Returns:
+        int32 array of 100 / -100 (80 / -80) where the pattern printed, else 0
+    """
+    kernel, lookback = PATTERNS[name]
+    signal = kernel(candles, lambda setting, lag=0: candles.average(setting, lag, lookback))
+    signal[..., :lookback] = 0
+    return signal
+
+
+def detect_patterns(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    names: Optional[Sequence[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the signals of several patterns over shared body and shadow arrays.
+
+    Args:
+        open_, high, low, close: Prices, 1-D (bars) or 2-D (symbols, bars)
+        names: Patterns to detect (all of PATTERNS if None)
+
+    Returns:
+        Dictionary mapping pattern names to int32 signal arrays
+    """
+    candles = Candles(open_, high, low, close)
+    return {name: pattern_signal(candles, name) for name in (names or PATTERNS)}
+
+
+class PatternScan:
+    """
+    Patterns printed per bar, packed into bitmasks.
+
+    Bit k of `mask` is set on the bars where patterns[k] printed, and bit k
+    of `bearish` where it printed with a bearish signal.
+
+    Args:
+        patterns: Pattern names, in bit order
+        mask: Unsigned integer array (bars) or (symbols, bars)
+        bearish: Array like `mask` of bearish bits
+        symbols: Row labels of 2-D masks
+    """
+
+    def __init__(self, patterns: List[str], mask: np.ndarray, bearish: np.ndarray, symbols: Optional[List[str]] = None):
+        self.patterns = patterns
+        self.mask = mask
+        self.bearish = bearish
+        self.symbols = symbols
+        self._bits = {name: bit for bit, name in enumerate(patterns)}
+
+    def bit(self, name: str) -> int:
+        """Get the mask bit value of a pattern."""
+        return 1 << self._bits[name]
+
+    def printed(self, name: str, bar: Optional[int] = None) -> np.ndarray:
+        """Get where a pattern printed, for every bar or for one bar (e.g., -1 for the last)."""
+        mask = self.mask if bar is None else self.mask[..., bar]
+        return (mask & self.mask.dtype.type(self.bit(name))) != 0
+
+    def direction(self, name: str, bar: Optional[int] = None) -> np.ndarray:
+        """Get a pattern's direction: 1 bullish, -1 bearish, 0 where it did not print."""
+        bit = self.mask.dtype.type(self.bit(name))
+        mask, bearish = (self.mask, self.bearish) if bar is None else (self.mask[..., bar], self.bearish[..., bar])
+        return np.where((mask & bit) != 0, np.where((bearish & bit) != 0, -1, 1), 0).astype(np.int8)
+
+    def names(self, bar: int = -1, row: Optional[int] = None) -> List[str]:
+        """Get the patterns printed on one bar of a 1-D scan, or of one row of a 2-D scan."""
+        value = int(self.mask[..., bar] if row is None else self.mask[row, bar])
+        return [name for name, bit in self._bits.items() if value >> bit & 1]
+
+    def symbols_with(self, name: str, bar: int = -1, direction: Optional[int] = None) -> List[str]:
+        """
+        Get the symbols on which a pattern printed on a bar.
+
+        Args:
+            name: Pattern name
+            bar: Bar position (the last by default)
+            direction: 1 or -1 to keep only bullish or bearish prints
+
+        Returns:
+            List of symbols
+        """
+        if self.symbols is None:
+            raise ValueError("Scan has no symbols")
+        directions = self.direction(name, bar)
+        hits = directions != 0 if direction is None else directions == direction
+        return [self.symbols[row] for row in np.flatnonzero(hits)]
+
+
+def scan_patterns(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    names: Optional[Sequence[str]] = None,
+    symbols: Optional[List[str]] = None
+) -> PatternScan:
+    """
+    Detect several patterns in one pass and pack them into per-bar bitmasks.
+
+    Args:
+        open_, high, low, close: Prices, 1-D (bars) or 2-D (symbols, bars)
+        names: Patterns to scan for (all of PATTERNS if None, at most 64)
+        symbols: Row labels of 2-D prices
+
+    Returns:
+        PatternScan
+    """
+    names = list(names or PATTERNS)
+    if len(names) > 64:
+        raise ValueError("At most 64 patterns fit in a bitmask")
+    dtype = np.uint32 if len(names) <= 32 else np.uint64
+    candles = Candles(open_, high, low, close)
+    mask = np.zeros(candles.close.shape, dtype=dtype)
+    bearish = np.zeros(candles.close.shape, dtype=dtype)
+    for bit, name in enumerate(names):
+        signal = pattern_signal(candles, name)
+        value = dtype(1 << bit)
+        mask[signal != 0] |= value
+        bearish[signal < 0] |= value
+    return PatternScan(names, mask, bearish, symbols)
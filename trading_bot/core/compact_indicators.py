@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List
+import numpy as np
+import pandas as pd
+
+# Storage type of each category; the others use the compact float type.
+# Candlestick patterns are -100, 0 or 100. OBV is a running volume total
+# whose bar-to-bar changes are below float32 resolution at its magnitude.
+CATEGORY_DTYPES = {
+    'patterns': np.int8,
+    'volume': np.float64
+}
+
+
+class CompactIndicatorCategory(Mapping):
+    """
+    Read-only mapping of one indicator category backed by a single 2-D array.
+
+    Row i of `values` holds the indicator named keys[i] for every bar, and
+    all rows share one index, so a category costs one allocation instead of
+    a float64 Series per indicator. Looking a key up returns a Series view
+    of its row.
+
+    Args:
+        keys: Indicator names, in row order
+        values: (indicators, bars) array
+        index: Index of the bars (the source DataFrame's, not copied)
+    """
+
+    def __init__(self, keys: List[str], values: np.ndarray, index: pd.Index):
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self.values = values
+        self.index = index
+
+    def __getitem__(self, key: str) -> pd.Series:
+        return pd.Series(self.values[self._rows[key]], index=self.index, name=key, copy=False)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def array(self, key: str) -> np.ndarray:
+        """Get an indicator's row without wrapping it in a Series."""
+        return self.values[self._rows[key]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+
+def compact_indicators(
+    values: Dict[str, np.ndarray],
+    layout: Dict[str, Dict[str, str]],
+    index: pd.Index,
+    float_dtype: type = np.float32
+) -> Dict[str, CompactIndicatorCategory]:
+    """
+    Pack indicator arrays into one compact array per category.
+
+    Args:
+        values: Indicator graph outputs by name
+        layout: Category -> {key: graph output} to store
+        index: Index of the bars
+        float_dtype: Storage type of categories without an entry in CATEGORY_DTYPES
+
+    Returns:
+        Dictionary mapping categories to CompactIndicatorCategory
+    """
+    categories = {}
+    for category, keys in layout.items():
+        packed = np.empty((len(keys), len(index)), dtype=CATEGORY_DTYPES.get(category, float_dtype))
+        for row, output in enumerate(keys.values()):
+            packed[row] = values[output]
+        categories[category] = CompactIndicatorCategory(list(keys), packed, index)
+    return categories
@@ -0,0 +1,352 @@
+import re
+import threading
+from collections.abc import Mapping
+from types import ModuleType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from .ta_backend import ta
+
+# OHLCV columns available to every node
+SOURCES = ('open', 'high', 'low', 'close', 'volume')
+
+# Parametric node families: '<FAMILY>_<period>' is registered on first use
+# with the backend function of the family's name
+PARAMETRIC_NODES = {
+    'SMA': ('close',),
+    'EMA': ('close',),
+    'RSI': ('close',),
+    'ATR': ('high', 'low', 'close')
+}
+
+_PARAMETRIC_NAME = re.compile(r'^([A-Z]+)_(\d+)$')
+
+
+def parse_parametric(name: str) -> Optional[Tuple[str, int]]:
+    """Split a parametric indicator name such as 'EMA_8' into (family, period), or None."""
+    match = _PARAMETRIC_NAME.match(name)
+    if match is None or match.group(1) not in PARAMETRIC_NODES or int(match.group(2)) < 1:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+class IndicatorNode:
+    """
+    One computation in an indicator graph.
+
+    Args:
+        func: Kernel called with the input arrays followed by `params`
+        inputs: Names of source columns or of other nodes' outputs
+        params: Keyword parameters of the kernel
+        outputs: Names of the kernel's outputs when it returns a tuple
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        inputs: Sequence[str],
+        params: Optional[Dict] = None,
+        outputs: Optional[Sequence[str]] = None
+    ):
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = params or {}
+        self.outputs = tuple(outputs) if outputs else None
+
+
+class IndicatorGraph:
+    """
+    Declarative graph of indicator computations over shared OHLCV arrays.
+
+    Every node names its inputs, so an intermediate used by several outputs
+    (a moving average, a rolling high, the ATR) is computed once per
+    evaluation, and only the nodes needed for the requested outputs run.
+
+    Args:
+        backend: Module with TA-Lib's function API (settings.TA_BACKEND's if None)
+    """
+
+    def __init__(self, backend: Optional[ModuleType] = None):
+        self.backend = backend or ta
+        self.nodes: Dict[str, IndicatorNode] = {}
+        self._producers: Dict[str, Tuple[str, Optional[int]]] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable,
+        inputs: Sequence[str],
+        params: Optional[Dict] = None,
+        outputs: Optional[Sequence[str]] = None
+    ):
+        """Register a node; a multi-output node registers each of its output names."""
+        node = IndicatorNode(func, inputs, params, outputs)
+        self.nodes[name] = node
+        if node.outputs:
+            for index, output in enumerate(node.outputs):
+                self._producers[output] = (name, index)
+        else:
+            self._producers[name] = (name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._producers or name in SOURCES
+
+    def producer(self, name: str) -> IndicatorNode:
+        """Get the node computing an output."""
+        return self.nodes[self._producers[name][0]]
+
+    def ensure(self, name: str) -> bool:
+        """Check that an output exists, registering a parametric node (e.g., 'EMA_8') if needed."""
+        if name in self:
+            return True
+        parsed = parse_parametric(name)
+        if parsed is None:
+            return False
+        family, period = parsed
+        self.add(name, getattr(self.backend, family), PARAMETRIC_NODES[family], {'timeperiod': period})
+        return True
+
+    def evaluation(self, df: pd.DataFrame) -> 'GraphEvaluation':
+        """Start a lazy evaluation of the graph over a DataFrame."""
+        return GraphEvaluation(self, df)
+
+    def evaluate(self, df: pd.DataFrame, names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Compute the requested outputs and everything they depend on.
+
+        Args:
+            df: DataFrame with OHLCV data
+            names: Output names to compute
+
+        Returns:
+            Dictionary mapping every computed output name to its array
+        """
+        evaluation = self.evaluation(df)
+        for name in names:
+            evaluation.get(name)
+        return evaluation.values
+
+    def evaluate_arrays(self, sources: Dict[str, np.ndarray], names: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Compute the requested outputs from contiguous float64 source arrays instead of a DataFrame.
+
+        Args:
+            sources: Arrays by source column name ('open', 'high', ...)
+            names: Output names to compute
+
+        Returns:
+            Dictionary mapping every computed output name to its array
+        """
+        evaluation = GraphEvaluation(self, None)
+        evaluation.values.update(sources)
+        for name in names:
+            evaluation.get(name)
+        return evaluation.values
+
+
+class GraphEvaluation:
+    """
+    Outputs of an indicator graph over one DataFrame, computed on first request.
+
+    Source columns are converted to contiguous float64 arrays once, and every
+    node runs at most once however many outputs depend on it, also when
+    several threads share the evaluation.
+    """
+
+    def __init__(self, graph: IndicatorGraph, df: Optional[pd.DataFrame]):
+        self.graph = graph
+        self.df = df
+        self.values: Dict[str, np.ndarray] = {}
+        self._series: Dict[str, pd.Series] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str) -> np.ndarray:
+        """Get an output, computing it and its missing dependencies."""
+        values = self.values
+        if name in values:
+            return values[name]
+        with self._lock:
+            if name in values:
+                return values[name]
+            return self._compute(name)
+
+    def series(self, name: str) -> pd.Series:
+        """Get an output as a Series on the DataFrame's index, created once."""
+        series = self._series.get(name)
+        if series is None:
+            series = self._series.setdefault(name, pd.Series(self.get(name), index=self.df.index))
+        return series
+
+    def _compute(self, name: str) -> np.ndarray:
+        values = self.values
+        if name in SOURCES:
+            values[name] = np.ascontiguousarray(self.df[name].to_numpy(), dtype=np.float64)
+            return values[name]
+        if not self.graph.ensure(name):
+            raise KeyError(f"Unknown indicator '{name}'")
+        node = self.graph.producer(name)
+        result = node.func(*(self.get(source) for source in node.inputs), **node.params)
+        if node.outputs:
+            values.update(zip(node.outputs, result))
+        else:
+            values[name] = result
+        return values[name]
+
+
+class LazyIndicatorCategory(Mapping):
+    """
+    Read-only mapping of one indicator category, materialising series on first access.
+
+    Keys are those of the category's layout; any parametric name (e.g.,
+    'EMA_8') can also be looked up and is added to the category once computed.
+    """
+
+    def __init__(self, evaluation: GraphEvaluation, keys: Dict[str, str]):
+        self._evaluation = evaluation
+        self._keys = dict(keys)
+        self._series: Dict[str, pd.Series] = {}
+
+    def __getitem__(self, key: str) -> pd.Series:
+        series = self._series.get(key)
+        if series is None:
+            output = self._keys.get(key)
+            if output is None:
+                if parse_parametric(key) is None:
+                    raise KeyError(key)
+                output = key
+            series = self._evaluation.series(output)
+            self._keys[key] = output
+            self._series[key] = series
+        return series
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def computed(self) -> Dict[str, pd.Series]:
+        """Get the series materialised so far, without computing any others."""
+        return {key: self._series[key] for key in self._keys if key in self._series}
+
+
+def _midpoint(highest: np.ndarray, lowest: np.ndarray) -> np.ndarray:
+    return (highest + lowest) / 2
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    shifted = np.full_like(values, np.nan)
+    shifted[periods:] = values[:-periods]
+    return shifted
+
+
+def _add(a: np.ndarray, b: np.ndarray, factor: float = 1.0) -> np.ndarray:
+    return a + factor * b
+
+
+def _typical_price_volume(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    return (high + low + close) / 3 * volume
+
+
+# Candlestick pattern nodes and their backend functions
+CANDLESTICK_PATTERNS = {
+    'DOJI': 'CDLDOJI',
+    'HAMMER': 'CDLHAMMER',
+    'HANGING_MAN': 'CDLHANGINGMAN',
+    'ENGULFING': 'CDLENGULFING',
+    'MORNING_STAR': 'CDLMORNINGSTAR',
+    'EVENING_STAR': 'CDLEVENINGSTAR',
+    'THREE_WHITE_SOLDIERS': 'CDL3WHITESOLDIERS',
+    'THREE_BLACK_CROWS': 'CDL3BLACKCROWS'
+}
+
+
+def build_indicator_graph(
+    config: Dict[str, Dict],
+    extra_periods: Iterable[int] = (),
+    backend: Optional[ModuleType] = None
+) -> IndicatorGraph:
+    """
+    Build the graph of every indicator TechnicalAnalysis reports.
+
+    Args:
+        config: Indicator parameters (settings.TA_INDICATORS layout)
+        extra_periods: Additional SMA/EMA periods to register
+        backend: Module with TA-Lib's function API (settings.TA_BACKEND's if None)
+
+    Returns:
+        IndicatorGraph
+    """
+    graph = IndicatorGraph(backend)
+    ta = graph.backend
+    periods = set(config['SMA']['periods']) | set(config['EMA']['periods']) | set(extra_periods)
+    bb_period = config['BB']['period']
+    bb_dev = config['BB']['std_dev']
+    macd = config['MACD']
+
+    # Trend
+    for period in sorted(periods | {bb_period}):
+        graph.add(f'SMA_{period}', ta.SMA, ['close'], {'timeperiod': period})
+        graph.add(f'EMA_{period}', ta.EMA, ['close'], {'timeperiod': period})
+    for period in (9, 26, 52):
+        graph.add(f'MAX_{period}', ta.MAX, ['high'], {'timeperiod': period})
+        graph.add(f'MIN_{period}', ta.MIN, ['low'], {'timeperiod': period})
+    graph.add('tenkan_sen', _midpoint, ['MAX_9', 'MIN_9'])
+    graph.add('kijun_sen', _midpoint, ['MAX_26', 'MIN_26'])
+    graph.add('tenkan_kijun_mid', _midpoint, ['tenkan_sen', 'kijun_sen'])
+    graph.add('senkou_span_a', _shift, ['tenkan_kijun_mid'], {'periods': 26})
+    graph.add('donchian_52_mid', _midpoint, ['MAX_52', 'MIN_52'])
+    graph.add('senkou_span_b', _shift, ['donchian_52_mid'], {'periods': 26})
+    if hasattr(ta, 'DMI'):
+        graph.add('DMI', ta.DMI, ['high', 'low', 'close'], {'timeperiod': 14}, outputs=['ADX', 'DI_plus', 'DI_minus'])
+    else:
+        # TA-Lib has no joint ADX/DI kernel, so each redoes the DM/TR smoothing in C
+        graph.add('ADX', ta.ADX, ['high', 'low', 'close'], {'timeperiod': 14})
+        graph.add('DI_plus', ta.PLUS_DI, ['high', 'low', 'close'], {'timeperiod': 14})
+        graph.add('DI_minus', ta.MINUS_DI, ['high', 'low', 'close'], {'timeperiod': 14})
+
+    # Momentum
+    graph.add('RSI', ta.RSI, ['close'], {'timeperiod': config['RSI']['period']})
+    graph.add('STOCH', ta.STOCH, ['high', 'low', 'close'], {
+        'fastk_period': 14, 'slowk_period': 3, 'slowk_matype': 0, 'slowd_period': 3, 'slowd_matype': 0
+    }, outputs=['slowk', 'slowd'])
+    graph.add('STOCHF', ta.STOCHF, ['high', 'low', 'close'], {
+        'fastk_period': 14, 'fastd_period': 3, 'fastd_matype': 0
+    }, outputs=['fastk', 'fastd'])
+    graph.add('MACD', ta.MACD, ['close'], {
+        'fastperiod': macd['fast'], 'slowperiod': macd['slow'], 'signalperiod': macd['signal']
+    }, outputs=['MACD', 'MACD_signal', 'MACD_hist'])
+    graph.add('CCI', ta.CCI, ['high', 'low', 'close'], {'timeperiod': 14})
+    graph.add('WILLR', ta.WILLR, ['high', 'low', 'close'], {'timeperiod': 14})
+
+    # Volatility: the Bollinger middle band is the shared SMA node, and
+    # SMA +/- STDDEV reproduces talib.BBANDS exactly
+    graph.add('BB_deviation', ta.STDDEV, ['close'], {'timeperiod': bb_period, 'nbdev': bb_dev})
+    graph.add('BB_upper', _add, ['BB_middle', 'BB_deviation'])
+    graph.add('BB_middle', np.asarray, [f'SMA_{bb_period}'])
+    graph.add('BB_lower', _add, ['BB_middle', 'BB_deviation'], {'factor': -1.0})
+    graph.add('ATR', ta.ATR, ['high', 'low', 'close'], {'timeperiod': config['ATR']['period']})
+    graph.add('KC_upper', _add, ['BB_middle', 'ATR'], {'factor': 2.0})
+    graph.add('KC_lower', _add, ['BB_middle', 'ATR'], {'factor': -2.0})
+
+    # Volume
+    graph.add('OBV', ta.OBV, ['close', 'volume'])
+    graph.add('Volume_SMA', ta.SMA, ['volume'], {'timeperiod': 20})
+    graph.add('typical_price_volume', _typical_price_volume, ['high', 'low', 'close', 'volume'])
+    graph.add('TPV_SUM_14', ta.SUM, ['typical_price_volume'], {'timeperiod': 14})
+    graph.add('VOLUME_SUM_14', ta.SUM, ['volume'], {'timeperiod': 14})
+    graph.add('VWAP', np.divide, ['TPV_SUM_14', 'VOLUME_SUM_14'])
+
+    # Patterns
+    for name, func in CANDLESTICK_PATTERNS.items():
+        graph.add(name, getattr(ta, func), ['open', 'high', 'low', 'close'])
+
+    return graph
+
+
+def layout_outputs(layout: Dict[str, Dict[str, str]]) -> List[str]:
+    """Get the graph outputs referenced by a category -> {key: output} layout."""
+    return [output for keys in layout.values() for output in keys.values()]
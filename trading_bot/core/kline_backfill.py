@@ -0,0 +1,136 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional, Tuple
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+from .kline_store import KlineStore, INTERVAL_MS, STORED_DTYPES, MAX_KLINES_PER_REQUEST
+from .kline_decoder import decode_klines, columns_to_dataframe
+from .rate_limiter import RequestWeightGovernor, request_governor, PRIORITY_LOW
+
+logger = logging.getLogger(__name__)
+
+
+class KlineBackfill:
+    """
+    Concurrent, paginated historical kline downloader.
+
+    A date range is split into page-sized chunks that are fetched in parallel
+    at low priority through the request-weight governor and stitched back
+    together in order, with overlapping candles dropped.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: Optional[int] = None,
+        governor: Optional[RequestWeightGovernor] = None
+    ):
+        self.client = client
+        self.max_workers = max_workers or settings.BACKFILL_MAX_WORKERS
+        self.governor = governor or request_governor
+
+    def _chunk_ranges(self, interval: str, start_ms: int, end_ms: int) -> Iterator[Tuple[int, int]]:
+        step = INTERVAL_MS[interval] * MAX_KLINES_PER_REQUEST
+        chunk_start = start_ms - start_ms % INTERVAL_MS[interval]
+        while chunk_start <= end_ms:
+            yield chunk_start, min(chunk_start + step - 1, end_ms)
+            chunk_start += step
+
+    def _fetch_chunk(self, symbol: str, interval: str, chunk: Tuple[int, int]) -> Dict[str, np.ndarray]:
+        klines = self.governor.call(
+            self.client, 'futures_klines',
+            priority=PRIORITY_LOW,
+            symbol=symbol,
+            interval=interval,
+            limit=MAX_KLINES_PER_REQUEST,
+            startTime=chunk[0],
+            endTime=chunk[1]
+        )
+        return decode_klines(klines)
+
+    def iter_chunks(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Fetch a time range and yield its candles chunk by chunk in time order.
+
+        At most a few chunks per worker are held in memory at once, so arbitrarily
+        long ranges can be streamed to disk.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            start_ms: Range start as open time in milliseconds
+            end_ms: Range end as open time in milliseconds (inclusive)
+
+        Yields:
+            Dictionaries of column arrays, with candles repeated across chunks removed
+        """
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"Backfill is not supported for interval '{interval}'")
+
+        chunks = self._chunk_ranges(interval, start_ms, end_ms)
+        last_open = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(self._fetch_chunk, symbol, interval, chunk))
+                if len(pending) < self.max_workers * 2:
+                    continue
+                columns, last_open = self._stitch(pending.popleft().result(), last_open)
+                if columns is not None:
+                    yield columns
+            while pending:
+                columns, last_open = self._stitch(pending.popleft().result(), last_open)
+                if columns is not None:
+                    yield columns
+
+    @staticmethod
+    def _stitch(columns: Dict[str, np.ndarray], last_open: Optional[int]) -> Tuple[Optional[Dict[str, np.ndarray]], Optional[int]]:
+        """Drop candles already yielded by a previous chunk."""
+        if last_open is not None:
+            keep = columns['timestamp'] > last_open
+            if not keep.all():
+                columns = {col: values[keep] for col, values in columns.items()}
+        if len(columns['timestamp']) == 0:
+            return None, last_open
+        return columns, int(columns['timestamp'][-1])
+
+    def fetch_dataframe(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> pd.DataFrame:
+        """Fetch a time range into a single DataFrame."""
+        parts = list(self.iter_chunks(symbol, interval, start_ms, end_ms))
+        if not parts:
+            return columns_to_dataframe(decode_klines([]))
+        return columns_to_dataframe({
+            col: np.concatenate([part[col] for part in parts]) for col in STORED_DTYPES
+        })
+
+    def fetch_to_store(self, store: KlineStore, symbol: str, interval: str, start_ms: int, end_ms: int) -> int:
+        """
+        Stream a time range into the kline store.
+
+        Stored candles that would not be contiguous with the range are discarded
+        and the range is extended to the last stored candle, so the series stays
+        gap-free.
+
+        Returns:
+            Number of candles written
+        """
+        stored = store.open_columns(symbol, interval)
+        if stored is not None:
+            stored_first_open = int(stored['timestamp'][0])
+            stored_last_open = int(stored['timestamp'][-1])
+            del stored
+            if stored_last_open + INTERVAL_MS[interval] < start_ms:
+                store.clear(symbol, interval)
+            else:
+                if start_ms < stored_first_open:
+                    store.clear(symbol, interval)
+                end_ms = max(end_ms, stored_last_open)
+
+        written = 0
+        for columns in self.iter_chunks(symbol, interval, start_ms, end_ms):
+            store.write(symbol, interval, columns)
+            written += len(columns['timestamp'])
+        logger.info(f"Backfilled {written} {interval} candles for {symbol}")
+        return written
@@ -0,0 +1,93 @@
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+# Column names and dtypes of a futures kline payload, in payload order
+KLINE_DTYPES = {
+    'timestamp': np.int64,
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.float64,
+    'close_time': np.int64,
+    'quote_volume': np.float64,
+    'trades': np.int32,
+    'taker_buy_base': np.float64,
+    'taker_buy_quote': np.float64,
+    'ignore': np.float64
+}
+
+KLINE_COLUMNS = list(KLINE_DTYPES)
+
+
+def _column_dtype(dtype, compact: bool):
+    return np.float32 if compact and dtype is np.float64 else dtype
+
+
+def decode_klines(klines: List[List], compact: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Decode a raw kline payload into contiguous typed column arrays.
+
+    The payload is transposed once at the Python level and every column is
+    parsed by NumPy straight into its final dtype, so no intermediate object
+    table or per-column conversion pass is needed.
+
+    Args:
+        klines: List of klines as returned by the Binance API
+        compact: Store prices and volumes as float32 instead of float64
+
+    Returns:
+        Dictionary mapping column names to NumPy arrays
+    """
+    if not klines:
+        return {col: np.empty(0, dtype=_column_dtype(dtype, compact)) for col, dtype in KLINE_DTYPES.items()}
+
+    return {
+        col: np.array(values, dtype=_column_dtype(dtype, compact))
+        for (col, dtype), values in zip(KLINE_DTYPES.items(), zip(*klines))
+    }
+
+
+def columns_to_dataframe(columns: Dict[str, np.ndarray], compact: bool = False) -> pd.DataFrame:
+    """
+    Wrap kline column arrays in a DataFrame without copying them.
+
+    Columns already in their decoded dtype (or float32 prices and volumes)
+    are used as-is; others are converted once. A missing 'ignore' column is
+    filled with zeros.
+
+    Args:
+        columns: Dictionary mapping column names to NumPy arrays
+        compact: Convert float64 prices and volumes to float32
+
+    Returns:
+        DataFrame with OHLCV data and a datetime 'timestamp' column
+    """
+    rows = len(columns['timestamp'])
+    data = {}
+    for col, dtype in KLINE_DTYPES.items():
+        values = columns.get(col)
+        if values is None:
+            data[col] = np.zeros(rows, dtype=_column_dtype(dtype, compact))
+        elif dtype is np.float64 and values.dtype == np.float32:
+            data[col] = values
+        else:
+            data[col] = np.asarray(values, dtype=_column_dtype(dtype, compact))
+    # Reinterpret the millisecond timestamps in place
+    data['timestamp'] = data['timestamp'].view('datetime64[ms]')
+    return pd.DataFrame(data, copy=False)
+
+
+def klines_to_dataframe(klines: List[List], compact: bool = False) -> pd.DataFrame:
+    """
+    Decode a raw kline payload into a DataFrame.
+
+    Args:
+        klines: List of klines as returned by the Binance API
+        compact: Store prices and volumes as float32 instead of float64
+
+    Returns:
+        DataFrame with OHLCV data
+    """
+    return columns_to_dataframe(decode_klines(klines, compact=compact))
@@ -0,0 +1,194 @@
+import os
+import threading
+import time
+import logging
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Column layout of the stored series (the payload's trailing 'ignore' field is not stored)
+STORED_DTYPES = {
+    'timestamp': np.int64,
+    'open': np.float64,
+    'high': np.float64,
+    'low': np.float64,
+    'close': np.float64,
+    'volume': np.float64,
+    'close_time': np.int64,
+    'quote_volume': np.float64,
+    'trades': np.int64,
+    'taker_buy_base': np.float64,
+    'taker_buy_quote': np.float64
+}
+
+# Maximum number of candles returned by a single futures klines request
+MAX_KLINES_PER_REQUEST = 1500
+
+# Fixed-length kline intervals in milliseconds ('1M' has no fixed length and is never stored)
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 60 * 60_000,
+    '2h': 2 * 60 * 60_000,
+    '4h': 4 * 60 * 60_000,
+    '6h': 6 * 60 * 60_000,
+    '8h': 8 * 60 * 60_000,
+    '12h': 12 * 60 * 60_000,
+    '1d': 24 * 60 * 60_000,
+    '3d': 3 * 24 * 60 * 60_000,
+    '1w': 7 * 24 * 60 * 60_000
+}
+
+
+class KlineStore:
+    """
+    Columnar on-disk candle store keyed by symbol and interval.
+
+    Every series lives in its own directory with one raw binary file per
+    column, so files can be memory-mapped and new candles are appended
+    without rewriting existing data.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.RLock()
+
+    def _series_dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _column_path(self, symbol: str, interval: str, column: str) -> str:
+        return os.path.join(self._series_dir(symbol, interval), f"{column}.bin")
+
+    def count(self, symbol: str, interval: str) -> int:
+        """Get the number of complete candle rows stored for a series."""
+        counts = []
+        for col, dtype in STORED_DTYPES.items():
+            path = self._column_path(symbol, interval, col)
+            if not os.path.exists(path):
+                return 0
+            counts.append(os.path.getsize(path) // np.dtype(dtype).itemsize)
+        # A write interrupted half-way leaves columns of unequal length
+        return min(counts)
+
+    def open_columns(self, symbol: str, interval: str) -> Optional[Dict[str, np.memmap]]:
+        """
+        Memory-map all stored columns of a series read-only.
+
+        The returned maps must be released before the series is written to
+        again on platforms that lock mapped files (Windows).
+
+        Returns:
+            Dictionary of column memory maps, or None if the series is empty
+        """
+        with self._lock:
+            rows = self.count(symbol, interval)
+            if rows == 0:
+                return None
+            return {
+                col: np.memmap(self._column_path(symbol, interval, col), dtype=dtype, mode='r', shape=(rows,))
+                for col, dtype in STORED_DTYPES.items()
+            }
+
+    def load(self, symbol: str, interval: str, limit: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Load the most recent candles of a series into memory.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            interval: Kline interval (e.g., '1m', '5m', '1h')
+            limit: Number of most recent candles to load (all if None)
+
+        Returns:
+            Dictionary of column arrays, or None if the series is empty
+        """
+        with self._lock:
+            columns = self.open_columns(symbol, interval)
+            if columns is None:
+                return None
+            start = 0 if limit is None else max(len(columns['timestamp']) - limit, 0)
+            loaded = {col: np.array(values[start:]) for col, values in columns.items()}
+            del columns
+            return loaded
+
+    def last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        """Get the open time (ms) of the most recent stored candle."""
+        with self._lock:
+            rows = self.count(symbol, interval)
+            if rows == 0:
+                return None
+            with open(self._column_path(symbol, interval, 'timestamp'), 'rb') as f:
+                f.seek((rows - 1) * 8)
+                return int(np.frombuffer(f.read(8), dtype=np.int64)[0])
+
+    def top_up_request(self, symbol: str, interval: str, limit: int) -> Tuple[Optional[int], int]:
+        """
+        Plan the next request needed to bring a series up to date.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            limit: Number of most recent candles the caller needs
+
+        Returns:
+            Tuple of (start time in ms, number of candles to request). A start
+            time of None means the series is cold, shorter than `limit` or more
+            than one page stale, and should be cleared and reseeded with the
+            latest `limit` candles.
+        """
+        last_open = self.last_open_time(symbol, interval)
+        if last_open is None or self.count(symbol, interval) < limit:
+            return None, limit
+
+        missing = (int(time.time() * 1000) - last_open) // INTERVAL_MS[interval] + 1
+        if missing > MAX_KLINES_PER_REQUEST:
+            return None, limit
+        # Re-request from the last stored open time so a still-open candle gets replaced
+        return last_open, min(missing + 1, MAX_KLINES_PER_REQUEST)
+
+    def write(self, symbol: str, interval: str, columns: Dict[str, np.ndarray]):
+        """
+        Merge candles into a series.
+
+        Stored candles at or after the first new open time are replaced, which
+        both overwrites a previously stored, still-open candle and keeps the
+        series free of duplicates.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            columns: Dictionary of column arrays sorted by open time
+        """
+        if len(columns['timestamp']) == 0:
+            return
+
+        with self._lock:
+            os.makedirs(self._series_dir(symbol, interval), exist_ok=True)
+            rows = self.count(symbol, interval)
+            keep = 0
+            if rows:
+                stored = np.memmap(
+                    self._column_path(symbol, interval, 'timestamp'),
+                    dtype=np.int64, mode='r', shape=(rows,)
+                )
+                keep = int(np.searchsorted(stored, columns['timestamp'][0], side='left'))
+                del stored
+
+            for col, dtype in STORED_DTYPES.items():
+                path = self._column_path(symbol, interval, col)
+                itemsize = np.dtype(dtype).itemsize
+                with open(path, 'ab') as f:
+                    f.truncate(keep * itemsize)
+                    f.seek(keep * itemsize)
+                    f.write(np.ascontiguousarray(columns[col], dtype=dtype).tobytes())
+
+    def clear(self, symbol: str, interval: str):
+        """Delete all stored candles of a series."""
+        with self._lock:
+            for col in STORED_DTYPES:
+                path = self._column_path(symbol, interval, col)
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,341 @@
+import asyncio
+import json
+import threading
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from websockets.asyncio.client import connect
+from ..config.settings import settings
+from .kline_store import INTERVAL_MS, MAX_KLINES_PER_REQUEST, STORED_DTYPES
+from .kline_window import KlineWindow
+from .resampler import KlineResampler, BASE_INTERVAL, BASE_HISTORY
+
+logger = logging.getLogger(__name__)
+
+
+class BinanceStreamClient:
+    """
+    Combined-stream WebSocket client running on its own event loop thread.
+
+    Every frame received on the combined stream endpoint is passed to
+    `on_message(stream_name, payload)`. Dropped connections are re-established
+    automatically.
+    """
+
+    def __init__(
+        self,
+        streams: List[str],
+        on_message: Callable[[str, Dict], None],
+        url: Optional[str] = None,
+        record_path: Optional[str] = None
+    ):
+        self.streams = streams
+        self.on_message = on_message
+        self.url = url or settings.BINANCE_STREAM_URL
+        self.record_path = record_path
+        self._loop = None
+        self._thread = None
+        self._stop_event = None
+
+    def start(self):
+        """Start receiving frames in a background thread."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._stop_event = asyncio.Event()
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._run(),), daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Close the connection and wait for the background thread to exit."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._stop_event.set)
+        self._thread.join(timeout)
+        self._loop.close()
+        self._thread = None
+
+    async def _run(self):
+        stream_url = f"{self.url}?streams={'/'.join(self.streams)}"
+        record = open(self.record_path, 'a') if self.record_path else None
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    async with connect(stream_url, ping_interval=None) as ws:
+                        logger.info(f"Subscribed to {len(self.streams)} streams")
+                        receiver = asyncio.ensure_future(self._receive(ws, record))
+                        stopper = asyncio.ensure_future(self._stop_event.wait())
+                        await asyncio.wait([receiver, stopper], return_when=asyncio.FIRST_COMPLETED)
+                        for task in (receiver, stopper):
+                            task.cancel()
+                        if receiver.done() and not receiver.cancelled() and receiver.exception():
+                            raise receiver.exception()
+                except Exception as e:
+                    logger.error(f"Stream connection error: {str(e)}")
+                    try:
+                        await asyncio.wait_for(self._stop_event.wait(), settings.STREAM_RECONNECT_DELAY)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            if record:
+                record.close()
+
+    async def _receive(self, ws, record):
+        async for raw in ws:
+            if record:
+                record.write(raw if isinstance(raw, str) else raw.decode())
+                record.write("\n")
+            frame = json.loads(raw)
+            try:
+                self.on_message(frame['stream'], frame['data'])
+            except Exception as e:
+                logger.error(f"Error handling stream frame: {str(e)}")
+
+
+class KlineStreamManager:
+    """
+    Keeps rolling candle windows up to date from combined kline streams.
+
+    Windows are seeded once over REST, then maintained from the WebSocket
+    stream. `on_candle_close(symbol, interval, df)` is called whenever a candle
+    closes, with the window including the closed candle.
+
+    With `resample` enabled only the 1m stream of each symbol is subscribed
+    and every other interval is derived from it by a KlineResampler.
+
+    Candles the stream skipped, through a dropped connection or lost frames,
+    are fetched over REST before the next frame is applied, and the latest
+    close they contain is reported. A gap longer than the window re-seeds
+    the stream instead.
+    """
+
+    def __init__(
+        self,
+        connector,
+        on_candle_close: Callable[[str, str, pd.DataFrame], None],
+        window_size: int = 500,
+        url: Optional[str] = None,
+        record_path: Optional[str] = None,
+        resample: Optional[bool] = None
+    ):
+        self.connector = connector
+        self.on_candle_close = on_candle_close
+        self.window_size = window_size
+        self.url = url
+        self.record_path = record_path
+        self.resample = settings.STREAM_RESAMPLE_FROM_BASE if resample is None else resample
+        self.windows: Dict[Tuple[str, str], KlineWindow] = {}
+        # Whether the last candle of each window is final
+        self._closed: Dict[Tuple[str, str], bool] = {}
+        self.resampler = None
+        self.intervals = []
+        self._client = None
+        self._lock = threading.Lock()
+
+    def start(self, symbols: List[str], intervals: List[str]):
+        """
+        Seed the windows and subscribe to the kline streams.
+
+        Replaces any previous subscription; with no symbols, nothing is subscribed.
+
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+            intervals: Kline intervals (e.g., ['1m', '1h'])
+        """
+        self.stop()
+        self.intervals = list(intervals)
+        with self._lock:
+            self.windows = {}
+            self._closed = {}
+        if self.resample:
+            streams = self._seed_resampler(symbols, intervals)
+        else:
+            streams = self._seed_windows(symbols, intervals)
+
+        # Nothing to subscribe to; a stream URL without streams is rejected
+        if not streams:
+            return
+        self._client = BinanceStreamClient(streams, self._handle_message, url=self.url, record_path=self.record_path)
+        self._client.start()
+
+    def _seed_windows(self, symbols: List[str], intervals: List[str]) -> List[str]:
+        streams = []
+        for symbol in symbols:
+            for interval in intervals:
+                self.windows[(symbol.upper(), interval)] = self._seed_window(symbol, interval)
+                streams.append(f"{symbol.lower()}@kline_{interval}")
+        return streams
+
+    def _seed_window(self, symbol: str, interval: str) -> KlineWindow:
+        window = KlineWindow(self.window_size)
+        if self.connector is not None:
+            seed = self.connector.get_klines(symbol, interval=interval, limit=self.window_size)
+            window.extend(self._frame_to_columns(seed))
+        return window
+
+    def _seed_resampler(self, symbols: List[str], intervals: List[str]) -> List[str]:
+        self.resampler = KlineResampler(intervals, self.window_size)
+        streams = []
+        for symbol in symbols:
+            self._seed_symbol(symbol)
+            streams.append(f"{symbol.lower()}@kline_{BASE_INTERVAL}")
+        return streams
+
+    def _seed_symbol(self, symbol: str):
+        if self.connector is not None:
+            base = self._frame_to_columns(
+                self.connector.get_klines(symbol, interval=BASE_INTERVAL, limit=BASE_HISTORY)
+            )
+            history = {
+                interval: self._frame_to_columns(
+                    self.connector.get_klines(symbol, interval=interval, limit=self.window_size)
+                )
+                for interval in self.resampler.intervals
+            }
+        else:
+            # Built from the stream alone
+            base = {col: np.empty(0, dtype=dtype) for col, dtype in STORED_DTYPES.items()}
+            history = None
+        self.resampler.seed(symbol.upper(), base, history)
+
+    def stop(self):
+        """Unsubscribe from all streams."""
+        if self._client is not None:
+            self._client.stop()
+            self._client = None
+
+    def get_window(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """Get a copy of the current candle window for a stream."""
+        if self.resampler is not None:
+            return self.resampler.get_klines(symbol.upper(), interval)
+        with self._lock:
+            window = self.windows.get((symbol.upper(), interval))
+            return window.to_dataframe() if window is not None and len(window) else None
+
+    @staticmethod
+    def _frame_to_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        columns = {col: df[col].to_numpy(dtype=dtype) for col, dtype in STORED_DTYPES.items() if col != 'timestamp'}
+        columns['timestamp'] = df['timestamp'].to_numpy().astype('datetime64[ms]').astype(np.int64)
+        return columns
+
+    def _missing_rows(
+        self,
+        symbol: str,
+        interval: str,
+        last_open: Optional[int],
+        closed: bool,
+        open_time: int,
+        capacity: int
+    ) -> Optional[List[Tuple]]:
+        """
+        Fetch the candles a stream skipped before the candle opening at `open_time`.
+
+        Returns:
+            Final candles in STORED_DTYPES order, starting with the last one
+            held if its close was missed (none without a gap or connector),
+            or None when more than `capacity` were skipped
+        """
+        step = INTERVAL_MS[interval]
+        if last_open is None or open_time <= last_open or (closed and open_time == last_open + step):
+            return []
+        if self.connector is None:
+            logger.warning(f"{symbol} {interval} stream skipped candles and there is no connector to fetch them")
+            return []
+        start = last_open + step if closed else last_open
+        count = (open_time - start) // step
+        if count > capacity:
+            return None
+
+        logger.warning(f"{symbol} {interval} stream skipped {count} candles, fetching them over REST")
+        df = self.connector.get_klines(
+            symbol, interval=interval, limit=count, start_time=datetime.fromtimestamp(start / 1000, tz=timezone.utc)
+        )
+        columns = self._frame_to_columns(df)
+        keep = columns['timestamp'] < open_time
+        return list(zip(*(columns[col][keep].tolist() for col in STORED_DTYPES)))
+
+    def _handle_message(self, stream: str, data: Dict):
+        if data.get('e') != 'kline':
+            return
+        kline = data['k']
+        key = (kline['s'], kline['i'])
+        row = (
+            kline['t'], float(kline['o']), float(kline['h']), float(kline['l']), float(kline['c']),
+            float(kline['v']), kline['T'], float(kline['q']), kline['n'], float(kline['V']), float(kline['Q'])
+        )
+
+        if self.resampler is not None:
+            self._fill_resampler(key[0], row[0])
+            for interval in self.resampler.update(key[0], row, kline['x']):
+                if interval in self.intervals:
+                    self.on_candle_close(key[0], interval, self.resampler.get_klines(key[0], interval))
+            return
+
+        with self._lock:
+            window = self.windows.get(key)
+            if window is None:
+                return
+            last_open, closed = window.last_open_time(), self._closed.get(key, False)
+        filled = self._fill_window(key, last_open, closed, row[0])
+
+        with self._lock:
+            window = self.windows[key]
+            window.update(row)
+            self._closed[key] = kline['x']
+            df = window.to_dataframe() if kline['x'] else None
+
+        if filled is not None:
+            self.on_candle_close(key[0], key[1], filled)
+        if df is not None:
+            self.on_candle_close(key[0], key[1], df)
+
+    def _fill_window(self, key: Tuple[str, str], last_open: Optional[int], closed: bool, open_time: int) -> Optional[pd.DataFrame]:
+        """Apply the candles a window's stream skipped, returning the window at the last of them if any."""
+        symbol, interval = key
+        try:
+            rows = self._missing_rows(
+                symbol, interval, last_open, closed, open_time, min(self.window_size, MAX_KLINES_PER_REQUEST)
+            )
+            if rows is None:
+                logger.warning(f"{symbol} {interval} stream skipped more than a window of candles, re-seeding it")
+                window = self._seed_window(symbol, interval)
+                with self._lock:
+                    self.windows[key] = window
+                return None
+        except Exception as e:
+            logger.error(f"Error filling {symbol} {interval} stream gap: {str(e)}")
+            return None
+
+        if not rows:
+            return None
+        with self._lock:
+            window = self.windows[key]
+            for row in rows:
+                window.update(row)
+            return window.to_dataframe()
+
+    def _fill_resampler(self, symbol: str, open_time: int):
+        """Apply the base candles a symbol's stream skipped, reporting the latest close of each interval."""
+        last_open, closed = self.resampler.last_base(symbol)
+        try:
+            rows = self._missing_rows(symbol, BASE_INTERVAL, last_open, closed, open_time, BASE_HISTORY)
+            if rows is None:
+                logger.warning(f"{symbol} stream skipped more than {BASE_HISTORY} base candles, re-seeding it")
+                self._seed_symbol(symbol)
+                return
+        except Exception as e:
+            logger.error(f"Error filling {symbol} stream gap: {str(e)}")
+            return
+
+        closes = {}
+        for row in rows:
+            for interval in self.resampler.update(symbol, row, True):
+                if interval in self.intervals and interval != BASE_INTERVAL:
+                    closes[interval] = self.resampler.get_klines(symbol, interval)
+        # Every filled base candle is final, so the base window ends on a close
+        if rows and BASE_INTERVAL in self.intervals:
+            closes[BASE_INTERVAL] = self.resampler.get_klines(symbol, BASE_INTERVAL)
+        for interval, df in closes.items():
+            self.on_candle_close(symbol, interval, df)
@@ -0,0 +1,54 @@
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .kline_store import STORED_DTYPES
+from .kline_decoder import columns_to_dataframe
+
+
+class KlineWindow:
+    """Fixed-size rolling window of candles backed by preallocated column arrays."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._capacity = size * 2
+        self._columns = {col: np.zeros(self._capacity, dtype=dtype) for col, dtype in STORED_DTYPES.items()}
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """Append candles from column arrays, keeping only the last `size`."""
+        for i in range(len(columns['timestamp'])):
+            self.update(tuple(columns[col][i] for col in STORED_DTYPES))
+
+    def update(self, row: Tuple):
+        """Append a new candle or replace the last one if its open time is unchanged."""
+        if len(self) and self._columns['timestamp'][self._end - 1] == row[0]:
+            position = self._end - 1
+        elif len(self) and row[0] < self._columns['timestamp'][self._end - 1]:
+            return
+        else:
+            if self._end == self._capacity:
+                # Compact the live rows to the front of the buffers
+                for values in self._columns.values():
+                    values[:len(self)] = values[self._start:self._end]
+                self._end -= self._start
+                self._start = 0
+            position = self._end
+            self._end += 1
+            if len(self) > self.size:
+                self._start += 1
+
+        for col, value in zip(STORED_DTYPES, row):
+            self._columns[col][position] = value
+
+    def last_open_time(self) -> Optional[int]:
+        return int(self._columns['timestamp'][self._end - 1]) if len(self) else None
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Copy the window into an OHLCV DataFrame."""
+        return columns_to_dataframe({
+            col: values[self._start:self._end].copy() for col, values in self._columns.items()
+        })
@@ -0,0 +1,699 @@
+"""
+Compiled indicator kernels with TA-Lib's names, signatures and outputs.
+
+The backend used when TA-Lib is not installed (see ta_backend). Every
+kernel follows the TA-Lib C implementation step by step, including the
+order of its running sums, so outputs match TA-Lib to floating-point
+rounding. As with TA-Lib's Python wrapper, leading NaN inputs are skipped.
+Kernels are compiled with Numba when it is installed and run as plain
+Python otherwise.
+"""
+from typing import Tuple
+import numpy as np
+from .candlestick_patterns import CANDLE_SETTINGS, PATTERNS, STAR_PENETRATION
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Run kernels uncompiled when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# TA-Lib's TA_IS_ZERO threshold
+_ZERO = 1e-14
+
+
+def _prepare(*arrays) -> Tuple[int, list]:
+    """Convert inputs to float64 arrays and find the first bar where all are set."""
+    arrays = [np.ascontiguousarray(array, dtype=np.float64) for array in arrays]
+    if all(len(array) and array[0] == array[0] for array in arrays):
+        return 0, arrays
+    valid = ~np.isnan(arrays[0])
+    for array in arrays[1:]:
+        valid &= ~np.isnan(array)
+    begin = int(np.argmax(valid)) if valid.any() else len(valid)
+    return begin, arrays
+
+
+def _output(length: int, count: int = 1):
+    if count == 1:
+        return np.full(length, np.nan)
+    return tuple(np.full(length, np.nan) for _ in range(count))
+
+
+@njit(cache=True)
+def _sma(x, period, out):
+    n = x.shape[0]
+    if n < period:
+        return
+    total = 0.0
+    for i in range(period - 1):
+        total += x[i]
+    for i in range(period - 1, n):
+        total += x[i]
+        value = total
+        total -= x[i - period + 1]
+        out[i] = value / period
+
+
+@njit(cache=True)
+def _sum(x, period, out):
+    n = x.shape[0]
+    if n < period:
+        return
+    total = 0.0
+    for i in range(period - 1):
+        total += x[i]
+    for i in range(period - 1, n):
+        total += x[i]
+        out[i] = total
+        total -= x[i - period + 1]
+
+
+@njit(cache=True)
+def _ema(x, period, seed_at, out):
+    """EMA whose first value, at `seed_at`, is the mean of the `period` values ending there."""
+    n = x.shape[0]
+    if n <= seed_at:
+        return
+    k = 2.0 / (period + 1)
+    total = 0.0
+    for i in range(seed_at - period + 1, seed_at + 1):
+        total += x[i]
+    value = total / period
+    out[seed_at] = value
+    for i in range(seed_at + 1, n):
+        value = ((x[i] - value) * k) + value
+        out[i] = value
+
+
+@njit(cache=True)
+def _extreme(x, period, highest, out):
+    """Rolling maximum or minimum with a monotonic deque of indices in a ring buffer."""
+    n = x.shape[0]
+    window = np.empty(period, dtype=np.int64)
+    head = 0
+    size = 0
+    for i in range(n):
+        value = x[i]
+        while size and ((x[window[(head + size - 1) % period]] <= value) if highest
+                        else (x[window[(head + size - 1) % period]] >= value)):
+            size -= 1
+        if size and window[head] <= i - period:
+            head = (head + 1) % period
+            size -= 1
+        window[(head + size) % period] = i
+        size += 1
+        if i >= period - 1:
+            out[i] = x[window[head]]
+
+
+@njit(cache=True)
+def _variance(x, period, out):
+    """Population variance from running sums of the values offset by the first one."""
+    n = x.shape[0]
+    if n < period:
+        return
+    # The offset keeps the sums small, so E[x^2] - E[x]^2 does not cancel
+    # away the precision of high-priced series
+    base = x[0]
+    total1 = 0.0
+    total2 = 0.0
+    for i in range(period - 1):
+        value = x[i] - base
+        total1 += value
+        total2 += value * value
+    for i in range(period - 1, n):
+        value = x[i] - base
+        total1 += value
+        total2 += value * value
+        mean1 = total1 / period
+        mean2 = total2 / period
+        trailing = x[i - period + 1] - base
+        total1 -= trailing
+        total2 -= trailing * trailing
+        out[i] = mean2 - mean1 * mean1
+
+
+@njit(cache=True)
+def _rsi(x, period, out):
+    n = x.shape[0]
+    if n <= period:
+        return
+    gain = 0.0
+    loss = 0.0
+    prev = x[0]
+    for i in range(1, period + 1):
+        diff = x[i] - prev
+        prev = x[i]
+        if diff < 0:
+            loss -= diff
+        else:
+            gain += diff
+    loss /= period
+    gain /= period
+    total = gain + loss
+    out[period] = 100.0 * (gain / total) if not -_ZERO < total < _ZERO else 0.0
+    for i in range(period + 1, n):
+        diff = x[i] - prev
+        prev = x[i]
+        loss *= period - 1
+        gain *= period - 1
+        if diff < 0:
+            loss -= diff
+        else:
+            gain += diff
+        loss /= period
+        gain /= period
+        total = gain + loss
+        out[i] = 100.0 * (gain / total) if not -_ZERO < total < _ZERO else 0.0
+
+
+@njit(cache=True)
+def _true_range(high, low, prev_close):
+    greatest = high - low
+    value = abs(high - prev_close)
+    if value > greatest:
+        greatest = value
+    value = abs(low - prev_close)
+    if value > greatest:
+        greatest = value
+    return greatest
+
+
+@njit(cache=True)
+def _atr(high, low, close, period, out):
+    n = close.shape[0]
+    if n <= period:
+        return
+    total = 0.0
+    for i in range(1, period + 1):
+        total += _true_range(high[i], low[i], close[i - 1])
+    atr = total / period
+    out[period] = atr
+    for i in range(period + 1, n):
+        atr *= period - 1
+        atr += _true_range(high[i], low[i], close[i - 1])
+        atr /= period
+        out[i] = atr
+
+
+@njit(cache=True)
+def _dmi(high, low, close, period, adx_out, plus_out, minus_out):
+    """ADX, +DI and -DI from one Wilder smoothing of TR and DM."""
+    n = close.shape[0]
+    plus_dm = 0.0
+    minus_dm = 0.0
+    tr = 0.0
+    sum_dx = 0.0
+    adx = np.nan
+    for i in range(1, n):
+        diff_p = high[i] - high[i - 1]
+        diff_m = low[i - 1] - low[i]
+        if i >= period:
+            minus_dm -= minus_dm / period
+            plus_dm -= plus_dm / period
+        if diff_m > 0 and diff_p < diff_m:
+            minus_dm += diff_m
+        elif diff_p > 0 and diff_p > diff_m:
+            plus_dm += diff_p
+        true_range = _true_range(high[i], low[i], close[i - 1])
+        if i < period:
+            tr += true_range
+            continue
+        tr = tr - (tr / period) + true_range
+
+        plus_di = 0.0
+        minus_di = 0.0
+        has_dx = False
+        dx = 0.0
+        if not -_ZERO < tr < _ZERO:
+            minus_di = 100.0 * (minus_dm / tr)
+            plus_di = 100.0 * (plus_dm / tr)
+            total = minus_di + plus_di
+            if not -_ZERO < total < _ZERO:
+                dx = 100.0 * (abs(minus_di - plus_di) / total)
+                has_dx = True
+        plus_out[i] = plus_di
+        minus_out[i] = minus_di
+
+        if i < 2 * period - 1:
+            if has_dx:
+                sum_dx += dx
+            continue
+        if i == 2 * period - 1:
+            if has_dx:
+                sum_dx += dx
+            adx = sum_dx / period
+        elif has_dx:
+            adx = ((adx * (period - 1)) + dx) / period
+        adx_out[i] = adx
+
+
+@njit(cache=True)
+def _stoch_fastk(high, low, close, period, out):
+    n = close.shape[0]
+    for i in range(period - 1, n):
+        highest = high[i - period + 1]
+        lowest = low[i - period + 1]
+        for j in range(i - period + 2, i + 1):
+            if high[j] > highest:
+                highest = high[j]
+            if low[j] < lowest:
+                lowest = low[j]
+        diff = (highest - lowest) / 100.0
+        out[i] = (close[i] - lowest) / diff if diff != 0.0 else 0.0
+
+
+@njit(cache=True)
+def _willr(high, low, close, period, out):
+    n = close.shape[0]
+    for i in range(period - 1, n):
+        highest = high[i - period + 1]
+        lowest = low[i - period + 1]
+        for j in range(i - period + 2, i + 1):
+            if high[j] > highest:
+                highest = high[j]
+            if low[j] < lowest:
+                lowest = low[j]
+        diff = (highest - lowest) / (-100.0)
+        out[i] = (highest - close[i]) / diff if diff != 0.0 else 0.0
+
+
+@njit(cache=True)
+def _cci(high, low, close, period, out):
+    n = close.shape[0]
+    # TA-Lib sums its circular buffer in slot order, slot i % period holding bar i
+    buffer = np.zeros(period)
+    for i in range(n):
+        typical = (high[i] + low[i] + close[i]) / 3
+        buffer[i % period] = typical
+        if i < period - 1:
+            continue
+        average = 0.0
+        for j in range(period):
+            average += buffer[j]
+        average /= period
+        deviation = 0.0
+        for j in range(period):
+            deviation += abs(buffer[j] - average)
+        diff = typical - average
+        out[i] = diff / (0.015 * (deviation / period)) if diff != 0.0 and deviation != 0.0 else 0.0
+
+
+@njit(cache=True)
+def _obv(close, volume, out):
+    n = close.shape[0]
+    if n == 0:
+        return
+    obv = volume[0]
+    out[0] = obv
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            obv += volume[i]
+        elif close[i] < close[i - 1]:
+            obv -= volume[i]
+        out[i] = obv
+
+
+@njit(cache=True)
+def _macd(x, fast, slow, signal, macd_out, signal_out, hist_out):
+    """MACD with the fast EMA seeded on the slow EMA's first bar, all outputs from slow + signal - 2."""
+    n = x.shape[0]
+    first = slow + signal - 2
+    if n <= first:
+        return
+    fast_ema = np.full(n, np.nan)
+    slow_ema = np.full(n, np.nan)
+    _ema(x, fast, slow - 1, fast_ema)
+    _ema(x, slow, slow - 1, slow_ema)
+    line = fast_ema - slow_ema
+    line_signal = np.full(n, np.nan)
+    _ema(line[slow - 1:], signal, signal - 1, line_signal[slow - 1:])
+    for i in range(first, n):
+        macd_out[i] = line[i]
+        signal_out[i] = line_signal[i]
+        hist_out[i] = line[i] - line_signal[i]
+
+
+@njit(cache=True)
+def _stoch(high, low, close, fastk_period, slowk_period, slowd_period, slowk_out, slowd_out):
+    n = close.shape[0]
+    first = fastk_period + slowk_period + slowd_period - 3
+    if n <= first:
+        return
+    fastk = np.full(n, np.nan)
+    slowk = np.full(n, np.nan)
+    slowd = np.full(n, np.nan)
+    _stoch_fastk(high, low, close, fastk_period, fastk)
+    start = fastk_period - 1
+    _sma(fastk[start:], slowk_period, slowk[start:])
+    start += slowk_period - 1
+    _sma(slowk[start:], slowd_period, slowd[start:])
+    slowk_out[first:] = slowk[first:]
+    slowd_out[first:] = slowd[first:]
+
+
+@njit(cache=True)
+def _stochf(high, low, close, fastk_period, fastd_period, fastk_out, fastd_out):
+    n = close.shape[0]
+    first = fastk_period + fastd_period - 2
+    if n <= first:
+        return
+    fastk = np.full(n, np.nan)
+    fastd = np.full(n, np.nan)
+    _stoch_fastk(high, low, close, fastk_period, fastk)
+    _sma(fastk[fastk_period - 1:], fastd_period, fastd[fastk_period - 1:])
+    fastk_out[first:] = fastk[first:]
+    fastd_out[first:] = fastd[first:]
+
+
+def _require_sma(*matypes):
+    if any(matype != 0 for matype in matypes):
+        raise ValueError("Only SMA smoothing (matype=0) is supported")
+
+
+def SMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _sma(real[begin:], timeperiod, out[begin:])
+    return out
+
+
+def EMA(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _ema(real[begin:], timeperiod, timeperiod - 1, out[begin:])
+    return out
+
+
+def SUM(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _sum(real[begin:], timeperiod, out[begin:])
+    return out
+
+
+def MAX(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _extreme(real[begin:], timeperiod, True, out[begin:])
+    return out
+
+
+def MIN(real: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _extreme(real[begin:], timeperiod, False, out[begin:])
+    return out
+
+
+def STDDEV(real: np.ndarray, timeperiod: int = 5, nbdev: float = 1.0) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _variance(real[begin:], timeperiod, out[begin:])
+    valid = ~np.isnan(out)
+    variance = out[valid]
+    out[valid] = np.where(variance < _ZERO, 0.0, np.sqrt(np.maximum(variance, 0.0)) * nbdev)
+    return out
+
+
+def RSI(real: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    begin, (real,) = _prepare(real)
+    out = _output(len(real))
+    _rsi(real[begin:], timeperiod, out[begin:])
+    return out
+
+
+def MACD(
+    real: np.ndarray,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    begin, (real,) = _prepare(real)
+    if slowperiod < fastperiod:
+        fastperiod, slowperiod = slowperiod, fastperiod
+    macd, macd_signal, macd_hist = _output(len(real), 3)
+    _macd(real[begin:], fastperiod, slowperiod, signalperiod, macd[begin:], macd_signal[begin:], macd_hist[begin:])
+    return macd, macd_signal, macd_hist
+
+
+def ATR(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    begin, (high, low, close) = _prepare(high, low, close)
+    out = _output(len(close))
+    _atr(high[begin:], low[begin:], close[begin:], timeperiod, out[begin:])
+    return out
+
+
+def DMI(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ADX, PLUS_DI and MINUS_DI in one pass (TA-Lib computes each separately)."""
+    begin, (high, low, close) = _prepare(high, low, close)
+    adx, plus_di, minus_di = _output(len(close), 3)
+    _dmi(high[begin:], low[begin:], close[begin:], timeperiod, adx[begin:], plus_di[begin:], minus_di[begin:])
+    return adx, plus_di, minus_di
+
+
+def ADX(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    return DMI(high, low, close, timeperiod)[0]
+
+
+def PLUS_DI(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    return DMI(high, low, close, timeperiod)[1]
+
+
+def MINUS_DI(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    return DMI(high, low, close, timeperiod)[2]
+
+
+def STOCH(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    fastk_period: int = 5,
+    slowk_period: int = 3,
+    slowk_matype: int = 0,
+    slowd_period: int = 3,
+    slowd_matype: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    _require_sma(slowk_matype, slowd_matype)
+    begin, (high, low, close) = _prepare(high, low, close)
+    slowk, slowd = _output(len(close), 2)
+    _stoch(high[begin:], low[begin:], close[begin:], fastk_period, slowk_period, slowd_period, slowk[begin:], slowd[begin:])
+    return slowk, slowd
+
+
+def STOCHF(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    fastk_period: int = 5,
+    fastd_period: int = 3,
+    fastd_matype: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    _require_sma(fastd_matype)
+    begin, (high, low, close) = _prepare(high, low, close)
+    fastk, fastd = _output(len(close), 2)
+    _stochf(high[begin:], low[begin:], close[begin:], fastk_period, fastd_period, fastk[begin:], fastd[begin:])
+    return fastk, fastd
+
+
+def CCI(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    begin, (high, low, close) = _prepare(high, low, close)
+    out = _output(len(close))
+    _cci(high[begin:], low[begin:], close[begin:], timeperiod, out[begin:])
+    return out
+
+
+def WILLR(high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    begin, (high, low, close) = _prepare(high, low, close)
+    out = _output(len(close))
+    _willr(high[begin:], low[begin:], close[begin:], timeperiod, out[begin:])
+    return out
+
+
+def OBV(real: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    begin, (real, volume) = _prepare(real, volume)
+    out = _output(len(real))
+    _obv(real[begin:], volume[begin:], out[begin:])
+    return out
+
+
+# Candle settings as (uses the real body, period, factor) tuples
+_BODY_LONG, _BODY_SHORT, _BODY_DOJI, _SHADOW_LONG, _SHADOW_VERY_SHORT, _NEAR, _FAR = (
+    (CANDLE_SETTINGS[name][0] == 'real_body',) + CANDLE_SETTINGS[name][1:]
+    for name in ('BodyLong', 'BodyShort', 'BodyDoji', 'ShadowLong', 'ShadowVeryShort', 'Near', 'Far')
+)
+
+
+@njit(cache=True)
+def _candle_average(real_body, high_low, setting, first):
+    """
+    TA-Lib's average of a candle setting at every bar from `first` on.
+
+    The sum over the setting's period is seeded at `first` and then rolled
+    forward bar by bar, exactly as TA-Lib's CDL functions do.
+    """
+    use_body, period, factor = setting
+    ranges = real_body if use_body else high_low
+    n = ranges.shape[0]
+    out = np.full(n, np.nan)
+    if period == 0:
+        for j in range(first, n):
+            out[j] = factor * ranges[j]
+        return out
+    if n <= first:
+        return out
+    total = 0.0
+    for k in range(first - period, first):
+        total += ranges[k]
+    for j in range(first, n):
+        out[j] = factor * (total / period)
+        total += ranges[j] - ranges[j - period]
+    return out
+
+
+@njit(cache=True)
+def _cdl(kind, open_, high, low, close, out):
+    """Evaluate one candlestick pattern (an index into _CDL_KINDS) from its lookback on."""
+    n = close.shape[0]
+    real_body = np.abs(close - open_)
+    high_low = high - low
+    body_top = np.maximum(open_, close)
+    body_bottom = np.minimum(open_, close)
+    upper_shadow = high - body_top
+    lower_shadow = body_bottom - low
+
+    if kind == 0:  # DOJI
+        doji = _candle_average(real_body, high_low, _BODY_DOJI, 10)
+        for i in range(10, n):
+            out[i] = 100 if real_body[i] <= doji[i] else 0
+
+    elif kind == 1 or kind == 2:  # HAMMER, HANGING_MAN
+        body_short = _candle_average(real_body, high_low, _BODY_SHORT, 11)
+        shadow_long = _candle_average(real_body, high_low, _SHADOW_LONG, 11)
+        shadow_very_short = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 11)
+        near = _candle_average(real_body, high_low, _NEAR, 10)
+        for i in range(11, n):
+            shape = (
+                real_body[i] < body_short[i]
+                and lower_shadow[i] > shadow_long[i]
+                and upper_shadow[i] < shadow_very_short[i]
+            )
+            if kind == 1:
+                out[i] = 100 if shape and body_bottom[i] <= low[i - 1] + near[i - 1] else 0
+            else:
+                out[i] = -100 if shape and body_bottom[i] >= high[i - 1] - near[i - 1] else 0
+
+    elif kind == 3:  # ENGULFING
+        for i in range(2, n):
+            white = close[i] >= open_[i]
+            prev_white = close[i - 1] >= open_[i - 1]
+            if white and not prev_white and (
+                (close[i] >= open_[i - 1] and open_[i] < close[i - 1])
+                or (close[i] > open_[i - 1] and open_[i] <= close[i - 1])
+            ):
+                sign = 1
+            elif not white and prev_white and (
+                (open_[i] >= close[i - 1] and close[i] < open_[i - 1])
+                or (open_[i] > close[i - 1] and close[i] <= open_[i - 1])
+            ):
+                sign = -1
+            else:
+                out[i] = 0
+                continue
+            out[i] = sign * (100 if open_[i] != close[i - 1] and close[i] != open_[i - 1] else 80)
+
+    elif kind == 4 or kind == 5:  # MORNING_STAR, EVENING_STAR
+        body_long = _candle_average(real_body, high_low, _BODY_LONG, 10)
+        body_short_1 = _candle_average(real_body, high_low, _BODY_SHORT, 11)
+        body_short_0 = _candle_average(real_body, high_low, _BODY_SHORT, 12)
+        for i in range(12, n):
+            stars = (
+                real_body[i - 2] > body_long[i - 2]
+                and real_body[i - 1] <= body_short_1[i - 1]
+                and real_body[i] > body_short_0[i]
+            )
+            if kind == 4:
+                out[i] = 100 if (
+                    stars and close[i - 2] < open_[i - 2] and close[i] >= open_[i]
+                    and body_top[i - 1] < body_bottom[i - 2]
+                    and close[i] > close[i - 2] + real_body[i - 2] * STAR_PENETRATION
+                ) else 0
+            else:
+                out[i] = -100 if (
+                    stars and close[i - 2] >= open_[i - 2] and close[i] < open_[i]
+                    and body_bottom[i - 1] > body_top[i - 2]
+                    and close[i] < close[i - 2] - real_body[i - 2] * STAR_PENETRATION
+                ) else 0
+
+    elif kind == 6:  # THREE_WHITE_SOLDIERS
+        very_short_2 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 10)
+        very_short_1 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 11)
+        very_short_0 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 12)
+        near_2 = _candle_average(real_body, high_low, _NEAR, 10)
+        near_1 = _candle_average(real_body, high_low, _NEAR, 11)
+        far_2 = _candle_average(real_body, high_low, _FAR, 10)
+        far_1 = _candle_average(real_body, high_low, _FAR, 11)
+        body_short = _candle_average(real_body, high_low, _BODY_SHORT, 12)
+        for i in range(12, n):
+            out[i] = 100 if (
+                close[i - 2] >= open_[i - 2] and upper_shadow[i - 2] < very_short_2[i - 2]
+                and close[i - 1] >= open_[i - 1] and upper_shadow[i - 1] < very_short_1[i - 1]
+                and close[i] >= open_[i] and upper_shadow[i] < very_short_0[i]
+                and close[i] > close[i - 1] and close[i - 1] > close[i - 2]
+                and open_[i - 1] > open_[i - 2] and open_[i - 1] <= close[i - 2] + near_2[i - 2]
+                and open_[i] > open_[i - 1] and open_[i] <= close[i - 1] + near_1[i - 1]
+                and real_body[i - 1] > real_body[i - 2] - far_2[i - 2]
+                and real_body[i] > real_body[i - 1] - far_1[i - 1]
+                and real_body[i] > body_short[i]
+            ) else 0
+
+    elif kind == 7:  # THREE_BLACK_CROWS
+        very_short_2 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 11)
+        very_short_1 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 12)
+        very_short_0 = _candle_average(real_body, high_low, _SHADOW_VERY_SHORT, 13)
+        for i in range(13, n):
+            out[i] = -100 if (
+                close[i - 3] >= open_[i - 3]
+                and close[i - 2] < open_[i - 2] and lower_shadow[i - 2] < very_short_2[i - 2]
+                and close[i - 1] < open_[i - 1] and lower_shadow[i - 1] < very_short_1[i - 1]
+                and close[i] < open_[i] and lower_shadow[i] < very_short_0[i]
+                and open_[i - 1] < open_[i - 2] and open_[i - 1] > close[i - 2]
+                and open_[i] < open_[i - 1] and open_[i] > close[i - 1]
+                and high[i - 3] > close[i - 2]
+                and close[i - 2] > close[i - 1] and close[i - 1] > close[i]
+            ) else 0
+
+
+# Patterns of _cdl, in the order of its `kind` argument
+_CDL_KINDS = (
+    'DOJI', 'HAMMER', 'HANGING_MAN', 'ENGULFING', 'MORNING_STAR',
+    'EVENING_STAR', 'THREE_WHITE_SOLDIERS', 'THREE_BLACK_CROWS'
+)
+
+
+def _candlestick(name: str):
+    kind = _CDL_KINDS.index(name)
+    lookback = PATTERNS[name][1]
+
+    def kernel(open: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        begin, (open, high, low, close) = _prepare(open, high, low, close)
+        out = np.zeros(len(close), dtype=np.int32)
+        if len(close) - begin > lookback:
+            _cdl(kind, open[begin:], high[begin:], low[begin:], close[begin:], out[begin:])
+        return out
+    kernel.__name__ = name
+    return kernel
+
+
+CDLDOJI = _candlestick('DOJI')
+CDLHAMMER = _candlestick('HAMMER')
+CDLHANGINGMAN = _candlestick('HANGING_MAN')
+CDLENGULFING = _candlestick('ENGULFING')
+CDLMORNINGSTAR = _candlestick('MORNING_STAR')
+CDLEVENINGSTAR = _candlestick('EVENING_STAR')
+CDL3WHITESOLDIERS = _candlestick('THREE_WHITE_SOLDIERS')
+CDL3BLACKCROWS = _candlestick('THREE_BLACK_CROWS')
@@ -0,0 +1,314 @@
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from ..config.settings import settings
+from .kline_stream import BinanceStreamClient
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBookOutOfSync(Exception):
+    """Raised when a depth update cannot be applied without a new snapshot."""
+
+
+class BookSide:
+    """
+    One side of an order book in sorted, preallocated arrays.
+
+    Levels are kept sorted by `sign * price` ascending, so the best level of
+    both sides sits at the end of the arrays: best price lookups are O(1)
+    and the top N levels are a reversed O(N) slice.
+    """
+
+    def __init__(self, sign: int, capacity: int = 1024):
+        self.sign = sign
+        self._keys = np.empty(capacity)
+        self._qty = np.empty(capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def load(self, levels: List[List]):
+        """Replace all levels with a snapshot's [price, quantity] pairs."""
+        table = np.array(levels, dtype=np.float64).reshape(-1, 2)
+        table = table[table[:, 1] > 0]
+        order = np.argsort(self.sign * table[:, 0], kind='stable')
+        size = len(order)
+        if size > len(self._keys):
+            self._keys = np.empty(size * 2)
+            self._qty = np.empty(size * 2)
+        self._keys[:size] = self.sign * table[order, 0]
+        self._qty[:size] = table[order, 1]
+        self._size = size
+
+    def set(self, price: float, qty: float):
+        """Set the quantity at a price level; zero removes the level."""
+        key = self.sign * price
+        n = self._size
+        i = int(np.searchsorted(self._keys[:n], key))
+        if i < n and self._keys[i] == key:
+            if qty > 0:
+                self._qty[i] = qty
+            else:
+                self._keys[i:n - 1] = self._keys[i + 1:n]
+                self._qty[i:n - 1] = self._qty[i + 1:n]
+                self._size -= 1
+        elif qty > 0:
+            if n == len(self._keys):
+                self._keys = np.concatenate([self._keys, np.empty(n)])
+                self._qty = np.concatenate([self._qty, np.empty(n)])
+            self._keys[i + 1:n + 1] = self._keys[i:n]
+            self._qty[i + 1:n + 1] = self._qty[i:n]
+            self._keys[i] = key
+            self._qty[i] = qty
+            self._size += 1
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        """Get the best (price, quantity), or None if the side is empty."""
+        if not self._size:
+            return None
+        return self.sign * float(self._keys[self._size - 1]), float(self._qty[self._size - 1])
+
+    def top(self, depth: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get prices and quantities of the best `depth` levels, best first."""
+        start = max(self._size - depth, 0)
+        return self.sign * self._keys[start:self._size][::-1], self._qty[start:self._size][::-1]
+
+    def volume(self, depth: int) -> float:
+        """Get the total quantity of the best `depth` levels."""
+        return float(self._qty[max(self._size - depth, 0):self._size].sum())
+
+
+class OrderBook:
+    """
+    Local futures order book built from a REST snapshot plus depth diffs.
+
+    Diff events follow Binance futures sequencing: events older than the
+    snapshot are dropped, the first applied event must straddle or directly
+    follow the snapshot's lastUpdateId, and each later event's `pu` must
+    equal the previous event's `u`. Any gap raises OrderBookOutOfSync.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = BookSide(sign=1)
+        self.asks = BookSide(sign=-1)
+        self.last_update_id = None
+        self.synced = False
+        self._first_event = True
+
+    def load_snapshot(self, snapshot: Dict):
+        """Reset the book from a REST depth snapshot."""
+        self.bids.load(snapshot['bids'])
+        self.asks.load(snapshot['asks'])
+        self.last_update_id = snapshot['lastUpdateId']
+        self.synced = True
+        self._first_event = True
+
+    def apply_diff(self, event: Dict):
+        """
+        Apply a depth diff event.
+
+        Raises:
+            OrderBookOutOfSync: If the book has no snapshot or a gap was detected
+        """
+        if not self.synced:
+            raise OrderBookOutOfSync(f"{self.symbol} order book has no snapshot")
+        if event['u'] < self.last_update_id:
+            return
+        if self._first_event:
+            if event['U'] > self.last_update_id and event['pu'] != self.last_update_id:
+                self.synced = False
+                raise OrderBookOutOfSync(f"{self.symbol} first depth event is newer than the snapshot")
+            self._first_event = False
+        elif event['pu'] != self.last_update_id:
+            self.synced = False
+            raise OrderBookOutOfSync(f"{self.symbol} depth sequence gap: expected pu={self.last_update_id}, got {event['pu']}")
+
+        for price, qty in event['b']:
+            self.bids.set(float(price), float(qty))
+        for price, qty in event['a']:
+            self.asks.set(float(price), float(qty))
+        self.last_update_id = event['u']
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best()
+
+    def spread(self) -> Optional[float]:
+        """Get the best ask minus the best bid."""
+        bid, ask = self.bids.best(), self.asks.best()
+        return ask[0] - bid[0] if bid and ask else None
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        return (ask[0] + bid[0]) / 2 if bid and ask else None
+
+    def imbalance(self, depth: int = 10) -> Optional[float]:
+        """
+        Get the depth imbalance of the best `depth` levels.
+
+        Returns:
+            (bid volume - ask volume) / (bid volume + ask volume), in [-1, 1]
+        """
+        bid_volume, ask_volume = self.bids.volume(depth), self.asks.volume(depth)
+        total = bid_volume + ask_volume
+        return (bid_volume - ask_volume) / total if total else None
+
+    def get_features(self, depth: int = 10) -> Dict:
+        """
+        Get spread and depth features for strategies.
+
+        Returns:
+            Dictionary with spread, mid price, imbalance and side volumes
+        """
+        mid = self.mid_price()
+        spread = self.spread()
+        return {
+            'spread': spread,
+            'spread_pct': spread / mid * 100 if mid else None,
+            'mid_price': mid,
+            'imbalance': self.imbalance(depth),
+            'bid_volume': self.bids.volume(depth),
+            'ask_volume': self.asks.volume(depth)
+        }
+
+
+class OrderBookManager:
+    """
+    Maintains local order books for many symbols from depth diff streams.
+
+    Follows the Binance procedure for a local book: diff events are buffered
+    until a REST snapshot has been fetched in the background, then replayed
+    onto it. A detected sequence gap drops the book back into buffering and
+    triggers the same resync automatically.
+
+    `fetch_snapshot(symbol)` must return a futures depth snapshot, e.g.
+    `BinanceConnector.get_order_book`.
+    """
+
+    def __init__(
+        self,
+        fetch_snapshot: Callable[[str], Dict],
+        url: Optional[str] = None,
+        record_path: Optional[str] = None,
+        update_speed: str = '100ms',
+        retry_delay: Optional[float] = None,
+        max_buffered_events: int = 1000
+    ):
+        self.fetch_snapshot = fetch_snapshot
+        self.url = url
+        self.record_path = record_path
+        self.update_speed = update_speed
+        self.retry_delay = settings.STREAM_RECONNECT_DELAY if retry_delay is None else retry_delay
+        self.max_buffered_events = max_buffered_events
+        self.books: Dict[str, OrderBook] = {}
+        self._buffers: Dict[str, deque] = {}
+        self._resyncing = set()
+        self._retry_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._client = None
+
+    def start(self, symbols: List[str]):
+        """
+        Subscribe to the depth diff streams of the given symbols.
+
+        Each book is snapshotted once its first diff event has been buffered.
+        Replaces any previous subscription, dropping the books of symbols not
+        given; with no symbols, nothing is subscribed.
+        """
+        self.stop()
+        with self._lock:
+            self.books = {symbol.upper(): OrderBook(symbol.upper()) for symbol in symbols}
+            self._buffers = {symbol.upper(): deque(maxlen=self.max_buffered_events) for symbol in symbols}
+        streams = [f"{symbol.lower()}@depth@{self.update_speed}" for symbol in symbols]
+        # Nothing to subscribe to; a stream URL without streams is rejected
+        if not streams:
+            return
+        self._client = BinanceStreamClient(streams, self._handle_message, url=self.url, record_path=self.record_path)
+        self._client.start()
+
+    def stop(self):
+        """Unsubscribe from all depth streams."""
+        if self._client is not None:
+            self._client.stop()
+            self._client = None
+
+    def _handle_message(self, stream: str, data: Dict):
+        if data.get('e') == 'depthUpdate':
+            self.handle_event(data['s'], data)
+
+    def handle_event(self, symbol: str, event: Dict):
+        """
+        Apply a depth diff event, buffering it while the book has no valid snapshot.
+
+        Args:
+            symbol: Trading pair symbol
+            event: Depth diff payload with U, u, pu, b and a fields
+        """
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None:
+                return
+            if book.synced:
+                try:
+                    book.apply_diff(event)
+                    return
+                except OrderBookOutOfSync as e:
+                    logger.warning(f"{str(e)}, resyncing")
+                    self._buffers[symbol].clear()
+            self._buffers[symbol].append(event)
+            if symbol in self._resyncing or time.monotonic() < self._retry_at.get(symbol, 0.0):
+                return
+            self._resyncing.add(symbol)
+        self._executor.submit(self.resync, symbol)
+
+    def resync(self, symbol: str):
+        """Fetch a fresh snapshot for a symbol and replay the buffered events onto it."""
+        try:
+            snapshot = self.fetch_snapshot(symbol)
+        except Exception as e:
+            logger.error(f"Error fetching {symbol} order book snapshot: {str(e)}")
+            with self._lock:
+                self._retry_at[symbol] = time.monotonic() + self.retry_delay
+                self._resyncing.discard(symbol)
+            return
+
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None:
+                # Unsubscribed while the snapshot was being fetched
+                self._resyncing.discard(symbol)
+                return
+            book.load_snapshot(snapshot)
+            buffered = list(self._buffers[symbol])
+            self._buffers[symbol].clear()
+            for i, event in enumerate(buffered):
+                try:
+                    book.apply_diff(event)
+                except OrderBookOutOfSync as e:
+                    # Events before the gap are covered by the next snapshot
+                    logger.warning(f"{str(e)}, fetching a newer snapshot")
+                    self._buffers[symbol].extend(buffered[i:])
+                    break
+            self._resyncing.discard(symbol)
+
+    def get_book(self, symbol: str) -> Optional[OrderBook]:
+        """Get a symbol's order book (which may not be synced yet)."""
+        return self.books.get(symbol)
+
+    def get_features(self, symbol: str, depth: int = 10) -> Optional[Dict]:
+        """Get spread and depth features of a synced book, or None."""
+        with self._lock:
+            book = self.books.get(symbol)
+            if book is None or not book.synced:
+                return None
+            return book.get_features(depth)
@@ -0,0 +1,180 @@
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from .indicator_graph import SOURCES, IndicatorGraph, build_indicator_graph
+
+logger = logging.getLogger(__name__)
+
+# Indicator graph of the current worker process, built once by _init_worker
+_worker_graph: Optional[IndicatorGraph] = None
+
+
+def attach_block(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block owned by the parent without registering it for cleanup in this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block again, but workers
+        # share the parent's resource tracker, so the registration is the one
+        # the parent drops when it unlinks the block
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(config: Dict[str, Dict], extra_periods: Sequence[int]):
+    global _worker_graph
+    _worker_graph = build_indicator_graph(config, extra_periods)
+
+
+def _compute_spans(
+    input_name: str,
+    output_name: str,
+    rows: int,
+    outputs: Sequence[str],
+    spans: Sequence[Tuple[int, int]]
+) -> int:
+    """Compute `outputs` for the given row spans of the shared OHLCV block into the shared output block."""
+    inputs = attach_block(input_name)
+    results = attach_block(output_name)
+    ohlcv = out = values = None
+    try:
+        ohlcv = np.ndarray((len(SOURCES), rows), dtype=np.float64, buffer=inputs.buf)
+        out = np.ndarray((len(outputs), rows), dtype=np.float64, buffer=results.buf)
+        for start, end in spans:
+            values = _worker_graph.evaluate_arrays(
+                {source: ohlcv[i, start:end] for i, source in enumerate(SOURCES)}, outputs
+            )
+            for j, name in enumerate(outputs):
+                out[j, start:end] = values[name]
+        return len(spans)
+    finally:
+        # Views into the blocks must be released before they can be closed
+        ohlcv = out = values = None
+        inputs.close()
+        results.close()
+
+
+class SharedOHLCV:
+    """
+    OHLCV arrays of many series packed into one shared memory block.
+
+    The block is a (5, total rows) float64 array with one row per source
+    column; each series occupies a contiguous span of columns, so a worker
+    process reads it without copying or unpickling anything.
+    """
+
+    def __init__(self, frames: Dict[Hashable, pd.DataFrame]):
+        self.keys = [key for key, df in frames.items() if df is not None]
+        self.offsets = np.concatenate([[0], np.cumsum([len(frames[key]) for key in self.keys])]).astype(int)
+        self.rows = int(self.offsets[-1])
+        self._block = shared_memory.SharedMemory(create=True, size=max(len(SOURCES) * self.rows * 8, 1))
+        self.array = np.ndarray((len(SOURCES), self.rows), dtype=np.float64, buffer=self._block.buf)
+        for key, start, end in zip(self.keys, self.offsets[:-1], self.offsets[1:]):
+            df = frames[key]
+            for i, source in enumerate(SOURCES):
+                self.array[i, start:end] = df[source].to_numpy(dtype=np.float64)
+
+    @property
+    def name(self) -> str:
+        return self._block.name
+
+    def spans(self) -> List[Tuple[int, int]]:
+        return list(zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()))
+
+    def close(self):
+        """Release and remove the shared block."""
+        self.array = None
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self) -> 'SharedOHLCV':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _chunk_spans(spans: List[Tuple[int, int]], chunks: int) -> List[List[Tuple[int, int]]]:
+    """Split consecutive spans into about `chunks` groups of similar row counts."""
+    total = spans[-1][1] if spans else 0
+    target = max(total / max(chunks, 1), 1)
+    groups, current, filled = [], [], 0
+    for span in spans:
+        current.append(span)
+        filled += span[1] - span[0]
+        if filled >= target:
+            groups.append(current)
+            current, filled = [], 0
+    if current:
+        groups.append(current)
+    return groups
+
+
+class ParallelIndicatorEngine:
+    """
+    Computes indicator sets of many series across a pool of worker processes.
+
+    OHLCV arrays are placed in shared memory and every worker writes its
+    results into a shared output block, so neither DataFrames nor result
+    arrays are pickled. Each worker builds the indicator graph once.
+
+    Args:
+        config: Indicator parameters (settings.TA_INDICATORS layout)
+        extra_periods: Additional SMA/EMA periods of the graph
+        max_workers: Number of worker processes (one per CPU if None)
+        chunks_per_worker: Work items per worker, for load balancing
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Dict],
+        extra_periods: Iterable[int] = (),
+        max_workers: Optional[int] = None,
+        chunks_per_worker: int = 4
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(config, tuple(extra_periods))
+        )
+
+    def compute(self, frames: Dict[Hashable, pd.DataFrame], outputs: Sequence[str]) -> Dict[Hashable, Dict[str, np.ndarray]]:
+        """
+        Compute indicator outputs for every series.
+
+        Args:
+            frames: DataFrames with OHLCV data, e.g. by (symbol, interval)
+            outputs: Indicator graph output names to compute
+
+        Returns:
+            Dictionary mapping each key to {output name: array}
+        """
+        outputs = list(outputs)
+        with SharedOHLCV(frames) as ohlcv:
+            results = shared_memory.SharedMemory(create=True, size=max(len(outputs) * ohlcv.rows * 8, 1))
+            try:
+                groups = _chunk_spans(ohlcv.spans(), self.max_workers * self.chunks_per_worker)
+                futures = [
+                    self._executor.submit(_compute_spans, ohlcv.name, results.name, ohlcv.rows, outputs, group)
+                    for group in groups
+                ]
+                for future in futures:
+                    future.result()
+                values = np.ndarray((len(outputs), ohlcv.rows), dtype=np.float64, buffer=results.buf).copy()
+            finally:
+                results.close()
+                results.unlink()
+
+            return {
+                key: {name: values[j, start:end] for j, name in enumerate(outputs)}
+                for key, (start, end) in zip(ohlcv.keys, ohlcv.spans())
+            }
+
+    def close(self):
+        """Shut the worker processes down."""
+        self._executor.shutdown()
@@ -0,0 +1,272 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+from binance.exceptions import BinanceAPIException
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Request priorities (lower runs first)
+PRIORITY_HIGH = 0      # orders and account state
+PRIORITY_NORMAL = 1    # live market data
+PRIORITY_LOW = 2       # bulk historical backfill
+
+# Share of the per-minute weight limit each priority may consume, so that
+# bulk work always leaves headroom for more important calls
+PRIORITY_SHARES = {
+    PRIORITY_HIGH: 1.0,
+    PRIORITY_NORMAL: 0.9,
+    PRIORITY_LOW: 0.6
+}
+
+# Fixed request weights of the futures endpoints used by the connectors
+ENDPOINT_WEIGHTS = {
+    'futures_account': 5,
+    'futures_position_information': 5,
+    'futures_exchange_info': 1,
+    'futures_create_order': 1,
+    'futures_cancel_order': 1,
+    'futures_get_open_orders': 1
+}
+
+DEFAULT_PRIORITIES = {
+    'futures_account': PRIORITY_HIGH,
+    'futures_position_information': PRIORITY_HIGH,
+    'futures_create_order': PRIORITY_HIGH,
+    'futures_cancel_order': PRIORITY_HIGH,
+    'futures_get_open_orders': PRIORITY_HIGH
+}
+
+USED_WEIGHT_HEADER = 'X-MBX-USED-WEIGHT-1M'
+
+
+def klines_request_weight(limit: int) -> int:
+    """Get the request weight of a futures klines call for the given limit."""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def depth_request_weight(limit: int) -> int:
+    """Get the request weight of a futures order book call for the given limit."""
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def request_weight(method: str, params: Dict) -> int:
+    """
+    Get the request weight of a client call.
+
+    Args:
+        method: Name of the python-binance client method
+        params: Keyword arguments of the call
+
+    Returns:
+        Request weight counted against the per-minute IP limit
+    """
+    if method == 'futures_klines':
+        return klines_request_weight(params.get('limit') or 500)
+    if method == 'futures_symbol_ticker':
+        return 1 if params.get('symbol') else 2
+    if method == 'futures_order_book':
+        return depth_request_weight(params.get('limit') or 500)
+    return ENDPOINT_WEIGHTS.get(method, 1)
+
+
+class RequestWeightGovernor:
+    """
+    Central pacing of Binance requests against the per-minute weight limit.
+
+    Callers wait in a single priority queue; a request is admitted when it is
+    at the head of the queue and its weight fits in its priority's share of
+    the current minute's budget. The local estimate of used weight is
+    corrected from the used-weight response headers, and HTTP 429/418
+    responses pause all requests for the advertised Retry-After period.
+
+    `clock` and `sleep` can be replaced for deterministic tests.
+    """
+
+    def __init__(
+        self,
+        weight_limit: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        poll_interval: float = 0.05
+    ):
+        self.weight_limit = weight_limit or settings.BINANCE_REQUEST_WEIGHT_LIMIT
+        self._clock = clock
+        self._sleep = sleep
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._window = None
+        self._used = 0
+        self._blocked_until = 0.0
+        self._requests = 0
+        self._throttled = 0
+        self._rate_limited = 0
+        self._wait_time = 0.0
+
+    def _roll_window(self, now: float):
+        window = int(now // 60)
+        if window != self._window:
+            self._window = window
+            self._used = 0
+
+    def acquire(self, weight: int, priority: int = PRIORITY_NORMAL):
+        """
+        Block until a request of the given weight may be sent.
+
+        Args:
+            weight: Request weight
+            priority: One of PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+        """
+        entry = (priority, next(self._sequence))
+        started = self._clock()
+        waited = False
+        with self._lock:
+            heapq.heappush(self._queue, entry)
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._roll_window(now)
+                budget = self.weight_limit * PRIORITY_SHARES.get(priority, 1.0)
+                if (
+                    self._queue[0] == entry
+                    and now >= self._blocked_until
+                    and (self._used + weight <= budget or self._used == 0)
+                ):
+                    heapq.heappop(self._queue)
+                    self._used += weight
+                    self._requests += 1
+                    if waited:
+                        self._throttled += 1
+                        self._wait_time += now - started
+                    return
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._queue[0] == entry:
+                    wait = (self._window + 1) * 60 - now
+                else:
+                    wait = self._poll_interval
+            waited = True
+            self._sleep(min(wait, self._poll_interval))
+
+    async def acquire_async(self, weight: int, priority: int = PRIORITY_NORMAL):
+        """Wait for admission without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.acquire, weight, priority)
+
+    def update_from_headers(self, headers):
+        """Correct the used-weight estimate from a response's headers."""
+        if not headers:
+            return
+        used = headers.get(USED_WEIGHT_HEADER) or headers.get(USED_WEIGHT_HEADER.lower())
+        if used is None:
+            return
+        with self._lock:
+            self._roll_window(self._clock())
+            # In-flight requests are already counted locally but not yet by the server
+            self._used = max(self._used, int(used))
+
+    def on_rate_limited(self, status_code: int, headers=None):
+        """Pause all requests after an HTTP 429 (rate limited) or 418 (IP banned) response."""
+        retry_after = None
+        if headers:
+            retry_after = headers.get('Retry-After') or headers.get('retry-after')
+        pause = float(retry_after) if retry_after else 60.0
+        with self._lock:
+            self._rate_limited += 1
+            self._blocked_until = max(self._blocked_until, self._clock() + pause)
+        logger.warning(f"Binance rate limit hit (HTTP {status_code}), pausing requests for {pause:.0f}s")
+
+    def utilization(self) -> float:
+        """Get the fraction of the current minute's weight limit already used."""
+        with self._lock:
+            self._roll_window(self._clock())
+            return self._used / self.weight_limit
+
+    def get_metrics(self) -> Dict:
+        """
+        Get governor metrics.
+
+        Returns:
+            Dictionary with current usage, queue depth and throttling counters
+        """
+        with self._lock:
+            now = self._clock()
+            self._roll_window(now)
+            return {
+                'used_weight': self._used,
+                'weight_limit': self.weight_limit,
+                'utilization': self._used / self.weight_limit,
+                'queued_requests': len(self._queue),
+                'blocked_for': max(self._blocked_until - now, 0.0),
+                'total_requests': self._requests,
+                'throttled_requests': self._throttled,
+                'rate_limited_responses': self._rate_limited,
+                'total_wait_time': self._wait_time
+            }
+
+    def _after_response(self, client):
+        response = getattr(client, 'response', None)
+        self.update_from_headers(getattr(response, 'headers', None))
+
+    def _handle_error(self, e: Exception):
+        if isinstance(e, BinanceAPIException) and e.status_code in (418, 429):
+            self.on_rate_limited(e.status_code, getattr(e.response, 'headers', None))
+
+    def call(self, client, method: str, priority: Optional[int] = None, **params):
+        """
+        Send a request through a python-binance client under the weight limit.
+
+        Args:
+            client: python-binance Client
+            method: Name of the client method (e.g., 'futures_klines')
+            priority: Request priority (defaults to the endpoint's priority)
+            **params: Keyword arguments for the client method
+
+        Returns:
+            The client method's response
+        """
+        if priority is None:
+            priority = DEFAULT_PRIORITIES.get(method, PRIORITY_NORMAL)
+        self.acquire(request_weight(method, params), priority)
+        try:
+            return getattr(client, method)(**params)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+        finally:
+            self._after_response(client)
+
+    async def call_async(self, client, method: str, priority: Optional[int] = None, **params):
+        """Async counterpart of `call` for python-binance's AsyncClient."""
+        if priority is None:
+            priority = DEFAULT_PRIORITIES.get(method, PRIORITY_NORMAL)
+        await self.acquire_async(request_weight(method, params), priority)
+        try:
+            return await getattr(client, method)(**params)
+        except Exception as e:
+            self._handle_error(e)
+            raise
+        finally:
+            self._after_response(client)
+
+
+# Governor shared by every connector in the process
+request_governor = RequestWeightGovernor()
@@ -0,0 +1,190 @@
+import threading
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .kline_store import INTERVAL_MS, STORED_DTYPES, MAX_KLINES_PER_REQUEST
+from .kline_window import KlineWindow
+
+logger = logging.getLogger(__name__)
+
+BASE_INTERVAL = '1m'
+BASE_MS = INTERVAL_MS[BASE_INTERVAL]
+
+# Enough base candles to rebuild the open bar of the longest supported timeframe (1d)
+BASE_HISTORY = MAX_KLINES_PER_REQUEST
+
+
+def _merge(prefix: Optional[Tuple], row: Tuple, bucket: int, interval_ms: int) -> Tuple:
+    """Combine the aggregate of a bucket's earlier base candles with its latest one."""
+    if prefix is None:
+        return (bucket, row[1], row[2], row[3], row[4], row[5], bucket + interval_ms - 1,
+                row[7], row[8], row[9], row[10])
+    return (bucket, prefix[1], max(prefix[2], row[2]), min(prefix[3], row[3]), row[4],
+            prefix[5] + row[5], bucket + interval_ms - 1, prefix[7] + row[7],
+            prefix[8] + row[8], prefix[9] + row[9], prefix[10] + row[10])
+
+
+class _DerivedSeries:
+    """Incremental aggregation state of one derived timeframe."""
+
+    def __init__(self, interval: str, window_size: int):
+        self.interval_ms = INTERVAL_MS[interval]
+        self.window = KlineWindow(window_size)
+        self.covered = None
+        self.bucket = None
+        self.prefix = None
+        self.current = None
+
+    def first_covered(self, open_time: int) -> int:
+        """Get the first bucket whose base candles all open at or after `open_time`."""
+        return -(-open_time // self.interval_ms) * self.interval_ms
+
+    def apply(self, row: Tuple, revise: bool) -> Optional[Tuple]:
+        if self.covered is None:
+            # Seeded without base candles: the stream may start mid-bucket
+            self.covered = self.first_covered(row[0])
+        if row[0] < self.covered:
+            # The bucket started before the first base candle and cannot be rebuilt
+            return None
+        bucket = row[0] - row[0] % self.interval_ms
+        if not revise:
+            if bucket == self.bucket:
+                # The previous base candle is final: fold it into the prefix
+                self.prefix = self.current
+            else:
+                self.bucket = bucket
+                self.prefix = None
+        self.current = _merge(self.prefix, row, bucket, self.interval_ms)
+        self.window.update(self.current)
+        return self.current
+
+    def closes_with(self, open_time: int) -> bool:
+        """Check whether the base candle opening at `open_time` is the last one of its bucket."""
+        return (open_time + BASE_MS) % self.interval_ms == 0
+
+
+class KlineResampler:
+    """
+    Derives higher-timeframe candles locally from one 1m base series per symbol.
+
+    Each derived timeframe keeps the running aggregate of its open bucket, so
+    applying a new or revised base candle updates every timeframe in constant
+    time, including the still-open partial bar.
+    """
+
+    def __init__(self, intervals: List[str], window_size: int = 500):
+        unsupported = [iv for iv in intervals if iv not in INTERVAL_MS or INTERVAL_MS[iv] > INTERVAL_MS['1d']]
+        if unsupported:
+            raise ValueError(f"Cannot resample to intervals: {', '.join(unsupported)}")
+        self.intervals = [iv for iv in intervals if iv != BASE_INTERVAL]
+        self.window_size = window_size
+        self._base: Dict[str, KlineWindow] = {}
+        self._derived: Dict[str, Dict[str, _DerivedSeries]] = {}
+        self._last_open: Dict[str, int] = {}
+        self._closed: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def seed(self, symbol: str, base: Dict[str, np.ndarray], history: Optional[Dict[str, Dict[str, np.ndarray]]] = None):
+        """
+        Initialise a symbol from base candles and optional exchange history.
+
+        Derived bars before the first bucket fully covered by the base candles
+        are taken from `history`; every later bar is rebuilt from the base.
+        Without base candles, the first bucket fully covered by the stream is
+        the first derived bar.
+
+        Args:
+            symbol: Trading pair symbol
+            base: Column arrays of recent 1m candles (at least BASE_HISTORY for 1d)
+            history: Column arrays of exchange candles per derived interval
+        """
+        with self._lock:
+            self._base[symbol] = KlineWindow(max(self.window_size, BASE_HISTORY))
+            self._derived[symbol] = {iv: _DerivedSeries(iv, self.window_size) for iv in self.intervals}
+            self._last_open.pop(symbol, None)
+            rows = list(zip(*(base[col].tolist() for col in STORED_DTYPES)))
+            if not rows:
+                return
+            for row in rows:
+                self._base[symbol].update(row)
+
+            for interval, series in self._derived[symbol].items():
+                # First bucket whose base candles are all available
+                covered = series.first_covered(rows[0][0])
+                series.covered = covered
+                if history and interval in history:
+                    seed = history[interval]
+                    keep = seed['timestamp'] < covered
+                    series.window.extend({col: seed[col][keep] for col in STORED_DTYPES})
+                for row in rows:
+                    series.apply(row, revise=False)
+
+            self._last_open[symbol] = rows[-1][0]
+            self._closed[symbol] = False
+
+    def last_base(self, symbol: str) -> Tuple[Optional[int], bool]:
+        """Get the open time of a symbol's last base candle (None if unseeded) and whether it is final."""
+        with self._lock:
+            return self._last_open.get(symbol), self._closed.get(symbol, False)
+
+    def update(self, symbol: str, row: Tuple, closed: bool) -> List[str]:
+        """
+        Apply a new or revised base candle.
+
+        Args:
+            symbol: Trading pair symbol
+            row: Base candle values in STORED_DTYPES column order
+            closed: Whether the base candle is final
+
+        Returns:
+            Intervals (including '1m') whose bar closed with this candle
+        """
+        with self._lock:
+            return self._apply(symbol, row, closed)
+
+    def _apply(self, symbol: str, row: Tuple, closed: bool) -> List[str]:
+        if symbol not in self._base:
+            return []
+        last_open = self._last_open.get(symbol)
+        if last_open is not None and row[0] < last_open:
+            return []
+        revise = row[0] == last_open
+
+        self._base[symbol].update(row)
+        self._last_open[symbol] = row[0]
+        self._closed[symbol] = closed
+        closed_intervals = [BASE_INTERVAL] if closed else []
+        for interval, series in self._derived[symbol].items():
+            if series.apply(row, revise) is not None and closed and series.closes_with(row[0]):
+                closed_intervals.append(interval)
+        return closed_intervals
+
+    def get_klines(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """
+        Get a copy of a symbol's candles for any supported interval.
+
+        The last bar is the still-open partial bar unless `is_closed` says otherwise.
+        """
+        with self._lock:
+            if symbol not in self._base:
+                return None
+            if interval == BASE_INTERVAL:
+                window = self._base[symbol]
+            elif interval in self._derived[symbol]:
+                window = self._derived[symbol][interval].window
+            else:
+                raise ValueError(f"Interval '{interval}' is not resampled")
+            if not len(window):
+                return None
+            df = window.to_dataframe()
+            return df.tail(self.window_size).reset_index(drop=True) if interval == BASE_INTERVAL else df
+
+    def is_closed(self, symbol: str, interval: str) -> bool:
+        """Check whether the last bar of a symbol/interval is final."""
+        with self._lock:
+            if not self._closed.get(symbol):
+                return False
+            if interval == BASE_INTERVAL:
+                return True
+            return self._derived[symbol][interval].closes_with(self._last_open[symbol])
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import logging
+from collections import defaultdict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from binance import AsyncClient
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping in a recording (rate limit state)
+RECORDED_HEADER_PREFIXES = ('x-mbx-', 'retry-after')
+
+# Serialises appends of sync and async recorders sharing a file
+_write_lock = threading.Lock()
+
+
+class ReplayMiss(LookupError):
+    """Raised when a replayed request has no recorded response."""
+
+
+class RecordedResponse:
+    """Minimal stand-in for the HTTP response attributes the connectors read."""
+
+    def __init__(self, status_code: int = 200, headers: Optional[Dict] = None, text: str = ''):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+
+def _request_key(method: str, params: Dict) -> Tuple[str, str]:
+    return method, json.dumps({k: v for k, v in params.items() if v is not None}, sort_keys=True, default=str)
+
+
+def _recorded_headers(response) -> Dict:
+    headers = getattr(response, 'headers', None) or {}
+    return {k: v for k, v in headers.items() if k.lower().startswith(RECORDED_HEADER_PREFIXES)}
+
+
+def load_recorded_responses(path: str) -> List[Dict]:
+    """
+    Load REST responses recorded by RecordingClient.
+
+    Args:
+        path: Path of a file with one JSON record per line
+
+    Returns:
+        List of records in recording order
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingClient:
+    """
+    Proxy around a python-binance Client that appends every call to a JSONL file.
+
+    Each record holds the method name, its keyword arguments, the decoded
+    response (or Binance error), the rate limit response headers and the
+    elapsed time. Attributes other than client methods pass straight through.
+    """
+
+    def __init__(self, client, path: str):
+        self._client = client
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    @property
+    def response(self):
+        return getattr(self._client, 'response', None)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        return partial(self._call, name, attr)
+
+    def _call(self, method: str, func: Callable, **params):
+        started = time.perf_counter()
+        try:
+            result = func(**params)
+        except BinanceAPIException as e:
+            self._record(method, params, started, error=e)
+            raise
+        self._record(method, params, started, result=result)
+        return result
+
+    def _record(self, method: str, params: Dict, started: float, result=None, error: Optional[BinanceAPIException] = None):
+        record = {
+            'method': method,
+            'params': {k: v for k, v in params.items() if v is not None},
+            'elapsed': time.perf_counter() - started
+        }
+        if error is not None:
+            record['status'] = error.status_code
+            record['headers'] = _recorded_headers(error.response)
+            record['error'] = {'code': error.code, 'msg': error.message}
+        else:
+            record['status'] = 200
+            record['headers'] = _recorded_headers(self.response)
+            record['response'] = result
+        line = json.dumps(record, default=str)
+        with _write_lock:
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+
+
+class AsyncRecordingClient(RecordingClient):
+    """RecordingClient counterpart for python-binance's AsyncClient."""
+
+    async def _call(self, method: str, func: Callable, **params):
+        started = time.perf_counter()
+        try:
+            result = await func(**params)
+        except BinanceAPIException as e:
+            self._record(method, params, started, error=e)
+            raise
+        self._record(method, params, started, result=result)
+        return result
+
+
+class ReplayClient:
+    """
+    Offline stand-in for a python-binance Client serving recorded responses.
+
+    A call is answered with the next recorded response for the same method
+    and parameters, cycling when they run out. Unless `strict`, a call with
+    unrecorded parameters falls back to the method's responses in recording
+    order. Latency (fixed plus uniform jitter) and injected errors are drawn
+    from a seeded generator, so a run is reproducible.
+
+    Args:
+        recording: Path of a recording, or its records
+        latency: Seconds added to every call
+        jitter: Upper bound of extra uniform random latency in seconds
+        error_rate: Probability that a call fails with `error_status`
+        error_status: HTTP status of injected errors (429/418 carry Retry-After)
+        strict: Raise ReplayMiss instead of falling back to other parameters
+        seed: Seed of the latency and error generator
+    """
+
+    def __init__(
+        self,
+        recording: Union[str, List[Dict]],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        strict: bool = False,
+        seed: Optional[int] = None
+    ):
+        self.records = load_recorded_responses(recording) if isinstance(recording, str) else recording
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.strict = strict
+        self.seed = seed
+        self.response = None
+        self.calls = defaultdict(int)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._exact: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        self._by_method: Dict[str, List[Dict]] = defaultdict(list)
+        self._positions: Dict[Tuple, int] = defaultdict(int)
+        for record in self.records:
+            self._exact[_request_key(record['method'], record['params'])].append(record)
+            self._by_method[record['method']].append(record)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return partial(self._request, name)
+
+    def _next(self, method: str, params: Dict) -> Tuple[Dict, float, bool]:
+        """Pick the record to serve, the latency to apply and whether to inject an error."""
+        key = _request_key(method, params)
+        with self._lock:
+            self.calls[method] += 1
+            if key in self._exact:
+                candidates = self._exact[key]
+            elif not self.strict and method in self._by_method:
+                key = (method,)
+                candidates = self._by_method[method]
+            else:
+                raise ReplayMiss(f"No recorded response for {method}({key[1]})")
+            record = candidates[self._positions[key] % len(candidates)]
+            self._positions[key] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        return record, delay, fail
+
+    def _respond(self, record: Dict, fail: bool):
+        if fail:
+            headers = {'Retry-After': '1'} if self.error_status in (418, 429) else {}
+            record = {'status': self.error_status, 'headers': headers,
+                      'error': {'code': -1000, 'msg': 'Injected replay error'}}
+        text = json.dumps(record['error'] if 'error' in record else record['response'])
+        response = RecordedResponse(record['status'], dict(record.get('headers') or {}), text)
+        self.response = response
+        if 'error' in record:
+            raise BinanceAPIException(response, record['status'], text)
+        return record['response']
+
+    def _request(self, method: str, **params):
+        record, delay, fail = self._next(method, params)
+        if delay:
+            time.sleep(delay)
+        return self._respond(record, fail)
+
+    def to_async(self) -> 'AsyncReplayClient':
+        """Create an async replay client serving the same recording with the same settings."""
+        return AsyncReplayClient(
+            self.records, latency=self.latency, jitter=self.jitter, error_rate=self.error_rate,
+            error_status=self.error_status, strict=self.strict, seed=self.seed
+        )
+
+
+class AsyncReplayClient(ReplayClient):
+    """ReplayClient counterpart for python-binance's AsyncClient."""
+
+    async def _request(self, method: str, **params):
+        record, delay, fail = self._next(method, params)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._respond(record, fail)
+
+    async def close_connection(self):
+        pass
+
+
+def _replay_client(client_class):
+    return client_class(
+        settings.REST_RECORDING_PATH,
+        latency=settings.REST_REPLAY_LATENCY,
+        jitter=settings.REST_REPLAY_JITTER,
+        error_rate=settings.REST_REPLAY_ERROR_RATE,
+        seed=settings.REST_REPLAY_SEED
+    )
+
+
+def create_client():
+    """Create the REST client selected by REST_MODE ('live', 'record' or 'replay')."""
+    if settings.REST_MODE == 'replay':
+        return _replay_client(ReplayClient)
+    client = Client(settings.BINANCE_API_KEY, settings.BINANCE_API_SECRET)
+    if settings.REST_MODE == 'record':
+        return RecordingClient(client, settings.REST_RECORDING_PATH)
+    return client
+
+
+async def create_async_client():
+    """Create the async REST client selected by REST_MODE ('live', 'record' or 'replay')."""
+    if settings.REST_MODE == 'replay':
+        return _replay_client(AsyncReplayClient)
+    client = await AsyncClient.create(settings.BINANCE_API_KEY, settings.BINANCE_API_SECRET)
+    if settings.REST_MODE == 'record':
+        return AsyncRecordingClient(client, settings.REST_RECORDING_PATH)
+    return client
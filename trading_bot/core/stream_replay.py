@@ -0,0 +1,106 @@
+import asyncio
+import json
+import random
+import threading
+import logging
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlparse, parse_qs
+from websockets.asyncio.server import serve
+
+logger = logging.getLogger(__name__)
+
+
+def load_recorded_frames(path: str) -> List[Dict]:
+    """
+    Load combined-stream frames recorded by BinanceStreamClient.
+
+    Args:
+        path: Path of a file with one JSON frame per line
+
+    Returns:
+        List of frames in recording order
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class StreamReplayServer:
+    """
+    Local stand-in for the Binance combined stream endpoint.
+
+    Each connection receives the recorded frames belonging to the streams it
+    subscribed to via the `?streams=` query, in recording order, after which
+    the connection is held open until the client disconnects. Frames can be
+    dropped at random, from a seeded generator, to exercise gap handling.
+
+    Args:
+        frames: Path of a recording, or its frames
+        host: Interface to listen on
+        port: Port to listen on (any free one if 0)
+        frame_delay: Seconds to wait after each frame sent
+        drop_rate: Probability that a frame is not sent
+        seed: Seed of the drop generator
+    """
+
+    def __init__(
+        self,
+        frames: Union[str, List[Dict]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        frame_delay: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.frames = load_recorded_frames(frames) if isinstance(frames, str) else frames
+        self.host = host
+        self.port = port
+        self.frame_delay = frame_delay
+        self.drop_rate = drop_rate
+        self._random = random.Random(seed)
+        self._loop = None
+        self._thread = None
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        """Combined stream base URL to pass to BinanceStreamClient."""
+        return f"ws://{self.host}:{self.port}/stream"
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the stream URL."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_server(), self._loop).result()
+        return self.url
+
+    def stop(self):
+        """Stop serving and close all connections."""
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop_server(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+
+    async def _start_server(self):
+        self._server = await serve(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop_server(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, ws):
+        query = parse_qs(urlparse(ws.request.path).query)
+        streams = set(query.get('streams', [''])[0].split('/'))
+        for frame in self.frames:
+            if frame.get('stream') not in streams:
+                continue
+            if self.drop_rate > 0 and self._random.random() < self.drop_rate:
+                continue
+            await ws.send(json.dumps(frame))
+            if self.frame_delay:
+                await asyncio.sleep(self.frame_delay)
+        await ws.wait_closed()
@@ -0,0 +1,513 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+
+NAN = float('nan')
+
+
+def _is_zero(value: float) -> bool:
+    """TA-Lib's TA_IS_ZERO."""
+    return -1e-14 < value < 1e-14
+
+
+def _open_time_ms(value) -> int:
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).value // 1_000_000
+    return int(value)
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    greatest = high - low
+    value = abs(prev_close - high)
+    if value > greatest:
+        greatest = value
+    value = abs(prev_close - low)
+    if value > greatest:
+        greatest = value
+    return greatest
+
+
+class _Indicator(ABC):
+    """
+    Base of the streaming indicators.
+
+    `update` applies the next candle's input, or with `revise=True` replaces
+    the input of the last one: the scalar state named in `_fields` is saved
+    before every new input and restored before a revision. Buffers are rings
+    one slot longer than the window, so a revision rewrites the same slot
+    without losing the value about to leave the window.
+    """
+
+    _fields: Tuple[str, ...] = ('_count',)
+
+    def __init__(self):
+        self._count = 0
+        self._saved = None
+
+    def update(self, *values, revise: bool = False):
+        if revise and self._saved is not None:
+            for name, value in zip(self._fields, self._saved):
+                setattr(self, name, value)
+        else:
+            revise = False
+            self._saved = tuple(getattr(self, name) for name in self._fields)
+        return self._step(revise, *values)
+
+    @abstractmethod
+    def _step(self, revise: bool, *values):
+        """Apply one input to the restored state and return the indicator value(s)."""
+        pass
+
+
+class SMA(_Indicator):
+    """Simple moving average, summed in the same order as TA-Lib's SMA."""
+
+    _fields = ('_count', '_total')
+
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self._total = 0.0
+        self._buffer = [0.0] * (period + 1)
+
+    def _step(self, revise: bool, value: float) -> float:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        self._buffer[i % (n + 1)] = value
+        if i < n - 1:
+            self._total += value
+            return NAN
+        total = self._total + value
+        self._total = total - self._buffer[(i - n + 1) % (n + 1)]
+        return total / n
+
+
+class EMA(_Indicator):
+    """
+    Exponential moving average seeded with the SMA of its first window.
+
+    Args:
+        period: EMA period
+        seed_at: Index of the first output (TA-Lib's MACD seeds the fast EMA
+            on the slow EMA's first index)
+    """
+
+    _fields = ('_count', '_value')
+
+    def __init__(self, period: int, seed_at: Optional[int] = None):
+        super().__init__()
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.seed_at = period - 1 if seed_at is None else seed_at
+        self._value = NAN
+        self._buffer = [0.0] * period
+
+    def _step(self, revise: bool, value: float) -> float:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        if i < self.seed_at:
+            self._buffer[i % n] = value
+            return NAN
+        if i == self.seed_at:
+            self._buffer[i % n] = value
+            total = 0.0
+            for j in range(i - n + 1, i + 1):
+                total += self._buffer[j % n]
+            self._value = total / n
+        else:
+            self._value = ((value - self._value) * self.k) + self._value
+        return self._value
+
+
+class RSI(_Indicator):
+    """Wilder's relative strength index; the first value is at index `period`."""
+
+    _fields = ('_count', '_prev', '_gain', '_loss')
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.period = period
+        self._prev = NAN
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _step(self, revise: bool, value: float) -> float:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        if i == 0:
+            self._prev = value
+            return NAN
+        diff = value - self._prev
+        self._prev = value
+        if i > n:
+            self._gain *= n - 1
+            self._loss *= n - 1
+        if diff < 0:
+            self._loss -= diff
+        else:
+            self._gain += diff
+        if i < n:
+            return NAN
+        self._gain /= n
+        self._loss /= n
+        total = self._gain + self._loss
+        return 100.0 * (self._gain / total) if not _is_zero(total) else 0.0
+
+
+class MACD(_Indicator):
+    """MACD line, signal and histogram, all starting at index slow + signal - 2."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__()
+        if slow < fast:
+            fast, slow = slow, fast
+        self.slow = slow
+        self._fast = EMA(fast, seed_at=slow - 1)
+        self._slow = EMA(slow)
+        self._signal = EMA(signal)
+
+    def _step(self, revise: bool, value: float) -> Tuple[float, float, float]:
+        i = self._count
+        self._count = i + 1
+        fast = self._fast.update(value, revise=revise)
+        slow = self._slow.update(value, revise=revise)
+        if i < self.slow - 1:
+            return NAN, NAN, NAN
+        macd = fast - slow
+        signal = self._signal.update(macd, revise=revise)
+        if math.isnan(signal):
+            return NAN, NAN, NAN
+        return macd, signal, macd - signal
+
+
+class RollingExtreme:
+    """
+    Rolling maximum or minimum over a fixed window with a monotonic deque.
+
+    Each update is amortised O(1). The entries evicted by the last update are
+    kept so that a revision of the last value can put them back.
+    """
+
+    def __init__(self, period: int, highest: bool = True):
+        self.period = period
+        self.highest = highest
+        self._window = deque()
+        self._count = 0
+        self._undo = None
+
+    def update(self, value: float, revise: bool = False) -> float:
+        window = self._window
+        if revise and self._undo is not None:
+            back, front = self._undo
+            window.extendleft(reversed(front))
+            window.pop()
+            window.extend(reversed(back))
+            self._count -= 1
+
+        i = self._count
+        self._count = i + 1
+        back = []
+        if self.highest:
+            while window and window[-1][1] <= value:
+                back.append(window.pop())
+        else:
+            while window and window[-1][1] >= value:
+                back.append(window.pop())
+        window.append((i, value))
+        front = []
+        while window[0][0] <= i - self.period:
+            front.append(window.popleft())
+        self._undo = (back, front)
+        return window[0][1]
+
+    def current(self) -> Tuple[int, float]:
+        """Get the (update number, value) of the current extreme; ties go to the latest update."""
+        return self._window[0]
+
+
+class STOCH(_Indicator):
+    """Slow stochastic (SMA smoothing), both lines starting at index fastk + slowk + slowd - 3."""
+
+    def __init__(self, fastk_period: int = 14, slowk_period: int = 3, slowd_period: int = 3):
+        super().__init__()
+        self.fastk_period = fastk_period
+        self._highest = RollingExtreme(fastk_period, highest=True)
+        self._lowest = RollingExtreme(fastk_period, highest=False)
+        self._slowk = SMA(slowk_period)
+        self._slowd = SMA(slowd_period)
+
+    def _step(self, revise: bool, high: float, low: float, close: float) -> Tuple[float, float]:
+        i = self._count
+        self._count = i + 1
+        highest = self._highest.update(high, revise=revise)
+        lowest = self._lowest.update(low, revise=revise)
+        if i < self.fastk_period - 1:
+            return NAN, NAN
+        diff = (highest - lowest) / 100.0
+        fastk = (close - lowest) / diff if diff != 0.0 else 0.0
+        slowk = self._slowk.update(fastk, revise=revise)
+        if math.isnan(slowk):
+            return NAN, NAN
+        slowd = self._slowd.update(slowk, revise=revise)
+        if math.isnan(slowd):
+            return NAN, NAN
+        return slowk, slowd
+
+
+class BBANDS(_Indicator):
+    """Bollinger Bands around an SMA with the population standard deviation from running sums."""
+
+    _fields = ('_count', '_total2')
+
+    def __init__(self, period: int = 20, nbdevup: float = 2.0, nbdevdn: float = 2.0):
+        super().__init__()
+        self.period = period
+        self.nbdevup = float(nbdevup)
+        self.nbdevdn = float(nbdevdn)
+        self._middle = SMA(period)
+        self._total2 = 0.0
+        self._buffer = [0.0] * (period + 1)
+
+    def _step(self, revise: bool, value: float) -> Tuple[float, float, float]:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        self._buffer[i % (n + 1)] = value
+        middle = self._middle.update(value, revise=revise)
+        if i < n - 1:
+            self._total2 += value * value
+            return NAN, NAN, NAN
+        total2 = self._total2 + value * value
+        mean2 = total2 / n
+        trailing = self._buffer[(i - n + 1) % (n + 1)]
+        self._total2 = total2 - trailing * trailing
+        mean2 -= middle * middle
+        std = math.sqrt(mean2) if not mean2 < 1e-14 else 0.0
+        if self.nbdevup == self.nbdevdn:
+            if self.nbdevup != 1.0:
+                std *= self.nbdevup
+            return middle + std, middle, middle - std
+        return middle + std * self.nbdevup, middle, middle - std * self.nbdevdn
+
+
+class ATR(_Indicator):
+    """Wilder's average true range; the first value is at index `period`."""
+
+    _fields = ('_count', '_prev_close', '_total', '_atr')
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.period = period
+        self._prev_close = NAN
+        self._total = 0.0
+        self._atr = NAN
+
+    def _step(self, revise: bool, high: float, low: float, close: float) -> float:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        if i == 0:
+            self._prev_close = close
+            return NAN
+        tr = _true_range(high, low, self._prev_close)
+        self._prev_close = close
+        if i < n:
+            self._total += tr
+            return NAN
+        if i == n:
+            self._atr = (self._total + tr) / n
+        else:
+            self._atr = ((self._atr * (n - 1)) + tr) / n
+        return self._atr
+
+
+class DMI(_Indicator):
+    """
+    ADX with +DI and -DI from one shared Wilder smoothing of TR and DM.
+
+    +DI/-DI start at index `period`, ADX at index 2 * period - 1.
+    """
+
+    _fields = (
+        '_count', '_prev_high', '_prev_low', '_prev_close',
+        '_plus_dm', '_minus_dm', '_tr', '_sum_dx', '_adx'
+    )
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.period = period
+        self._prev_high = self._prev_low = self._prev_close = NAN
+        self._plus_dm = self._minus_dm = self._tr = self._sum_dx = 0.0
+        self._adx = NAN
+
+    def _step(self, revise: bool, high: float, low: float, close: float) -> Tuple[float, float, float]:
+        n = self.period
+        i = self._count
+        self._count = i + 1
+        if i == 0:
+            self._prev_high, self._prev_low, self._prev_close = high, low, close
+            return NAN, NAN, NAN
+        diff_p = high - self._prev_high
+        diff_m = self._prev_low - low
+        self._prev_high, self._prev_low = high, low
+        tr = _true_range(high, low, self._prev_close)
+        self._prev_close = close
+
+        if i >= n:
+            self._minus_dm -= self._minus_dm / n
+            self._plus_dm -= self._plus_dm / n
+        if diff_m > 0 and diff_p < diff_m:
+            self._minus_dm += diff_m
+        elif diff_p > 0 and diff_p > diff_m:
+            self._plus_dm += diff_p
+        if i < n:
+            self._tr += tr
+            return NAN, NAN, NAN
+        self._tr = self._tr - (self._tr / n) + tr
+
+        plus_di = minus_di = 0.0
+        dx = None
+        if not _is_zero(self._tr):
+            minus_di = 100.0 * (self._minus_dm / self._tr)
+            plus_di = 100.0 * (self._plus_dm / self._tr)
+            total = minus_di + plus_di
+            if not _is_zero(total):
+                dx = 100.0 * (abs(minus_di - plus_di) / total)
+
+        if i < 2 * n - 1:
+            if dx is not None:
+                self._sum_dx += dx
+            return NAN, plus_di, minus_di
+        if i == 2 * n - 1:
+            if dx is not None:
+                self._sum_dx += dx
+            self._adx = self._sum_dx / n
+        elif dx is not None:
+            self._adx = ((self._adx * (n - 1)) + dx) / n
+        return self._adx, plus_di, minus_di
+
+
+class OBV(_Indicator):
+    """On-balance volume, starting from the first candle's volume."""
+
+    _fields = ('_count', '_prev_close', '_obv')
+
+    def __init__(self):
+        super().__init__()
+        self._prev_close = NAN
+        self._obv = 0.0
+
+    def _step(self, revise: bool, close: float, volume: float) -> float:
+        if self._count == 0:
+            self._obv = volume
+        elif close > self._prev_close:
+            self._obv += volume
+        elif close < self._prev_close:
+            self._obv -= volume
+        self._count += 1
+        self._prev_close = close
+        return self._obv
+
+
+class StreamingIndicators:
+    """
+    Incremental indicator engine for one symbol/interval series.
+
+    Keeps the state of every indicator of `calculate_all_indicators` that has
+    a constant-time update (moving averages, RSI, MACD, stochastic, Bollinger
+    and Keltner bands, ATR, ADX/DI, OBV and volume SMA) and updates all of
+    them per new or revised candle. Values follow TA-Lib's seeding and
+    arithmetic order, so they match the batch functions exactly or to within
+    floating-point rounding.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Dict]] = None):
+        config = config or settings.TA_INDICATORS
+        self._sma = {period: SMA(period) for period in config['SMA']['periods']}
+        self._ema = {period: EMA(period) for period in config['EMA']['periods']}
+        self._rsi = RSI(config['RSI']['period'])
+        self._macd = MACD(config['MACD']['fast'], config['MACD']['slow'], config['MACD']['signal'])
+        self._stoch = STOCH(14, 3, 3)
+        self._bbands = BBANDS(config['BB']['period'], config['BB']['std_dev'], config['BB']['std_dev'])
+        self._atr = ATR(config['ATR']['period'])
+        self._dmi = DMI(14)
+        self._obv = OBV()
+        self._volume_sma = SMA(20)
+        self._last_open_time = None
+        self.values: Dict[str, Dict[str, float]] = {}
+
+    def update(self, high: float, low: float, close: float, volume: float, revise: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Apply a new candle, or replace the last one.
+
+        Args:
+            high: Candle high
+            low: Candle low
+            close: Candle close
+            volume: Candle volume
+            revise: Whether the candle replaces the last one (still-open candle update)
+
+        Returns:
+            Latest indicator values by category (NaN until warmed up)
+        """
+        trend = {f'SMA_{period}': sma.update(close, revise=revise) for period, sma in self._sma.items()}
+        trend.update({f'EMA_{period}': ema.update(close, revise=revise) for period, ema in self._ema.items()})
+        trend['ADX'], trend['DI_plus'], trend['DI_minus'] = self._dmi.update(high, low, close, revise=revise)
+
+        momentum = {'RSI': self._rsi.update(close, revise=revise)}
+        momentum['slowk'], momentum['slowd'] = self._stoch.update(high, low, close, revise=revise)
+        momentum['MACD'], momentum['MACD_signal'], momentum['MACD_hist'] = self._macd.update(close, revise=revise)
+
+        upper, middle, lower = self._bbands.update(close, revise=revise)
+        atr = self._atr.update(high, low, close, revise=revise)
+        volatility = {
+            'BB_upper': upper,
+            'BB_middle': middle,
+            'BB_lower': lower,
+            'ATR': atr,
+            'KC_upper': middle + (2 * atr),
+            'KC_lower': middle - (2 * atr)
+        }
+
+        volume_indicators = {
+            'OBV': self._obv.update(close, volume, revise=revise),
+            'Volume_SMA': self._volume_sma.update(volume, revise=revise)
+        }
+
+        self.values = {'trend': trend, 'momentum': momentum, 'volatility': volatility, 'volume': volume_indicators}
+        return self.values
+
+    def update_row(self, row: Sequence) -> Dict[str, Dict[str, float]]:
+        """
+        Apply a candle row in kline column order (timestamp, open, high, low, close, volume, ...).
+
+        A row with the same open time as the previous one revises it.
+        """
+        open_time = _open_time_ms(row[0])
+        revise = open_time == self._last_open_time
+        self._last_open_time = open_time
+        return self.update(float(row[2]), float(row[3]), float(row[4]), float(row[5]), revise=revise)
+
+    def seed(self, df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """
+        Warm the engine up on historical candles.
+
+        Args:
+            df: DataFrame with OHLCV data, oldest first
+
+        Returns:
+            Indicator values after the last candle
+        """
+        columns = [np.asarray(df[col], dtype=np.float64).tolist() for col in ('high', 'low', 'close', 'volume')]
+        for high, low, close, volume in zip(*columns):
+            self.update(high, low, close, volume)
+        if 'timestamp' in df.columns and len(df):
+            self._last_open_time = _open_time_ms(df['timestamp'].iloc[-1])
+        return self.values
@@ -0,0 +1,241 @@
+import math
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from .streaming_indicators import RollingExtreme
+from .ta_backend import ta
+
+
+def find_swing_points(high: np.ndarray, low: np.ndarray, window: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find swing highs and lows: bars that are the extreme of the window centered on them.
+
+    The window spans `window // 2` bars before the bar and the rest after
+    it, like a centered rolling window. Among equal extremes the latest bar
+    wins, so a flat top or bottom yields one swing. Runs in O(n) with the
+    rolling extremes of the bars before and after each candidate.
+
+    Args:
+        high: High prices
+        low: Low prices
+        window: Number of bars in the centered window (at least 3)
+
+    Returns:
+        Tuple of (swing high indices, swing low indices)
+    """
+    if window < 3:
+        raise ValueError("Swing window must span at least 3 bars")
+    left = window // 2
+    right = window - 1 - left
+    high = pd.Series(np.asarray(high, dtype=np.float64))
+    low = pd.Series(np.asarray(low, dtype=np.float64))
+    # Extremes of the `left` bars before and the `right` bars after each bar
+    before_high = high.rolling(left).max().shift(1).to_numpy()
+    after_high = high.rolling(right).max().shift(-right).to_numpy()
+    before_low = low.rolling(left).min().shift(1).to_numpy()
+    after_low = low.rolling(right).min().shift(-right).to_numpy()
+    highs = high.to_numpy()
+    lows = low.to_numpy()
+    swing_highs = np.flatnonzero((highs >= before_high) & (highs > after_high))
+    swing_lows = np.flatnonzero((lows <= before_low) & (lows < after_low))
+    return swing_highs, swing_lows
+
+
+class PriceLevel:
+    """A cluster of swing points at about the same price."""
+
+    def __init__(self, price: float, index: int):
+        self.price = price
+        self.touches = 1
+        self.first_index = index
+        self.last_index = index
+
+    def add(self, price: float, index: int):
+        """Add a touch, moving the level to the mean of its touches."""
+        self.touches += 1
+        self.price += (price - self.price) / self.touches
+        self.last_index = max(self.last_index, index)
+
+    def merge(self, other: 'PriceLevel'):
+        """Absorb another level's touches."""
+        touches = self.touches + other.touches
+        self.price = (self.price * self.touches + other.price * other.touches) / touches
+        self.touches = touches
+        self.first_index = min(self.first_index, other.first_index)
+        self.last_index = max(self.last_index, other.last_index)
+
+    def __repr__(self) -> str:
+        return f"PriceLevel(price={self.price}, touches={self.touches}, last_index={self.last_index})"
+
+
+class LevelClusters:
+    """
+    Price levels of one side, sorted by price.
+
+    A swing within the tolerance of the nearest level is added to it;
+    otherwise it starts a new level. A level that moves within the
+    tolerance of its neighbour absorbs it.
+    """
+
+    def __init__(self):
+        self.levels: List[PriceLevel] = []
+        self._prices: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def add(self, price: float, index: int, tolerance: float):
+        """Add a swing point at `index`."""
+        prices = self._prices
+        i = bisect_left(prices, price)
+        below = price - prices[i - 1] if i else math.inf
+        above = prices[i] - price if i < len(prices) else math.inf
+        nearest, distance = (i - 1, below) if below <= above else (i, above)
+        if distance > tolerance:
+            self.levels.insert(i, PriceLevel(price, index))
+            prices.insert(i, price)
+            return
+
+        level = self.levels[nearest]
+        moved_up = price > level.price
+        level.add(price, index)
+        self._prices[nearest] = level.price
+        neighbour = nearest + 1 if moved_up else nearest - 1
+        if 0 <= neighbour < len(self.levels) and abs(self._prices[neighbour] - level.price) <= tolerance:
+            level.merge(self.levels[neighbour])
+            self._prices[nearest] = level.price
+            del self.levels[neighbour]
+            del self._prices[neighbour]
+
+    def ranked(self, limit: Optional[int] = None) -> List[PriceLevel]:
+        """Get the levels by touch count, then by most recent touch."""
+        return sorted(self.levels, key=lambda level: (level.touches, level.last_index), reverse=True)[:limit]
+
+
+class SupportResistanceTracker:
+    """
+    Support and resistance levels from clustered swing points, updated per candle.
+
+    Swing lows form support levels and swing highs resistance levels. A
+    swing is confirmed once the bars after it have closed and is clustered
+    with levels within `tolerance` ATRs. Each update is amortised O(1)
+    plus a binary search over the levels.
+
+    Args:
+        window: Number of bars in the window centered on a swing
+        atr_period: Period of the ATR scaling the cluster tolerance
+        tolerance: Cluster tolerance in ATRs
+    """
+
+    def __init__(self, window: int = 20, atr_period: int = 14, tolerance: float = 0.5):
+        if window < 3:
+            raise ValueError("Swing window must span at least 3 bars")
+        self.window = window
+        self.right = window - 1 - window // 2
+        self.atr_period = atr_period
+        self.tolerance = tolerance
+        self.support = LevelClusters()
+        self.resistance = LevelClusters()
+        self.count = 0
+        self._highs = RollingExtreme(window, highest=True)
+        self._lows = RollingExtreme(window, highest=False)
+        self._offset = 0
+        self._prev_close = math.nan
+        self._tr_total = 0.0
+        self._atr = math.nan
+
+    def _update_atr(self, high: float, low: float, close: float) -> float:
+        """Wilder's ATR, seeded like TA-Lib with the mean of the first `atr_period` true ranges."""
+        i = self.count
+        prev_close, self._prev_close = self._prev_close, close
+        if i == 0:
+            return math.nan
+        tr = max(high - low, abs(prev_close - high), abs(prev_close - low))
+        n = self.atr_period
+        if i < n:
+            self._tr_total += tr
+        elif i == n:
+            self._atr = (self._tr_total + tr) / n
+        else:
+            self._atr = ((self._atr * (n - 1)) + tr) / n
+        return self._atr
+
+    def _tolerance(self, atr: float) -> float:
+        return self.tolerance * atr if not math.isnan(atr) else 0.0
+
+    def update(self, high: float, low: float, close: float) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Apply the next closed candle.
+
+        Returns:
+            Tuple of the (swing high, swing low) prices confirmed by this candle, or None
+        """
+        atr = self._update_atr(high, low, close)
+        j = self.count
+        self.count = j + 1
+        self._highs.update(high)
+        self._lows.update(low)
+        if j < self.window - 1:
+            return None, None
+
+        center = j - self.right
+        swing_high = swing_low = None
+        index, value = self._highs.current()
+        if index + self._offset == center:
+            swing_high = value
+            self.resistance.add(value, center, self._tolerance(atr))
+        index, value = self._lows.current()
+        if index + self._offset == center:
+            swing_low = value
+            self.support.add(value, center, self._tolerance(atr))
+        return swing_high, swing_low
+
+    def seed(self, df: pd.DataFrame):
+        """
+        Build the levels of a candle history at once, then continue incrementally.
+
+        Args:
+            df: DataFrame with high, low and close columns, oldest first (not modified)
+        """
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        n = len(close)
+        if n <= max(self.window, self.atr_period + 1):
+            for values in zip(high.tolist(), low.tolist(), close.tolist()):
+                self.update(*values)
+            return
+
+        atr = ta.ATR(high, low, close, timeperiod=self.atr_period)
+        swing_highs, swing_lows = find_swing_points(high, low, self.window)
+        # Clustered in order with the ATR of the confirming candle, as update() does
+        tolerances = np.nan_to_num(self.tolerance * atr, nan=0.0)
+        for clusters, prices, swings in ((self.resistance, high, swing_highs), (self.support, low, swing_lows)):
+            confirmed = swings + self.right
+            for index, price, tolerance in zip(swings.tolist(), prices[swings].tolist(), tolerances[confirmed].tolist()):
+                clusters.add(price, index, tolerance)
+
+        # Only the last window of candles affects the swings still to confirm
+        self.count = n
+        self._offset = n - self.window
+        for h, l in zip(high[-self.window:].tolist(), low[-self.window:].tolist()):
+            self._highs.update(h)
+            self._lows.update(l)
+        self._prev_close = float(close[-1])
+        self._atr = float(atr[-1])
+
+    def get_levels(self, max_levels: Optional[int] = 10) -> Dict[str, List[float]]:
+        """
+        Get the strongest levels.
+
+        Args:
+            max_levels: Number of levels per side (all if None)
+
+        Returns:
+            Dictionary with 'support' and 'resistance' prices, strongest first
+        """
+        return {
+            'support': [level.price for level in self.support.ranked(max_levels)],
+            'resistance': [level.price for level in self.resistance.ranked(max_levels)]
+        }
@@ -0,0 +1,38 @@
+import importlib
+import logging
+from types import ModuleType
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Modules providing TA-Lib's function API
+BACKENDS = {
+    'talib': 'talib',
+    'numba': 'trading_bot.core.numba_kernels'
+}
+
+
+def load_backend(name: str = 'auto') -> ModuleType:
+    """
+    Load the module whose indicator functions (SMA, RSI, CDLDOJI, ...) the indicator graph uses.
+
+    Args:
+        name: 'talib' (native TA-Lib), 'numba' (compiled kernels) or 'auto'
+            for TA-Lib when it is installed and the compiled kernels otherwise
+
+    Returns:
+        Backend module
+    """
+    if name == 'auto':
+        try:
+            return importlib.import_module(BACKENDS['talib'])
+        except ImportError:
+            logger.info("TA-Lib is not installed, using the compiled indicator kernels")
+            name = 'numba'
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TA backend '{name}', expected one of {['auto', *BACKENDS]}")
+    return importlib.import_module(BACKENDS[name])
+
+
+# Backend selected by settings.TA_BACKEND
+ta = load_backend(settings.TA_BACKEND)
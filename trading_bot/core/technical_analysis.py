@@ -1,34 +1,140 @@
 import pandas as pd
 import numpy as np
-import sys
-import os
-
-# Add TA-Lib to Python path
-ta_lib_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'ta-lib-python-master')
-sys.path.append(ta_lib_path)
-
-import talib
-from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator, IchimokuIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator, WilliamsRIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import VolumeWeightedAveragePrice, OnBalanceVolumeIndicator
-from typing import Dict, List, Optional, Union
+import json
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import logging
 from ..config.settings import settings
+from ..strategies.base_strategy import BaseStrategy
+from .batch_indicators import BatchIndicators, compute_batch_indicators, stack_frames
+from .cache import LRUCache
+from .candlestick_patterns import PatternScan, pattern_lookback, scan_patterns
+from .compact_indicators import CompactIndicatorCategory, compact_indicators
+from .indicator_graph import GraphEvaluation, LazyIndicatorCategory, build_indicator_graph, layout_outputs, parse_parametric
+from .parallel_ta import ParallelIndicatorEngine
+from .streaming_indicators import StreamingIndicators
+from .support_resistance import SupportResistanceTracker
 
 logger = logging.getLogger(__name__)
 
+# Keys reported by calculate_indicators, mapped to indicator graph outputs
+INDICATOR_LAYOUT = {
+    'trend': {
+        'sma_20': 'SMA_20', 'sma_50': 'SMA_50', 'sma_200': 'SMA_200',
+        'ema_12': 'EMA_12', 'ema_26': 'EMA_26', 'ema_50': 'EMA_50',
+        'adx': 'ADX', 'di_plus': 'DI_plus', 'di_minus': 'DI_minus'
+    },
+    'momentum': {
+        'rsi': 'RSI',
+        'macd': 'MACD', 'macd_signal': 'MACD_signal', 'macd_diff': 'MACD_hist',
+        'stoch_k': 'fastk', 'stoch_d': 'fastd',
+        'willr': 'WILLR'
+    },
+    'volatility': {
+        'bb_upper': 'BB_upper', 'bb_middle': 'BB_middle', 'bb_lower': 'BB_lower',
+        'atr': 'ATR'
+    },
+    'volume': {
+        'vwap': 'VWAP',
+        'obv': 'OBV'
+    },
+    'patterns': {
+        'doji': 'DOJI',
+        'hammer': 'HAMMER',
+        'engulfing': 'ENGULFING'
+    }
+}
+
+
+def all_indicators_layout(config: Dict[str, Dict]) -> Dict[str, Dict[str, str]]:
+    """Get the keys reported by calculate_all_indicators, mapped to indicator graph outputs."""
+    trend = {}
+    for period in config['SMA']['periods']:
+        trend[f'SMA_{period}'] = f'SMA_{period}'
+        trend[f'EMA_{period}'] = f'EMA_{period}'
+    for period in config['EMA']['periods']:
+        trend[f'EMA_{period}'] = f'EMA_{period}'
+    for key in ('tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'ADX', 'DI_plus', 'DI_minus'):
+        trend[key] = key
+    return {
+        'trend': trend,
+        'momentum': {key: key for key in (
+            'RSI', 'slowk', 'slowd', 'MACD', 'MACD_signal', 'MACD_hist', 'CCI', 'WILLR'
+        )},
+        'volatility': {key: key for key in (
+            'BB_upper', 'BB_middle', 'BB_lower', 'ATR', 'KC_upper', 'KC_lower'
+        )},
+        'volume': {key: key for key in ('OBV', 'Volume_SMA')},
+        'patterns': {key: key for key in config['PATTERNS']['names']}
+    }
+
+
+# Categories of parametric indicators requested outside the layout (e.g., 'EMA_8')
+PARAMETRIC_CATEGORIES = {
+    'SMA': 'trend',
+    'EMA': 'trend',
+    'RSI': 'momentum',
+    'ATR': 'volatility'
+}
+
+
 class TechnicalAnalysis:
     def __init__(self):
         """Initialize the technical analysis engine."""
         self.indicators = {}
+        self.all_indicators_layout = all_indicators_layout(settings.TA_INDICATORS)
+        self._categories = {
+            key: category for category, keys in self.all_indicators_layout.items() for key in keys
+        }
+        # Fixed periods reported by calculate_indicators
+        self.extra_periods = [12, 20, 26, 50, 200]
+        self.graph = build_indicator_graph(settings.TA_INDICATORS, extra_periods=self.extra_periods)
+        self._parallel: Optional[ParallelIndicatorEngine] = None
+        self._params_key = json.dumps(settings.TA_INDICATORS, sort_keys=True)
+        # Graph evaluations of recent candle windows, shared by every caller
+        self.cache = LRUCache(settings.INDICATOR_CACHE_SIZE)
+
+    def _cache_key(self, df: pd.DataFrame, symbol: str, interval: str) -> Tuple:
+        """Identify a candle window by its pair, last open time, length and last close."""
+        if not len(df):
+            return symbol, interval, None, 0, self._params_key, None
+        last_open = df['timestamp'].to_numpy()[-1] if 'timestamp' in df.columns else df.index[-1]
+        return symbol, interval, str(last_open), len(df), self._params_key, float(df['close'].to_numpy()[-1])
+
+    def _evaluation(self, df: pd.DataFrame, symbol: Optional[str], interval: Optional[str]) -> GraphEvaluation:
+        """Get the graph evaluation of a candle window, shared through the cache when the pair is known."""
+        if symbol is None or interval is None:
+            return self.graph.evaluation(df)
+        return self.cache.get_or_load(self._cache_key(df, symbol, interval), lambda: self.graph.evaluation(df))
+
+    def _compact(
+        self,
+        df: pd.DataFrame,
+        layout: Dict[str, Dict[str, str]],
+        symbol: Optional[str],
+        interval: Optional[str]
+    ) -> Dict[str, CompactIndicatorCategory]:
+        """Compute a layout into compact category arrays, shared through the cache when the pair is known."""
+        def load():
+            values = self.graph.evaluate(df, layout_outputs(layout))
+            return compact_indicators(values, layout, df.index)
+
+        if symbol is None or interval is None:
+            return load()
+        extra = tuple(sorted(key for keys in layout.values() for key in keys if key not in self._categories))
+        return self.cache.get_or_load(self._cache_key(df, symbol, interval) + ('compact', extra), load)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get the indicator cache's hit and miss counts and size."""
+        return self.cache.stats()
 
-    def calculate_indicators(self, df: pd.DataFrame) -> dict:
+    def calculate_indicators(self, df: pd.DataFrame, symbol: Optional[str] = None, interval: Optional[str] = None) -> dict:
         """
         Calculate technical indicators for the given DataFrame.
         
         Args:
             df (pd.DataFrame): DataFrame with OHLCV data
+            symbol (str, optional): Trading pair, to share results through the indicator cache
+            interval (str, optional): Candle interval, to share results through the indicator cache
             
         Returns:
             dict: Dictionary containing calculated indicators organized by category
@@ -39,114 +145,78 @@ class TechnicalAnalysis:
             if not all(col in df.columns for col in required_columns):
                 raise ValueError(f"DataFrame must contain columns: {required_columns}")
 
-            # Initialize indicators dictionary with categories
-            indicators = {
-                'trend': {},
-                'momentum': {},
-                'volatility': {},
-                'volume': {},
-                'patterns': {}
-            }
-            
-            # Trend Indicators
-            # SMA
-            sma_20 = SMAIndicator(close=df['close'], window=20)
-            sma_50 = SMAIndicator(close=df['close'], window=50)
-            sma_200 = SMAIndicator(close=df['close'], window=200)
-            indicators['trend']['sma_20'] = sma_20.sma_indicator()
-            indicators['trend']['sma_50'] = sma_50.sma_indicator()
-            indicators['trend']['sma_200'] = sma_200.sma_indicator()
-            
-            # EMA
-            ema_12 = EMAIndicator(close=df['close'], window=12)
-            ema_26 = EMAIndicator(close=df['close'], window=26)
-            ema_50 = EMAIndicator(close=df['close'], window=50)
-            indicators['trend']['ema_12'] = ema_12.ema_indicator()
-            indicators['trend']['ema_26'] = ema_26.ema_indicator()
-            indicators['trend']['ema_50'] = ema_50.ema_indicator()
-            
-            # ADX
-            adx = ADXIndicator(high=df['high'], low=df['low'], close=df['close'], window=14)
-            indicators['trend']['adx'] = adx.adx()
-            indicators['trend']['di_plus'] = adx.adx_pos()
-            indicators['trend']['di_minus'] = adx.adx_neg()
-            
-            # Momentum Indicators
-            # RSI
-            rsi = RSIIndicator(close=df['close'], window=14)
-            indicators['momentum']['rsi'] = rsi.rsi()
-            
-            # MACD
-            macd = MACD(close=df['close'])
-            indicators['momentum']['macd'] = macd.macd()
-            indicators['momentum']['macd_signal'] = macd.macd_signal()
-            indicators['momentum']['macd_diff'] = macd.macd_diff()
-            
-            # Stochastic
-            stoch = StochasticOscillator(high=df['high'], low=df['low'], close=df['close'])
-            indicators['momentum']['stoch_k'] = stoch.stoch()
-            indicators['momentum']['stoch_d'] = stoch.stoch_signal()
-            
-            # Williams %R
-            willr = WilliamsRIndicator(high=df['high'], low=df['low'], close=df['close'])
-            indicators['momentum']['willr'] = willr.williams_r()
-            
-            # Volatility Indicators
-            # Bollinger Bands
-            bb = BollingerBands(close=df['close'], window=20, window_dev=2)
-            indicators['volatility']['bb_upper'] = bb.bollinger_hband()
-            indicators['volatility']['bb_middle'] = bb.bollinger_mavg()
-            indicators['volatility']['bb_lower'] = bb.bollinger_lband()
-            
-            # ATR
-            atr = AverageTrueRange(high=df['high'], low=df['low'], close=df['close'], window=14)
-            indicators['volatility']['atr'] = atr.average_true_range()
-            
-            # Volume Indicators
-            # VWAP
-            vwap = VolumeWeightedAveragePrice(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                volume=df['volume']
-            )
-            indicators['volume']['vwap'] = vwap.volume_weighted_average_price()
-            
-            # OBV
-            obv = OnBalanceVolumeIndicator(close=df['close'], volume=df['volume'])
-            indicators['volume']['obv'] = obv.on_balance_volume()
-            
-            # Initialize patterns with zeros (placeholder for now)
-            indicators['patterns'] = {
-                'doji': pd.Series(0, index=df.index),
-                'hammer': pd.Series(0, index=df.index),
-                'engulfing': pd.Series(0, index=df.index)
+            evaluation = self._evaluation(df, symbol, interval)
+            return {
+                category: {key: evaluation.series(output) for key, output in keys.items()}
+                for category, keys in INDICATOR_LAYOUT.items()
             }
             
-            return indicators
-            
         except Exception as e:
             raise Exception(f"Error calculating indicators: {str(e)}")
 
-    def calculate_all_indicators(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    def indicator_category(self, name: str) -> str:
+        """Get the category ('trend', 'momentum', ...) an indicator is reported under."""
+        if name in self._categories:
+            return self._categories[name]
+        parsed = parse_parametric(name)
+        if parsed is None:
+            raise KeyError(f"Unknown indicator '{name}'")
+        return PARAMETRIC_CATEGORIES[parsed[0]]
+
+    def calculate_all_indicators(
+        self,
+        df: pd.DataFrame,
+        required: Optional[Union[BaseStrategy, Iterable[str]]] = None,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None,
+        compact: Optional[bool] = None
+    ) -> Dict[str, Union[LazyIndicatorCategory, CompactIndicatorCategory]]:
         """
         Calculate all technical indicators for the given DataFrame.
         
+        With `required`, only those indicators (and what they depend on) are
+        computed up front; any other series is computed on first access.
+        
+        With `symbol` and `interval`, the computation is shared through the
+        indicator cache with every other request for the same candle window
+        and parameters, including concurrent ones.
+        
+        With `compact`, every indicator of the layout and `required` is
+        computed at once and stored as one array per category (float32,
+        int8 for patterns), without the intermediate series, cutting the
+        memory of results kept per symbol and timeframe. Other names are
+        then unavailable.
+        
         Args:
             df: DataFrame with OHLCV data
+            required: Strategy or indicator names (e.g., 'EMA_8', 'RSI') to compute
+            symbol: Trading pair of the candles
+            interval: Candle interval
+            compact: Store results compactly (settings.TA_COMPACT_STORAGE if None)
             
         Returns:
-            Dictionary containing all calculated indicators
+            Dictionary mapping categories to indicator series, computed lazily unless compact
         """
         try:
-            # Calculate indicators
+            if isinstance(required, BaseStrategy):
+                required = required.get_required_indicators()
+            names = list(self._categories) if required is None else list(required)
+
+            layout = {category: dict(keys) for category, keys in self.all_indicators_layout.items()}
+            for name in names:
+                layout[self.indicator_category(name)].setdefault(name, name)
+
+            if settings.TA_COMPACT_STORAGE if compact is None else compact:
+                self.indicators = self._compact(df, layout, symbol, interval)
+                return self.indicators
+
+            evaluation = self._evaluation(df, symbol, interval)
             self.indicators = {
-                'trend': self._calculate_trend_indicators(df),
-                'momentum': self._calculate_momentum_indicators(df),
-                'volatility': self._calculate_volatility_indicators(df),
-                'volume': self._calculate_volume_indicators(df),
-                'patterns': self._detect_candlestick_patterns(df)
+                category: LazyIndicatorCategory(evaluation, keys)
+                for category, keys in layout.items()
             }
+            for name in names:
+                self.indicators[self.indicator_category(name)][name]
             
             return self.indicators
             
@@ -154,160 +224,176 @@ class TechnicalAnalysis:
             logger.error(f"Error calculating indicators: {str(e)}")
             raise
 
-    def _calculate_trend_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate trend indicators."""
-        indicators = {}
-        
-        # Moving Averages
-        for period in settings.TA_INDICATORS['SMA']['periods']:
-            indicators[f'SMA_{period}'] = talib.SMA(df['close'], timeperiod=period)
-            indicators[f'EMA_{period}'] = talib.EMA(df['close'], timeperiod=period)
-        
-        # Ichimoku Cloud
-        high_9 = df['high'].rolling(window=9).max()
-        low_9 = df['low'].rolling(window=9).min()
-        indicators['tenkan_sen'] = (high_9 + low_9) / 2
-        
-        high_26 = df['high'].rolling(window=26).max()
-        low_26 = df['low'].rolling(window=26).min()
-        indicators['kijun_sen'] = (high_26 + low_26) / 2
-        
-        indicators['senkou_span_a'] = ((indicators['tenkan_sen'] + indicators['kijun_sen']) / 2).shift(26)
-        
-        high_52 = df['high'].rolling(window=52).max()
-        low_52 = df['low'].rolling(window=52).min()
-        indicators['senkou_span_b'] = ((high_52 + low_52) / 2).shift(26)
+    def calculate_batch_indicators(self, frames: Dict[str, pd.DataFrame], bars: Optional[int] = None) -> BatchIndicators:
+        """
+        Calculate the core indicators of many symbols in one vectorized pass.
         
-        # ADX
-        indicators['ADX'] = talib.ADX(df['high'], df['low'], df['close'], timeperiod=14)
-        indicators['DI_plus'] = talib.PLUS_DI(df['high'], df['low'], df['close'], timeperiod=14)
-        indicators['DI_minus'] = talib.MINUS_DI(df['high'], df['low'], df['close'], timeperiod=14)
+        The frames are stacked into (symbols, bars) arrays aligned on their
+        last candle, and SMA/EMA, RSI, MACD, Bollinger Bands, ATR, ADX/DI and
+        OBV are computed across the symbol axis at once.
         
-        return indicators
+        Args:
+            frames: DataFrames with OHLCV data by symbol, ending on the same candle
+            bars: Number of trailing bars to use (the longest frame if None)
+            
+        Returns:
+            BatchIndicators with 2-D arrays and per-symbol views
+        """
+        try:
+            symbols, arrays = stack_frames(frames, bars)
+            return compute_batch_indicators(
+                symbols, arrays['high'], arrays['low'], arrays['close'], arrays['volume'], settings.TA_INDICATORS
+            )
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch indicators: {str(e)}")
+            raise
 
-    def _calculate_momentum_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate momentum indicators."""
-        indicators = {}
-        
-        # RSI
-        indicators['RSI'] = talib.RSI(df['close'], timeperiod=settings.TA_INDICATORS['RSI']['period'])
-        
-        # Stochastic
-        indicators['slowk'], indicators['slowd'] = talib.STOCH(
-            df['high'], df['low'], df['close'],
-            fastk_period=14,
-            slowk_period=3,
-            slowk_matype=0,
-            slowd_period=3,
-            slowd_matype=0
-        )
-        
-        # MACD
-        macd, macd_signal, macd_hist = talib.MACD(
-            df['close'],
-            fastperiod=settings.TA_INDICATORS['MACD']['fast'],
-            slowperiod=settings.TA_INDICATORS['MACD']['slow'],
-            signalperiod=settings.TA_INDICATORS['MACD']['signal']
-        )
-        indicators['MACD'] = macd
-        indicators['MACD_signal'] = macd_signal
-        indicators['MACD_hist'] = macd_hist
-        
-        # CCI
-        indicators['CCI'] = talib.CCI(df['high'], df['low'], df['close'], timeperiod=14)
+    def scan_patterns(
+        self,
+        frames: Dict[str, pd.DataFrame],
+        patterns: Optional[Iterable[str]] = None,
+        bars: Optional[int] = None
+    ) -> PatternScan:
+        """
+        Scan many symbols for candlestick patterns in one vectorized pass.
         
-        # Williams %R
-        indicators['WILLR'] = talib.WILLR(df['high'], df['low'], df['close'], timeperiod=14)
+        By default only the trailing bars the last bar's patterns depend on
+        are stacked, so e.g. scan.symbols_with('HAMMER') lists the pairs
+        that printed a hammer on their last candle.
         
-        return indicators
+        Args:
+            frames: DataFrames with OHLCV data by symbol, ending on the same candle
+            patterns: Pattern names (the configured patterns if None)
+            bars: Number of trailing bars to scan (just the last bar's window if None)
+            
+        Returns:
+            PatternScan with (symbols, bars) bitmasks
+        """
+        try:
+            names = list(patterns or settings.TA_INDICATORS['PATTERNS']['names'])
+            symbols, arrays = stack_frames(frames, bars or pattern_lookback(names) + 1, ('open', 'high', 'low', 'close'))
+            return scan_patterns(arrays['open'], arrays['high'], arrays['low'], arrays['close'], names, symbols)
+            
+        except Exception as e:
+            logger.error(f"Error scanning candlestick patterns: {str(e)}")
+            raise
 
-    def _calculate_volatility_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate volatility indicators."""
-        indicators = {}
-        
-        # Bollinger Bands
-        upper, middle, lower = talib.BBANDS(
-            df['close'],
-            timeperiod=settings.TA_INDICATORS['BB']['period'],
-            nbdevup=settings.TA_INDICATORS['BB']['std_dev'],
-            nbdevdn=settings.TA_INDICATORS['BB']['std_dev']
-        )
-        indicators['BB_upper'] = upper
-        indicators['BB_middle'] = middle
-        indicators['BB_lower'] = lower
-        
-        # ATR
-        indicators['ATR'] = talib.ATR(
-            df['high'],
-            df['low'],
-            df['close'],
-            timeperiod=settings.TA_INDICATORS['ATR']['period']
-        )
+    def calculate_indicators_parallel(
+        self,
+        frames: Dict[Tuple[str, str], pd.DataFrame],
+        required: Optional[Union[BaseStrategy, Iterable[str]]] = None
+    ) -> Dict[Tuple[str, str], Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Calculate indicators of many (symbol, interval) series across worker processes.
         
-        # Keltner Channels
-        atr = indicators['ATR']
-        indicators['KC_upper'] = middle + (2 * atr)
-        indicators['KC_lower'] = middle - (2 * atr)
+        OHLCV arrays are shared with the workers through shared memory and
+        results come back the same way, so throughput scales with cores.
+        The worker pool (TA_MAX_WORKERS processes) is started on first use.
         
-        return indicators
+        Args:
+            frames: DataFrames with OHLCV data by (symbol, interval)
+            required: Strategy or indicator names to compute (all if None)
+            
+        Returns:
+            Dictionary mapping each (symbol, interval) to indicator arrays by category
+        """
+        try:
+            if isinstance(required, BaseStrategy):
+                required = required.get_required_indicators()
+            names = list(self._categories) if required is None else list(required)
+            outputs = {name: self.all_indicators_layout.get(self.indicator_category(name), {}).get(name, name) for name in names}
 
-    def _calculate_volume_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate volume indicators."""
-        indicators = {}
-        
-        # On-Balance Volume (OBV)
-        indicators['OBV'] = talib.OBV(df['close'], df['volume'])
-        
-        # Volume SMA
-        indicators['Volume_SMA'] = talib.SMA(df['volume'], timeperiod=20)
-        
-        return indicators
+            if self._parallel is None:
+                self._parallel = ParallelIndicatorEngine(
+                    settings.TA_INDICATORS, self.extra_periods, max_workers=settings.TA_MAX_WORKERS
+                )
+            values = self._parallel.compute(frames, sorted(set(outputs.values())))
 
-    def _detect_candlestick_patterns(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Detect candlestick patterns."""
-        patterns = {}
-        
-        # Single candlestick patterns
-        patterns['DOJI'] = talib.CDLDOJI(df['open'], df['high'], df['low'], df['close'])
-        patterns['HAMMER'] = talib.CDLHAMMER(df['open'], df['high'], df['low'], df['close'])
-        patterns['HANGING_MAN'] = talib.CDLHANGINGMAN(df['open'], df['high'], df['low'], df['close'])
-        
-        # Multiple candlestick patterns
-        patterns['ENGULFING'] = talib.CDLENGULFING(df['open'], df['high'], df['low'], df['close'])
-        patterns['MORNING_STAR'] = talib.CDLMORNINGSTAR(df['open'], df['high'], df['low'], df['close'])
-        patterns['EVENING_STAR'] = talib.CDLEVENINGSTAR(df['open'], df['high'], df['low'], df['close'])
-        patterns['THREE_WHITE_SOLDIERS'] = talib.CDL3WHITESOLDIERS(df['open'], df['high'], df['low'], df['close'])
-        patterns['THREE_BLACK_CROWS'] = talib.CDL3BLACKCROWS(df['open'], df['high'], df['low'], df['close'])
+            results = {}
+            for key, arrays in values.items():
+                indicators = {category: {} for category in self.all_indicators_layout}
+                for name, output in outputs.items():
+                    indicators[self.indicator_category(name)][name] = arrays[output]
+                results[key] = indicators
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error calculating indicators in parallel: {str(e)}")
+            raise
+
+    def shutdown(self):
+        """Stop the worker processes of calculate_indicators_parallel, if started."""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+
+    def create_streaming_indicators(self, df: Optional[pd.DataFrame] = None) -> StreamingIndicators:
+        """
+        Create an incremental indicator engine, optionally warmed up on history.
         
-        return patterns
+        Args:
+            df: DataFrame with OHLCV data to seed the engine with
+            
+        Returns:
+            StreamingIndicators updating every indicator in O(1) per candle
+        """
+        engine = StreamingIndicators()
+        if df is not None:
+            engine.seed(df)
+        return engine
 
-    def get_support_resistance_levels(self, df: pd.DataFrame, window: int = 20) -> Dict[str, List[float]]:
+    def get_support_resistance_levels(
+        self,
+        df: pd.DataFrame,
+        window: int = 20,
+        tolerance: float = 0.5,
+        max_levels: Optional[int] = 10
+    ) -> Dict[str, List[float]]:
         """
-        Identify potential support and resistance levels using local minima and maxima.
+        Identify support and resistance levels from clustered swing lows and highs.
+        
+        Swing points are bars that are the extreme of the window centered on
+        them; swings within `tolerance` ATRs of each other form one level.
+        Levels are ranked by number of touches, then by most recent touch.
+        The DataFrame is not modified.
         
         Args:
             df: DataFrame with OHLCV data
-            window: Window size for identifying local extrema
+            window: Window size for identifying swing points
+            tolerance: Cluster tolerance in ATRs
+            max_levels: Number of levels per side (all if None)
             
         Returns:
-            Dictionary containing support and resistance levels
+            Dictionary containing support and resistance levels, strongest first
         """
         try:
-            # Find local minima and maxima
-            df['min'] = df['low'].rolling(window=window, center=True).min()
-            df['max'] = df['high'].rolling(window=window, center=True).max()
-            
-            # Identify support levels (local minima)
-            support_levels = df[df['low'] == df['min']]['low'].unique().tolist()
-            
-            # Identify resistance levels (local maxima)
-            resistance_levels = df[df['high'] == df['max']]['high'].unique().tolist()
-            
-            return {
-                'support': sorted(support_levels),
-                'resistance': sorted(resistance_levels)
-            }
+            tracker = SupportResistanceTracker(window, settings.TA_INDICATORS['ATR']['period'], tolerance)
+            tracker.seed(df)
+            return tracker.get_levels(max_levels)
             
         except Exception as e:
             logger.error(f"Error calculating support/resistance levels: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+    def create_support_resistance_tracker(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        window: int = 20,
+        tolerance: float = 0.5
+    ) -> SupportResistanceTracker:
+        """
+        Create an incremental support/resistance tracker, optionally built on history.
+        
+        Args:
+            df: DataFrame with OHLCV data to seed the tracker with
+            window: Window size for identifying swing points
+            tolerance: Cluster tolerance in ATRs
+            
+        Returns:
+            SupportResistanceTracker updating its levels per closed candle
+        """
+        tracker = SupportResistanceTracker(window, settings.TA_INDICATORS['ATR']['period'], tolerance)
+        if df is not None:
+            tracker.seed(df)
+        return tracker 
\ No newline at end of file
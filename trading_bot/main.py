@@ -5,6 +5,9 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from trading_bot.core.binance_connector import BinanceConnector
 from trading_bot.core.technical_analysis import TechnicalAnalysis
+from trading_bot.core.kline_stream import KlineStreamManager
+from trading_bot.core.order_book import OrderBookManager
+from trading_bot.config.settings import settings
 from trading_bot.ai.gemini_interface import GeminiInterface
 from trading_bot.ui.cli import TradingBotCLI
 
@@ -35,7 +38,12 @@ class TradingBot:
         
         self.scheduler = BackgroundScheduler()
         self.active_strategy = None
-        self.monitored_pairs = []
+        # Shared with the CLI, which edits it and reports changes
+        self.monitored_pairs = self.cli.monitored_pairs
+        self.cli.on_pairs_changed = self.on_pairs_changed
+        self.interval = "1h"
+        self.kline_stream = None
+        self.order_books = None
 
     def initialize(self):
         """Initialize the bot and start the scheduler."""
@@ -43,49 +51,94 @@ class TradingBot:
             # Start the scheduler
             self.scheduler.start()
             
-            # Schedule market data updates
-            self.scheduler.add_job(
-                self.update_market_data,
-                trigger=IntervalTrigger(minutes=1),
-                id='market_data_update',
-                replace_existing=True
-            )
+            if settings.MARKET_DATA_MODE == "stream":
+                # Analyse on candle close from the kline streams
+                self.start_market_stream()
+                if settings.ORDER_BOOK_ENABLED:
+                    self.start_order_books()
+            else:
+                # Schedule market data updates
+                self.scheduler.add_job(
+                    self.update_market_data,
+                    trigger=IntervalTrigger(minutes=1),
+                    id='market_data_update',
+                    replace_existing=True
+                )
             
             logger.info("Trading bot initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing trading bot: {str(e)}")
             raise
 
+    def start_market_stream(self):
+        """Subscribe to kline streams for the monitored pairs, replacing any previous subscription."""
+        if self.kline_stream is None:
+            if not self.monitored_pairs:
+                return
+            self.kline_stream = KlineStreamManager(self.binance, self.on_candle_close)
+        self.kline_stream.start(list(self.monitored_pairs), [self.interval])
+
+    def on_pairs_changed(self):
+        """Re-subscribe the streams after pairs were added or removed in the CLI."""
+        if settings.MARKET_DATA_MODE == "stream" and self.scheduler.running:
+            self.start_market_stream()
+            if settings.ORDER_BOOK_ENABLED:
+                self.start_order_books()
+
+    def start_order_books(self):
+        """Maintain local order books for the monitored pairs from depth diff streams."""
+        if self.order_books is None:
+            if not self.monitored_pairs:
+                return
+            self.order_books = OrderBookManager(self.binance.get_order_book)
+            self.cli.order_books = self.order_books
+        self.order_books.start(list(self.monitored_pairs))
+
+    def on_candle_close(self, symbol: str, interval: str, df: pd.DataFrame):
+        """Queue analysis of a closed candle on the scheduler's worker pool."""
+        self.scheduler.add_job(self.analyze_market_data, args=[symbol, interval, df])
+
     def update_market_data(self):
         """Update market data and generate trade suggestions."""
         try:
             # Default timeframe for automatic updates
-            interval = "1h"
+            interval = self.interval
             
-            for symbol in self.monitored_pairs:
-                # Get latest market data
-                klines = self.binance.get_klines(symbol, interval=interval)
+            # Get latest market data for all pairs concurrently
+            pairs = list(self.monitored_pairs)
+            frames = self.binance.get_klines_many(pairs, [interval])
+
+            for symbol in pairs:
+                klines = frames.get((symbol, interval))
                 if klines is None:
                     continue
 
-                # Calculate technical indicators
-                df = pd.DataFrame(klines)
-                indicators = self.technical_analysis.calculate_indicators(df)
-                
-                # Get AI suggestions if strategy is active
-                if self.active_strategy:
-                    suggestion = self.gemini.get_trade_suggestion(
-                        symbol=symbol,
-                        timeframe=interval,
-                        market_data=self.gemini.prepare_market_data(df, indicators),
-                        strategy=self.active_strategy
-                    )
-                    if suggestion:
-                        logger.info(f"Trade suggestion for {symbol}: {suggestion}")
-                        self.cli.display_trade_suggestion(suggestion)
+                self.analyze_market_data(symbol, interval, pd.DataFrame(klines))
         except Exception as e:
             logger.error(f"Error updating market data: {str(e)}")
 
+    def analyze_market_data(self, symbol: str, interval: str, df: pd.DataFrame):
+        """Calculate indicators and generate a trade suggestion for one symbol."""
+        try:
+            # Get AI suggestions if strategy is active
+            if self.active_strategy:
+                # The AI context gets the full indicator set
+                indicators = self.technical_analysis.calculate_indicators(df, symbol=symbol, interval=interval)
+                if self.order_books is not None:
+                    indicators['order_book'] = self.order_books.get_features(symbol, settings.ORDER_BOOK_FEATURE_DEPTH)
+                
+                suggestion = self.gemini.get_trade_suggestion(
+                    symbol=symbol,
+                    timeframe=interval,
+                    market_data=self.gemini.prepare_market_data(df, indicators),
+                    strategy=self.active_strategy
+                )
+                if suggestion:
+                    logger.info(f"Trade suggestion for {symbol}: {suggestion}")
+                    self.cli.display_trade_suggestion(suggestion)
+        except Exception as e:
+            logger.error(f"Error analyzing market data for {symbol}: {str(e)}")
+
     def run(self):
         """Run the trading bot."""
         try:
@@ -96,6 +149,10 @@ class TradingBot:
         except Exception as e:
             logger.error(f"Error running trading bot: {str(e)}")
         finally:
+            if self.kline_stream is not None:
+                self.kline_stream.stop()
+            if self.order_books is not None:
+                self.order_books.stop()
             self.scheduler.shutdown()
 
 if __name__ == "__main__":
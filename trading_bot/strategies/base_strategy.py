@@ -1,9 +1,23 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+def _same_value(latest: Any, vectorized: Any) -> bool:
+    """Compare an analyze() field with a vectorized element, treating NaN as equal to NaN."""
+    if latest == vectorized:
+        return True
+    return not isinstance(latest, str) and latest != latest and vectorized != vectorized
+
 class BaseStrategy(ABC):
+    # Whether analyze_vectorized() is implemented
+    supports_vectorized: bool = False
+
     def __init__(self, name: str):
         self.name = name
         self.parameters = {}
@@ -29,6 +43,59 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def set_parameters(self, **parameters):
+        """
+        Override strategy parameters, e.g. with values found by an optimizer.
+        
+        Args:
+            **parameters: New values of parameters defined in setup_parameters
+        """
+        unknown = sorted(set(parameters) - set(self.parameters))
+        if unknown:
+            raise ValueError(f"Unknown parameters for strategy '{self.name}': {unknown}")
+        self.parameters.update(parameters)
+
+    def analyze_vectorized(self, df: pd.DataFrame, indicators: Dict) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the strategy on every bar of the history in one pass.
+        
+        Element i of each array is the field analyze() reports when bar i is
+        the latest one, so a whole history costs one call instead of one per
+        bar. Fields describing only the present, such as the live order
+        book, are left out. Strategies implementing it set
+        `supports_vectorized = True`.
+        
+        Args:
+            df: DataFrame with OHLCV data
+            indicators: Dictionary containing technical indicators for the same bars
+            
+        Returns:
+            Dictionary mapping analyze() fields to arrays with one element per bar
+        """
+        raise NotImplementedError(f"Strategy '{self.name}' has no vectorized mode")
+
+    def check_vectorized(self, df: pd.DataFrame, indicators: Dict) -> bool:
+        """
+        Check that the last bar of analyze_vectorized() equals analyze().
+        
+        Args:
+            df: DataFrame with OHLCV data
+            indicators: Dictionary containing technical indicators
+            
+        Returns:
+            Boolean indicating if every field both modes report agrees
+        """
+        latest = self.analyze(df, indicators)
+        history = self.analyze_vectorized(df, indicators)
+        consistent = True
+        for key, value in latest.items():
+            if key in history and not _same_value(value, history[key][-1]):
+                logger.warning(
+                    f"{self.name}: vectorized {key} {history[key][-1]!r} differs from analyze() {value!r}"
+                )
+                consistent = False
+        return consistent
+
     def validate_indicators(self, required_indicators: List[str]) -> bool:
         """
         Validate that all required indicators are present.
@@ -45,7 +112,8 @@ class BaseStrategy(ABC):
         self,
         entry_price: float,
         atr: float,
-        risk_reward_ratio: float = settings.RISK_REWARD_RATIO
+        risk_reward_ratio: float = settings.RISK_REWARD_RATIO,
+        side: str = 'BUY'
     ) -> Dict[str, float]:
         """
         Calculate risk parameters based on ATR and risk-reward ratio.
@@ -54,16 +122,21 @@ class BaseStrategy(ABC):
             entry_price: Entry price
             atr: Average True Range value
             risk_reward_ratio: Desired risk-reward ratio
+            side: 'BUY' for a long position, 'SELL' for a short one
             
         Returns:
             Dictionary containing stop loss and take profit levels
         """
+        if side not in ('BUY', 'SELL'):
+            raise ValueError(f"Unknown side '{side}', expected 'BUY' or 'SELL'")
+        direction = 1 if side == 'BUY' else -1
+        
         # Use ATR for stop loss distance
         stop_loss_distance = atr * 1.5
         
-        # Calculate stop loss and take profit levels
-        stop_loss = entry_price - stop_loss_distance
-        take_profit = entry_price + (stop_loss_distance * risk_reward_ratio)
+        # Calculate stop loss and take profit levels (below and above the entry of a long)
+        stop_loss = entry_price - direction * stop_loss_distance
+        take_profit = entry_price + direction * (stop_loss_distance * risk_reward_ratio)
         
         return {
             'stop_loss': stop_loss,
@@ -0,0 +1,189 @@
+import logging
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from ..config.settings import settings
+from ..core.order_book import OrderBookManager
+from ..core.technical_analysis import TechnicalAnalysis
+from .base_strategy import BaseStrategy
+from .strategy_library import get_strategy, list_strategies
+
+logger = logging.getLogger(__name__)
+
+
+def _votes(signals: np.ndarray) -> np.ndarray:
+    """Map 'BUY'/'SELL'/'NONE' signals to +1/-1/0 votes."""
+    return (signals == 'BUY').astype(np.float64) - (signals == 'SELL')
+
+
+class StrategyEnsemble:
+    """
+    Runs several strategies against one shared indicator snapshot.
+
+    The union of the strategies' required indicators is calculated once per
+    candle window, through the TechnicalAnalysis cache when the symbol and
+    timeframe are given, and every strategy then reads the same snapshot,
+    so an indicator several strategies need is computed once. Their signals
+    can be combined into a weighted vote, in which each strategy votes +1
+    for BUY, -1 for SELL and 0 otherwise.
+
+    Args:
+        strategies: Strategy names or instances (every registered strategy if None)
+        weights: Vote weight by strategy name (settings.STRATEGY_WEIGHTS if None, 1 for any not listed)
+        technical_analysis: Indicator calculator (a new TechnicalAnalysis if None)
+        order_books: Local order books whose features are added to snapshots (none if None)
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[Sequence[Union[str, BaseStrategy]]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        technical_analysis: Optional[TechnicalAnalysis] = None,
+        order_books: Optional[OrderBookManager] = None
+    ):
+        strategies = list_strategies() if strategies is None else strategies
+        self.strategies: List[BaseStrategy] = [
+            get_strategy(strategy) if isinstance(strategy, str) else strategy for strategy in strategies
+        ]
+        weights = settings.STRATEGY_WEIGHTS if weights is None else weights
+        self.weights = {strategy.name: weights.get(strategy.name, 1.0) for strategy in self.strategies}
+        self.technical_analysis = technical_analysis or TechnicalAnalysis()
+        self.order_books = order_books
+
+    def get_required_indicators(self) -> List[str]:
+        """
+        Get the union of the strategies' required indicators.
+
+        Returns:
+            List of indicator names, each once, in first-required order
+        """
+        return list(dict.fromkeys(
+            name for strategy in self.strategies for name in strategy.get_required_indicators()
+        ))
+
+    def snapshot(self, df: pd.DataFrame, symbol: Optional[str] = None, interval: Optional[str] = None) -> Dict:
+        """
+        Calculate the indicators of every strategy in one pass.
+
+        Args:
+            df: DataFrame with OHLCV data
+            symbol: Trading pair of the candles
+            interval: Candle interval
+
+        Returns:
+            Dictionary containing technical indicators, as calculate_all_indicators,
+            and the symbol's order book features under 'order_book' if it has a local book
+        """
+        indicators = self.technical_analysis.calculate_all_indicators(
+            df, required=self.get_required_indicators(), symbol=symbol, interval=interval
+        )
+        if self.order_books is not None and symbol is not None:
+            indicators['order_book'] = self.order_books.get_features(symbol, settings.ORDER_BOOK_FEATURE_DEPTH)
+        return indicators
+
+    def evaluate(
+        self,
+        df: pd.DataFrame,
+        indicators: Optional[Dict] = None,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """
+        Analyze the latest candle with every strategy.
+
+        Args:
+            df: DataFrame with OHLCV data
+            indicators: Snapshot to evaluate against (calculated if None)
+            symbol: Trading pair of the candles
+            interval: Candle interval
+
+        Returns:
+            Dictionary of analyze() results by strategy name
+        """
+        try:
+            if indicators is None:
+                indicators = self.snapshot(df, symbol, interval)
+            return {strategy.name: strategy.analyze(df, indicators) for strategy in self.strategies}
+
+        except Exception as e:
+            logger.error(f"Error evaluating strategy ensemble: {str(e)}")
+            raise
+
+    def evaluate_vectorized(
+        self,
+        df: pd.DataFrame,
+        indicators: Optional[Dict] = None,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get every strategy's signal at every bar, from analyze_vectorized().
+
+        Args:
+            df: DataFrame with OHLCV data
+            indicators: Snapshot to evaluate against (calculated if None)
+            symbol: Trading pair of the candles
+            interval: Candle interval
+
+        Returns:
+            DataFrame indexed like df with one signal column per strategy
+        """
+        try:
+            if indicators is None:
+                indicators = self.snapshot(df, symbol, interval)
+            return pd.DataFrame(
+                {strategy.name: strategy.analyze_vectorized(df, indicators)['signal'] for strategy in self.strategies},
+                index=df.index
+            )
+
+        except Exception as e:
+            logger.error(f"Error evaluating strategy ensemble history: {str(e)}")
+            raise
+
+    def consensus(self, signals: Dict[str, Dict], threshold: float = settings.CONSENSUS_THRESHOLD) -> Dict:
+        """
+        Combine the signals of evaluate() into a weighted vote.
+
+        Args:
+            signals: Result of evaluate()
+            threshold: Weighted mean vote needed for a BUY (or its negative for a SELL)
+
+        Returns:
+            Dictionary containing the consensus signal, its score (-1 to 1)
+            and the strategies that signalled it
+        """
+        weights = sum(self.weights[name] for name in signals)
+        score = sum(
+            self.weights[name] * (1 if result['signal'] == 'BUY' else -1 if result['signal'] == 'SELL' else 0)
+            for name, result in signals.items()
+        ) / weights
+        if score >= threshold:
+            signal = 'BUY'
+        elif score <= -threshold:
+            signal = 'SELL'
+        else:
+            signal = 'NONE'
+
+        return {
+            'signal': signal,
+            'score': score,
+            'strategies': [name for name, result in signals.items() if result['signal'] == signal]
+        }
+
+    def consensus_history(self, history: pd.DataFrame, threshold: float = settings.CONSENSUS_THRESHOLD) -> pd.DataFrame:
+        """
+        Combine the signals of evaluate_vectorized() into a weighted vote per bar.
+
+        Args:
+            history: Result of evaluate_vectorized()
+            threshold: Weighted mean vote needed for a BUY (or its negative for a SELL)
+
+        Returns:
+            DataFrame indexed like history with the consensus 'signal' and 'score' of every bar
+        """
+        weights = np.array([self.weights[name] for name in history.columns])
+        score = _votes(history.to_numpy()) @ weights / weights.sum()
+        return pd.DataFrame({
+            'signal': np.select([score >= threshold, score <= -threshold], ['BUY', 'SELL'], 'NONE'),
+            'score': score
+        }, index=history.index)
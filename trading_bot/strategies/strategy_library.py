@@ -1,8 +1,35 @@
-from typing import Dict, List
+from typing import Dict, List, Type
+import numpy as np
 import pandas as pd
 from .base_strategy import BaseStrategy
 
+# Strategy classes by name, see register_strategy
+STRATEGIES: Dict[str, Type[BaseStrategy]] = {}
+
+# Shared instances handed out by get_strategy
+_instances: Dict[str, BaseStrategy] = {}
+
+
+def register_strategy(strategy_class: Type[BaseStrategy]) -> Type[BaseStrategy]:
+    """
+    Register a strategy class under its name, for get_strategy and StrategyEnsemble.
+    
+    Args:
+        strategy_class: BaseStrategy subclass constructible without arguments
+        
+    Returns:
+        The class, so that this can be used as a decorator
+    """
+    name = strategy_class().name
+    STRATEGIES[name] = strategy_class
+    _instances.pop(name, None)
+    return strategy_class
+
+
+@register_strategy
 class DynamicTrendRider(BaseStrategy):
+    supports_vectorized = True
+
     def __init__(self):
         super().__init__("Dynamic Trend Rider")
         
@@ -17,15 +44,15 @@ class DynamicTrendRider(BaseStrategy):
         
     def get_required_indicators(self) -> List[str]:
         return [
-            'EMA_12', 'EMA_26',
+            f"EMA_{self.parameters['ema_fast']}", f"EMA_{self.parameters['ema_slow']}",
             'ADX', 'DI_plus', 'DI_minus',
             'RSI'
         ]
         
     def analyze(self, df: pd.DataFrame, indicators: Dict) -> Dict:
         # Get indicator values
-        ema_fast = indicators['trend']['EMA_12']
-        ema_slow = indicators['trend']['EMA_26']
+        ema_fast = indicators['trend'][f"EMA_{self.parameters['ema_fast']}"]
+        ema_slow = indicators['trend'][f"EMA_{self.parameters['ema_slow']}"]
         adx = indicators['trend']['ADX']
         di_plus = indicators['trend']['DI_plus']
         di_minus = indicators['trend']['DI_minus']
@@ -57,8 +84,36 @@ class DynamicTrendRider(BaseStrategy):
             'trend_direction': 'UP' if trend_direction else 'DOWN',
             'rsi': current_rsi
         }
+        
+    def analyze_vectorized(self, df: pd.DataFrame, indicators: Dict) -> Dict[str, np.ndarray]:
+        adx = np.asarray(indicators['trend']['ADX'])
+        di_plus = np.asarray(indicators['trend']['DI_plus'])
+        di_minus = np.asarray(indicators['trend']['DI_minus'])
+        rsi = np.asarray(indicators['momentum']['RSI'])
+        
+        trend_strength = adx > self.parameters['adx_threshold']
+        trend_direction = di_plus > di_minus
+        
+        signal = np.select(
+            [
+                trend_strength & trend_direction & (rsi < self.parameters['rsi_oversold']),
+                trend_strength & ~trend_direction & (rsi > self.parameters['rsi_overbought'])
+            ],
+            ['BUY', 'SELL'],
+            'NONE'
+        )
+        
+        return {
+            'signal': signal,
+            'trend_strength': trend_strength,
+            'trend_direction': np.where(trend_direction, 'UP', 'DOWN'),
+            'rsi': rsi
+        }
 
+@register_strategy
 class VolatilityBreakoutPro(BaseStrategy):
+    supports_vectorized = True
+
     def __init__(self):
         super().__init__("Volatility Breakout Pro")
         
@@ -104,14 +159,48 @@ class VolatilityBreakoutPro(BaseStrategy):
             elif current_price < current_bb_lower:
                 signal = "SELL"
         
-        return {
+        result = {
             'signal': signal,
             'volatility': volatility,
             'price_range': price_range,
             'volume_ratio': current_volume / current_volume_sma
         }
+        
+        # Breakouts into a thin or one-sided book are more likely to follow through
+        order_book = indicators.get('order_book')
+        if order_book:
+            result['spread_pct'] = order_book['spread_pct']
+            result['depth_imbalance'] = order_book['imbalance']
+        
+        return result
+        
+    def analyze_vectorized(self, df: pd.DataFrame, indicators: Dict) -> Dict[str, np.ndarray]:
+        bb_upper = np.asarray(indicators['volatility']['BB_upper'])
+        bb_lower = np.asarray(indicators['volatility']['BB_lower'])
+        atr = np.asarray(indicators['volatility']['ATR'])
+        volume_sma = np.asarray(indicators['volume']['Volume_SMA'])
+        price = df['close'].to_numpy()
+        volume = df['volume'].to_numpy()
+        
+        volume_surge = volume > volume_sma * self.parameters['volume_threshold']
+        signal = np.select(
+            [volume_surge & (price > bb_upper), volume_surge & (price < bb_lower)],
+            ['BUY', 'SELL'],
+            'NONE'
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'signal': signal,
+                'volatility': atr / price,
+                'price_range': bb_upper - bb_lower,
+                'volume_ratio': volume / volume_sma
+            }
 
+@register_strategy
 class MeanReversionAI(BaseStrategy):
+    supports_vectorized = True
+
     def __init__(self):
         super().__init__("Mean Reversion AI")
         
@@ -160,8 +249,35 @@ class MeanReversionAI(BaseStrategy):
             'price_to_mean': price_to_mean,
             'bb_position': (current_price - current_bb_lower) / (current_bb_upper - current_bb_lower)
         }
+        
+    def analyze_vectorized(self, df: pd.DataFrame, indicators: Dict) -> Dict[str, np.ndarray]:
+        rsi = np.asarray(indicators['momentum']['RSI'])
+        bb_upper = np.asarray(indicators['volatility']['BB_upper'])
+        bb_middle = np.asarray(indicators['volatility']['BB_middle'])
+        bb_lower = np.asarray(indicators['volatility']['BB_lower'])
+        price = df['close'].to_numpy()
+        
+        signal = np.select(
+            [
+                (rsi < self.parameters['rsi_oversold']) & (price < bb_lower),
+                (rsi > self.parameters['rsi_overbought']) & (price > bb_upper)
+            ],
+            ['BUY', 'SELL'],
+            'NONE'
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'signal': signal,
+                'rsi': rsi,
+                'price_to_mean': (price - bb_middle) / bb_middle,
+                'bb_position': (price - bb_lower) / (bb_upper - bb_lower)
+            }
 
+@register_strategy
 class ScalpersEdgeAI(BaseStrategy):
+    supports_vectorized = True
+
     def __init__(self):
         super().__init__("Scalper's Edge AI")
         
@@ -177,15 +293,15 @@ class ScalpersEdgeAI(BaseStrategy):
         
     def get_required_indicators(self) -> List[str]:
         return [
-            'EMA_8', 'EMA_21',
+            f"EMA_{self.parameters['ema_fast']}", f"EMA_{self.parameters['ema_slow']}",
             'RSI',
             'Volume_SMA'
         ]
         
     def analyze(self, df: pd.DataFrame, indicators: Dict) -> Dict:
         # Get indicator values
-        ema_fast = indicators['trend']['EMA_8']
-        ema_slow = indicators['trend']['EMA_21']
+        ema_fast = indicators['trend'][f"EMA_{self.parameters['ema_fast']}"]
+        ema_slow = indicators['trend'][f"EMA_{self.parameters['ema_slow']}"]
         rsi = indicators['momentum']['RSI']
         volume_sma = indicators['volume']['Volume_SMA']
         
@@ -209,32 +325,75 @@ class ScalpersEdgeAI(BaseStrategy):
             elif not ema_cross and current_rsi > self.parameters['rsi_overbought']:
                 signal = "SELL"
         
-        return {
+        result = {
             'signal': signal,
             'ema_cross': ema_cross,
             'volume_ratio': current_volume / current_volume_sma,
             'rsi': current_rsi
         }
+        
+        # Scalps only pay off when the spread is tight relative to the move
+        order_book = indicators.get('order_book')
+        if order_book:
+            result['spread_pct'] = order_book['spread_pct']
+            result['depth_imbalance'] = order_book['imbalance']
+        
+        return result
+        
+    def analyze_vectorized(self, df: pd.DataFrame, indicators: Dict) -> Dict[str, np.ndarray]:
+        ema_fast = np.asarray(indicators['trend'][f"EMA_{self.parameters['ema_fast']}"])
+        ema_slow = np.asarray(indicators['trend'][f"EMA_{self.parameters['ema_slow']}"])
+        rsi = np.asarray(indicators['momentum']['RSI'])
+        volume_sma = np.asarray(indicators['volume']['Volume_SMA'])
+        volume = df['volume'].to_numpy()
+        
+        ema_cross = ema_fast > ema_slow
+        volume_surge = volume > volume_sma * self.parameters['volume_threshold']
+        signal = np.select(
+            [
+                volume_surge & ema_cross & (rsi < self.parameters['rsi_oversold']),
+                volume_surge & ~ema_cross & (rsi > self.parameters['rsi_overbought'])
+            ],
+            ['BUY', 'SELL'],
+            'NONE'
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'signal': signal,
+                'ema_cross': ema_cross,
+                'volume_ratio': volume / volume_sma,
+                'rsi': rsi
+            }
 
 # Strategy factory
 def get_strategy(strategy_name: str) -> BaseStrategy:
     """
     Get strategy instance by name.
     
+    Each strategy is created once and the instance is shared by every
+    caller; create the class from STRATEGIES for one whose parameters
+    can be changed independently.
+    
     Args:
         strategy_name: Name of the strategy
         
     Returns:
         Strategy instance
     """
-    strategies = {
-        "Dynamic Trend Rider": DynamicTrendRider,
-        "Volatility Breakout Pro": VolatilityBreakoutPro,
-        "Mean Reversion AI": MeanReversionAI,
-        "Scalper's Edge AI": ScalpersEdgeAI
-    }
-    
-    if strategy_name not in strategies:
+    if strategy_name not in STRATEGIES:
         raise ValueError(f"Strategy '{strategy_name}' not found")
-        
-    return strategies[strategy_name]() 
\ No newline at end of file
+    
+    strategy = _instances.get(strategy_name)
+    if strategy is None:
+        strategy = _instances[strategy_name] = STRATEGIES[strategy_name]()
+    return strategy
+
+def list_strategies() -> List[str]:
+    """
+    Get the names of all registered strategies.
+    
+    Returns:
+        List of strategy names, in registration order
+    """
+    return list(STRATEGIES) 
\ No newline at end of file
@@ -8,6 +8,8 @@ from typing import Optional, List
 import logging
 import pandas as pd
 from ..news.gemini_news_analysis import GeminiNewsAndAnalysisModule
+from ..strategies.ensemble import StrategyEnsemble
+from ..strategies.strategy_library import list_strategies
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -21,6 +23,10 @@ class TradingBotCLI:
         self.binance = None
         self.technical_analysis = None
         self.gemini = None
+        # Local order books of the monitored pairs, when the bot maintains them
+        self.order_books = None
+        # Called with no arguments after a pair is added or removed
+        self.on_pairs_changed = None
         from ..news.news_module import NewsModule
         self.news_module = NewsModule()
         self.gemini_news_module = GeminiNewsAndAnalysisModule()
@@ -75,12 +81,7 @@ class TradingBotCLI:
         self.console.print("\n[bold]Manage Trading Strategies[/bold]")
         
         # List available strategies
-        strategies = [
-            "Dynamic Trend Rider",
-            "Volatility Breakout Pro",
-            "Mean Reversion AI",
-            "Scalper's Edge AI"
-        ]
+        strategies = list_strategies()
         
         table = Table(title="Available Strategies")
         table.add_column("ID", style="cyan")
@@ -141,6 +142,7 @@ class TradingBotCLI:
         if pair not in self.monitored_pairs:
             self.monitored_pairs.append(pair)
             self.console.print(f"[green]Added {pair} to monitored pairs[/green]")
+            self._pairs_changed()
         else:
             self.console.print(f"[yellow]{pair} is already being monitored[/yellow]")
 
@@ -157,6 +159,17 @@ class TradingBotCLI:
         
         self.monitored_pairs.remove(pair)
         self.console.print(f"[green]Removed {pair} from monitored pairs[/green]")
+        self._pairs_changed()
+
+    def _pairs_changed(self):
+        """Notify the bot that the monitored pairs changed."""
+        if self.on_pairs_changed is None:
+            return
+        try:
+            self.on_pairs_changed()
+        except Exception as e:
+            logger.error(f"Error updating subscriptions: {str(e)}")
+            self.console.print(f"[red]Error updating subscriptions: {str(e)}[/red]")
 
     def display_trade_suggestion(self, suggestion: dict):
         """Display trade suggestion in a formatted table."""
@@ -169,6 +182,19 @@ class TradingBotCLI:
         
         self.console.print(table)
 
+    def display_strategy_signals(self, pair: str, signals: dict, consensus: dict):
+        """Display the latest signal of every strategy and their consensus."""
+        table = Table(title=f"Strategy Signals for {pair}")
+        table.add_column("Strategy", style="cyan")
+        table.add_column("Signal", style="green")
+        
+        for name, result in signals.items():
+            marker = " (active)" if name == self.active_strategy else ""
+            table.add_row(f"{name}{marker}", result['signal'])
+        table.add_row("Consensus", f"{consensus['signal']} (score {consensus['score']:+.2f})")
+        
+        self.console.print(table)
+
     def view_trade_suggestions(self):
         """View trade suggestions for monitored pairs."""
         if not self.active_strategy:
@@ -196,17 +222,30 @@ class TradingBotCLI:
             choices=[str(i) for i in range(1, len(timeframes) + 1)]
         )
         selected_timeframe = timeframes[int(choice) - 1]
+
+        # Get latest market data for all pairs concurrently
+        try:
+            frames = self.binance.get_klines_many(self.monitored_pairs, [selected_timeframe])
+        except Exception as e:
+            self.console.print(f"[red]Error fetching market data: {str(e)}[/red]")
+            return
         
+        # Every strategy reads one indicator snapshot per pair
+        ensemble = StrategyEnsemble(technical_analysis=self.technical_analysis, order_books=self.order_books)
         for pair in self.monitored_pairs:
             try:
-                # Get latest market data
-                klines = self.binance.get_klines(pair, interval=selected_timeframe)
+                klines = frames.get((pair, selected_timeframe))
                 if klines is None:
+                    self.console.print(f"[red]No market data for {pair}[/red]")
                     continue
 
-                # Calculate technical indicators
+                # Calculate the technical indicators of all strategies once
                 df = pd.DataFrame(klines)
-                indicators = self.technical_analysis.calculate_indicators(df)
+                snapshot = ensemble.snapshot(df, symbol=pair, interval=selected_timeframe)
+                signals = ensemble.evaluate(df, snapshot)
+                self.display_strategy_signals(pair, signals, ensemble.consensus(signals))
+                # The AI context gets the full indicator set, from the same cached evaluation
+                indicators = self.technical_analysis.calculate_indicators(df, symbol=pair, interval=selected_timeframe)
                 
                 # Get AI suggestions
                 suggestion = self.gemini.get_trade_suggestion(